@@ -20,33 +20,114 @@ native tongue, every phrase dances in its cultural rhythm."
 🎼 Usage Sonata:
 python scripts/analyze-audio-languages.py --input-dir ./backups/storage/audio --output-dir ./analysis
 
+🔮 Swift language glance (no full transcription, en/es/hi only):
+python scripts/analyze-audio-languages.py --input-dir ./audio_samples --output-dir ./analysis --detect-only --detect-windows 3
+
+🗺️ One verdict per (job, language), escalating to the full file only when unsure:
+python scripts/analyze-audio-languages.py --input-dir ./audio_samples --output-dir ./analysis --detect-only --plan-groups
+
+🧠 Pick the engine (auto = fastest installed; int8 CTranslate2 is the quick one on Linux CPUs):
+python scripts/analyze-audio-languages.py --input-dir ./audio_samples --output-dir ./analysis --backend faster-whisper-int8
+
+🪜 Model cascade - tiny settles the clear cases, base/small only hear the hesitant ones:
+python scripts/analyze-audio-languages.py --input-dir ./audio_samples --output-dir ./analysis --detect-only --cascade tiny,base,small --escalate-below 0.85
+
+🌐 Straight from storage - only the first 60 seconds of each file, fetched with HTTP Range:
+python scripts/analyze-audio-languages.py --audio-jobs ./backups/20250908_194218_api/audio_jobs.json --output-dir ./analysis --detect-only
+
+🗄️ Unchanged files are answered from analysis_cache.sqlite; use --rebuild-cache or --no-cache to bypass it.
+🧮 Detect-only log-mel windows are kept as memory-mapped .npy shards in ~/.cache/whisper-features (--feature-cache,
+   WHISPER_FEATURE_CACHE), so another model size or backend skips decode and mel; --no-feature-cache disables it.
+
+📈 Quiet large runs with per-stage metrics (pipeline_metrics.json + an OpenMetrics textfile) and profiles:
+python scripts/analyze-audio-languages.py --input-dir ./audio_samples --output-dir ./analysis --detect-only --quiet --metrics-textfile /var/lib/node_exporter/textfile/audio_analysis.prom --profile
+
+🩺 MP3 headers are probed first: empty or truncated files get status "empty"/"truncated" without a decode,
+   and every row gains mp3_duration, bitrate and sample_rate (filling in duration where the engine gives none).
+
+🗣️ Windows start at the first speech (up to --vad-lead-seconds in); voiceless files get status "no_speech"
+   without a model call. --no-vad restores the plain fixed windows.
+
+🧩 One long narration, transcribed as pause-cut passages by every worker at once (per-passage timeline in
+   language_timeline.csv; a file whose passages disagree is a mismatch even if the claimed tongue dominates):
+python scripts/analyze-audio-languages.py --input-dir ./regenerated --output-dir ./analysis --segment-seconds 60 --workers 4
+
+🫆 Catch one recording filed under several languages - fingerprints only, no Whisper. Only the same render
+   (a re-encode, a chunk of the full file) matches; separate TTS renders of one text show up in
+   transcript_clusters.json after a transcribe run instead:
+python scripts/analyze-audio-languages.py --input-dir ./audio_samples --output-dir ./analysis --fingerprint-only
+
+🧭 Spread one run over several machines - each hears a stable slice of the (job, language) families - then merge
+   into exactly the chronicle a single run would write:
+python scripts/analyze-audio-languages.py --input-dir ./audio_samples --output-dir ./analysis_shard1 --detect-only --shard 1/3
+python scripts/analyze-audio-languages.py --merge-shards ./analysis_shard1 ./analysis_shard2 ./analysis_shard3 --output-dir ./analysis
+
+🗃️ Every run lands in <output-dir>/analysis.sqlite (indexed verdicts, transcripts in their own table), where the
+   fix planner and applier query it; detailed_analysis / language_mismatches CSV or JSON only on request:
+python scripts/analyze-audio-languages.py --input-dir ./audio_samples --output-dir ./analysis --export-views csv json
+python scripts/audio_analysis/analysis_store.py ./analysis/analysis.sqlite --view mismatches --output language_mismatches.csv
+
+🛎️ Keep a warm model resident, then hand it one or two fresh files in well under a second:
+python scripts/analyze-audio-languages.py --serve --output-dir ./analysis --detect-only
+python scripts/analyze-audio-languages.py --input-dir ./fresh_audio --output-dir ./analysis --detect-only --via-daemon
+
+🎻 Ensemble performance across many cores (one resident model per worker):
+python scripts/analyze-audio-languages.py --input-dir ./audio_samples --output-dir ./analysis --detect-only --workers 8
+
+🧊 openai-whisper weights are converted once into ~/.cache/whisper-mmap (WHISPER_WEIGHT_CACHE; "off" disables)
+   and memory-mapped, so every worker shares one copy.
+
 🎭 Requirements from the Digital Atelier:
-   🧙‍♂️ openai-whisper (the linguistic alchemist)
-   🔥 torch (the computational forge)
+   🧙‍♂️ one Whisper engine (the linguistic alchemist): faster-whisper, optimum[onnxruntime],
+      openai-whisper + torch (the computational forge), or mlx-whisper on Apple Silicon
    📚 pandas (the data curator)
    🌐 requests (the network messenger)
+   🎬 ffmpeg + ffprobe on PATH (the streaming decoder)
 """
 
 # 🎭 The Grand Assembly of Digital Companions
 import argparse  # 🎨 The command-line stage director
+import asyncio  # 🎬 The stage manager of overlapping acts
 import json  # 🌟 The structured narrative weaver
 import logging  # 📜 The chronicle keeper of our digital journey
+import multiprocessing  # 🧬 The performer-birthing ritual
 import os  # 🏠 The realm navigator
 import sys  # 🎭 The system performance coordinator
+import tempfile  # 📦 The cloakroom for voices delivered as raw bytes
+import threading  # 🔒 One request on stage at a time
+import time  # ⏰ The daemon's pocket watch
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor  # 🎻 The ensembles of parallel performers
 from datetime import datetime  # ⏰ The temporal crystal ball
 from pathlib import Path  # 🛤️ The enchanted forest pathfinder
 from typing import Dict, List, Optional, Tuple  # 📚 The type spellbook
 
 # 🌟 Summoning the External Magical Allies
+import numpy as np  # 🔢 The waveform sculptor
 import pandas as pd  # 📊 The data constellation mapper
 import requests  # 🌐 The network bridge builder
 
-# 🌟 The Optional Mystical Companion - MLX Whisper
-try:
-    import mlx_whisper  # 🎭 The Apple Silicon virtuoso performer
-    MLX_WHISPER_AVAILABLE = True  # ✨ Enchantment ready!
-except ImportError:
-    MLX_WHISPER_AVAILABLE = False  # 🌙 Companion resting in other realms
+# 🧰 The Workshop Companions - vault, decoder, planner, engines and friends
+from audio_analysis.analysis_store import STORE_FILENAME, VIEW_FILENAMES, AnalysisStore
+from audio_analysis.backends import BACKENDS, available_backends, create_backend, mel_bins
+from audio_analysis.daemon import DEFAULT_SOCKET_PATH, ConfigurationMismatch, DaemonClient, make_server
+from audio_analysis.decode import (HOP_LENGTH, SAMPLE_RATE, WINDOW_SAMPLES, WINDOW_SECONDS, decode_all,
+                                   decode_windows, log_mel_windows, probe_duration, window_start_times)
+from audio_analysis.feature_cache import DEFAULT_FEATURE_CACHE_MAX_MB, FeatureCache, feature_cache_dir
+from audio_analysis.fingerprint import (DEFAULT_MATCH_SCORE, FINGERPRINT_INDEX_FILENAME, FINGERPRINT_SECONDS,
+                                       FingerprintIndex, fingerprint_key, spectral_peak_hashes)
+from audio_analysis.instrumentation import OPENMETRICS_FILENAME, SUMMARY_FILENAME, SampledLogFilter, StageClock
+from audio_analysis.mp3 import probe_mp3_file
+from audio_analysis.planning import (SHARD_RESULTS_FILENAME, parse_sample_name, parse_shard, plan_analysis_groups,
+                                     shard_of)
+from audio_analysis.remote import (DEFAULT_PREFIX_SECONDS, RemoteAudio, sources_from_audio_jobs,
+                                   sources_from_url_list, storage_headers)
+from audio_analysis.result_cache import (DEFAULT_CACHE_FILENAME, DEFAULT_CACHE_MAX_MB,
+                                         AnalysisResultCache, hash_audio_bytes)
+from audio_analysis.text_language import default_identifier, split_sentences
+from audio_analysis.transcript_lsh import (DEFAULT_SIMILARITY, TRANSCRIPT_INDEX_FILENAME, TranscriptIndex,
+                                           cluster_label)
+from audio_analysis.vad import (FRAME_SECONDS, MIN_SPEECH_FRACTION, frame_speech_mask, plan_segments,
+                                speech_fraction, speech_windows)
 
 # 🎭 Configuring the Theatrical Chronicle System
 logging.basicConfig(
@@ -58,6 +139,17 @@ logging.basicConfig(
     ]
 )
 logger = logging.getLogger(__name__)  # 🌟 The mystical narrator
+chorus_logger = logger.getChild('chorus')  # 🎵 The per-file chatter - sampled or silenced on large runs
+
+
+def tune_chorus(quiet: bool = False, every: int = 1):
+    """🎵 Silence the per-file chatter, or let only every Nth line of each kind through."""
+    chorus_logger.setLevel(logging.WARNING if quiet else logging.NOTSET)
+    if every > 1 and not chorus_logger.filters:
+        chorus_logger.addFilter(SampledLogFilter(every))
+
+# 🌐 The Candidate Tongues of Our Audio Jobs
+DEFAULT_CANDIDATE_LANGUAGES = ('en', 'es', 'hi')  # 🌐 The tongues our audio jobs speak
 
 class AudioLanguageAnalyzer:
     """
@@ -71,34 +163,138 @@ class AudioLanguageAnalyzer:
 
     - The Mystical Audio Oracle
     """
-    def __init__(self, input_dir: str, output_dir: str, whisper_model: str = "base"):
+    def __init__(self, input_dir: Optional[str], output_dir: str, whisper_model: str = "base",
+                 mode: str = "transcribe", candidate_languages: Optional[List[str]] = None,
+                 detect_windows: int = 1, workers: int = 1, threads_per_worker: Optional[int] = None,
+                 result_cache: str = 'use', cache_max_mb: float = DEFAULT_CACHE_MAX_MB,
+                 plan_groups: bool = False, group_confidence: float = 0.8, escalation_windows: int = 3,
+                 audio_jobs_file: Optional[str] = None, audio_urls_file: Optional[str] = None,
+                 remote_seconds: float = DEFAULT_PREFIX_SECONDS, fetch_concurrency: int = 8,
+                 decode_workers: int = 2, queue_depth: int = 4,
+                 cascade: Optional[List[str]] = None, escalate_below: float = 0.85, backend: str = 'auto',
+                 profile_dir: Optional[str] = None, quiet_chorus: bool = False, chorus_every: int = 1,
+                 speech_lead_seconds: Optional[float] = 15.0, segment_seconds: Optional[float] = None,
+                 fingerprint: bool = False, twin_score: float = DEFAULT_MATCH_SCORE,
+                 transcript_similarity: float = DEFAULT_SIMILARITY, feature_cache: Optional[str] = None,
+                 feature_cache_max_mb: float = DEFAULT_FEATURE_CACHE_MAX_MB, shard: Optional[Tuple[int, int]] = None,
+                 export_views: Optional[List[str]] = None):
         # 🌟 The Sacred Initialization Ritual
-        self.enchanted_audio_realm = Path(input_dir)        # 🏰 The mystical audio sanctuary
+        self.enchanted_audio_realm = Path(input_dir) if input_dir else None  # 🏰 The mystical audio sanctuary
         self.digital_chronicle_hall = Path(output_dir)      # 📚 The hall of linguistic wisdom
         self.linguistic_alchemist_model = whisper_model     # 🧙‍♂️ The voice transformation master
 
+        # 🌐 The Distant Archives - audio heard straight from storage URLs, first N seconds only
+        self.distant_jobs_scroll = audio_jobs_file
+        self.distant_urls_scroll = audio_urls_file
+        self.distant_listening_seconds = remote_seconds
+
+        # 🔮 The Divination Mode - full transcription or a swift language glance
+        self.analysis_mode = mode                            # 🎭 'transcribe' or 'detect'
+        self.candidate_tongues = [lang.lower() for lang in candidate_languages] if candidate_languages else None
+        self.detection_window_count = max(1, detect_windows)  # ⏳ How many 30s glances per file
+
+        # 🗣️ The Speech Finder - skip silence and stings, never wake the model for a voiceless file
+        self.speech_lead_seconds = speech_lead_seconds  # 🌙 None turns voice-activity trimming off
+
+        # 🧩 The Relay Reading - long narrations torn at their pauses and transcribed by the whole ensemble
+        self.segment_seconds = segment_seconds if mode == 'transcribe' else None
+
+        # 🫆 The Echo Hunt - languages of one job that are acoustically the same recording, found without a model
+        self.hunt_acoustic_twins = fingerprint
+        self.acoustic_twin_score = twin_score
+        self._acoustic_twins: Dict[str, List[str]] = {}  # 🫆 fingerprint key → the job's other languages it sounds like
+
+        # 🧬 The Echoing Scripts - transcripts that say the same thing, however they were labelled
+        self.transcript_similarity = transcript_similarity
+
+        # 🧭 The Shard - this node's (index, count) slice of the (job, language) families; None hears them all
+        self.shard = shard
+
+        # 🪜 The Model Cascade - tiny first, larger models only when the smaller one hesitates
+        self.cascade_tiers = list(cascade) if cascade else None
+        self.cascade_escalation_threshold = escalate_below if cascade else 0.0
+
+        # 🗺️ The Family Plan - one verdict per (job, language), escalating only when unsure
+        self.plan_families = plan_groups
+        self.family_confidence_threshold = group_confidence
+        self.escalation_window_count = max(1, escalation_windows)
+
+        # 🎻 The Ensemble Size - how many parallel performers share the stage
+        self.ensemble_size = max(1, workers)
+        self.threads_per_performer = threads_per_worker or max(1, (os.cpu_count() or 1) // self.ensemble_size)
+
+        # 🎬 The Staged Performance - crew sizes per act and how many voices may wait between acts
+        self.fetch_concurrency = max(1, fetch_concurrency)
+        self.decode_concurrency = max(1, decode_workers)
+        self.queue_depth = max(1, queue_depth)
+
+        # 📜 The recipe each ensemble performer uses to summon its own oracle
+        self.oracle_recipe = {
+            'input_dir': input_dir,
+            'output_dir': output_dir,
+            'whisper_model': whisper_model,
+            'mode': mode,
+            'candidate_languages': candidate_languages,
+            'detect_windows': detect_windows,
+            'result_cache': 'off',  # 🗄️ The conductor alone reads and writes the vault; performers only hear
+            'cascade': cascade,
+            'escalate_below': escalate_below,
+            'backend': backend,
+            'speech_lead_seconds': speech_lead_seconds
+        }
+
+        # 🗄️ The Memory Vault - 'use' reads and writes, 'rebuild' only writes, 'off' forgets
+        self.vault_policy = result_cache
+        self.memory_vault = None if result_cache == 'off' else AnalysisResultCache(
+            self.digital_chronicle_hall / DEFAULT_CACHE_FILENAME, max_mb=cache_max_mb
+        )
+        self._voice_fingerprints: Dict[str, str] = {}  # 🔏 path → SHA-256 of its bytes
+
+        # 🧮 The Feature Shelf - log-mel windows kept on disk, so another model or backend skips decode and mel
+        self.feature_shelf = (FeatureCache(feature_cache, max_mb=feature_cache_max_mb)
+                              if feature_cache and mode == 'detect' else None)
+        self._voice_probes: Dict[str, Dict] = {}        # 🩺 path → MP3 header probe (duration, bitrate, integrity)
+
+        # 🗃️ The Archive - every chronicle lands as one indexed run in analysis.sqlite; CSV/JSON only on request
+        self.export_views = list(export_views or [])     # 📤 'csv' and/or 'json'
+        self.archived_settings: Optional[Dict] = None    # 🧭 Handed over by the reunion, whose oracle has no engine
+
         # 🎭 Prepare the digital stage for our performance
         self.digital_chronicle_hall.mkdir(parents=True, exist_ok=True)
 
         # 🌟 The Great Whisper Summoning Ceremony
-        self.using_apple_silicon_virtuoso = False  # 🎭 MLX performer status
+        # 🌙 The model itself is only awakened on first use, so an ensemble
+        #    conductor never pays for a model it will not perform with.
         self.linguistic_alchemist_model = whisper_model
+        self.stage_clock = StageClock(profile_dir)  # ⏱️ Where every act's seconds (and, if asked, profiles) are written down
+        self.chorus_tuning = (quiet_chorus, chorus_every)  # 🎵 Handed on to ensemble performers
+        self._standing_ensemble = None  # 🎻 Inference performers, kept between performances
 
+        if backend is None:
+            self.listening_engine = None  # 🧾 Reports or echoes only (merging shards, --fingerprint-only): no voice will be heard
+            return
         try:
-            # 🎭 Summon the OpenAI Whisper virtuoso
-            import whisper
-            self.voice_transformation_master = whisper.load_model(whisper_model)
-            self.using_apple_silicon_virtuoso = False
-            logger.info("🎉 ✨ OPENAI WHISPER MASTERPIECE LOADED! Model: %s", whisper_model)
-        except ImportError:
-            if MLX_WHISPER_AVAILABLE:
-                # 🎭 Fallback to Apple Silicon virtuoso
-                self.using_apple_silicon_virtuoso = True
-                logger.info("🍎 ✨ APPLE SILICON VIRTUOSO ENGAGED! Model: %s", whisper_model)
-            else:
-                logger.error("💥 😭 LINGUISTIC TRAGEDY! No voice transformation masters available!")
-                logger.error("🧙‍♂️ Install OpenAI Whisper: pip install openai-whisper")
-                sys.exit(1)
+            # 🧠 Choose the listening engine - the fastest one in the building unless told otherwise
+            self.listening_engine = create_backend(backend)
+            logger.info("🧠 ✨ LISTENING ENGINE ENGAGED: %s (model: %s)", self.listening_engine.name, whisper_model)
+        except RuntimeError as engine_error:
+            logger.error("💥 😭 LINGUISTIC TRAGEDY! %s", engine_error)
+            logger.error("🧙‍♂️ Install one of: pip install faster-whisper | optimum[onnxruntime] | openai-whisper")
+            sys.exit(1)
+
+    @property
+    def voice_transformation_master(self):
+        """🧙‍♂️ Awaken the default model on first use and keep it resident."""
+        return self.summon_voice_master(self.linguistic_alchemist_model)
+
+    def summon_voice_master(self, model_name: str):
+        """🧙‍♂️ Awaken (once) and return the resident model of the given size - cascade tiers each get their own."""
+        if self.listening_engine.is_loaded(model_name):
+            return self.listening_engine.load(model_name)
+        with self.stage_clock.span('model_load'):
+            awakened_master = self.listening_engine.load(model_name)
+        logger.info("🧊 Voice master %s awake in %.2fs", model_name, self.listening_engine.load_seconds[model_name])
+        return awakened_master
 
     def get_audio_files(self) -> List[Path]:
         """
@@ -109,6 +305,17 @@ class AudioLanguageAnalyzer:
         enchanted audio realm to discover hidden voice treasures. Each file extension
         represents a different musical instrument in our linguistic symphony."
         """
+        # 🌐 Voices from the distant archives travel as URLs, never touching the disk
+        if self.distant_jobs_scroll or self.distant_urls_scroll:
+            distant_voices = (
+                sources_from_audio_jobs(self.distant_jobs_scroll, self.distant_listening_seconds)
+                if self.distant_jobs_scroll else
+                sources_from_url_list(self.distant_urls_scroll, self.distant_listening_seconds)
+            )
+            logger.info("🌐 ✨ DISTANT VOICES SUMMONED: %d (first %ss of each)", len(distant_voices),
+                        self.distant_listening_seconds)
+            return sorted(distant_voices)
+
         # 🎵 The sacred instruments of our audio orchestra
         mystical_audio_instruments = {'.mp3', '.wav', '.m4a', '.aac', '.ogg', '.flac'}
         discovered_voice_treasures = []
@@ -121,9 +328,135 @@ class AudioLanguageAnalyzer:
                 logger.info("🎵 Found %d %s voice treasures!", len(newly_discovered), instrument)
 
         logger.info("🏆 ✨ TOTAL VOICE TREASURES DISCOVERED: %d!", len(discovered_voice_treasures))
-        return discovered_voice_treasures
+        # 📚 A stable order keeps every run's chronicle comparable
+        return sorted(discovered_voice_treasures)
+
+    def decode_voice(self, audio_path: Path, window_count: Optional[int] = None) -> Dict:
+        """
+        🎧 The Decoding Rite - Turning Bytes into Listening Material
+        ===========================================================
 
-    def transcribe_audio(self, audio_path: Path) -> Dict:
+        "Before the oracle listens, the sound must be poured into its vessel. For a
+        swift glance I stream only the needed 30-second windows from ffmpeg; for a
+        full transcription I pour the whole narration."
+        """
+        audio_payload = self._audio_payload(audio_path)
+        if self.analysis_mode == 'detect':
+            window_count = window_count or self.detection_window_count
+            shelved_voice = self._recall_features(audio_path, window_count)
+            if shelved_voice is not None:
+                return shelved_voice
+
+            # ⏳ Stream only the seconds we need: start … middle … end windows, straight from ffmpeg
+            heard_duration = probe_duration(audio_payload)
+            narration_duration = (
+                audio_path.estimated_duration if isinstance(audio_path, RemoteAudio) else heard_duration
+            ) or heard_duration
+            if self.speech_lead_seconds is None:
+                listening_windows = decode_windows(audio_payload, window_start_times(heard_duration, window_count))
+                decoded_voice = {'windows': listening_windows, 'duration': narration_duration}
+            else:
+                decoded_voice = {**self._find_speaking_windows(audio_payload, heard_duration, window_count),
+                                 'duration': narration_duration}
+            return self._shelve_features(audio_path, window_count, decoded_voice)
+
+        waveform = decode_all(audio_payload)
+        decoded_voice = {'waveform': waveform, 'duration': len(waveform) / SAMPLE_RATE}
+        if self.speech_lead_seconds is None and self.segment_seconds is None:
+            return decoded_voice
+
+        speaking_mask = frame_speech_mask(waveform)
+        if self.speech_lead_seconds is not None:
+            decoded_voice['speech_fraction'] = round(float(speech_fraction(speaking_mask)), 4)
+            decoded_voice['no_speech'] = decoded_voice['speech_fraction'] < MIN_SPEECH_FRACTION
+        if self.segment_seconds is not None:
+            # 🧩 Passages cut mid-pause; the last one runs to the final sample
+            decoded_voice['segments'] = [
+                {'start': start, 'end': end,
+                 'speech_fraction': round(float(speech_fraction(
+                     speaking_mask[int(start / FRAME_SECONDS):int(end / FRAME_SECONDS)])), 4)}
+                for start, end in plan_segments(speaking_mask, self.segment_seconds)
+            ]
+            decoded_voice['segments'][-1]['end'] = round(decoded_voice['duration'], 2)
+        return decoded_voice
+
+    def _find_speaking_windows(self, audio_payload, heard_duration: float, window_count: int) -> Dict:
+        """
+        🗣️ The Speech Finder - Listening Where Someone Is Actually Talking
+        =================================================================
+
+        "Silence and a music sting make a poor first impression. I decode each
+        window with a little lead room, start it at the first spoken frame, and
+        keep only the windows that are mostly voice. If no window holds any
+        voice at all, the narration is broken and the model is never woken."
+        """
+        lead_samples = int(self.speech_lead_seconds * SAMPLE_RATE)
+        span_starts = window_start_times(heard_duration, window_count, WINDOW_SECONDS + self.speech_lead_seconds)
+        listening_spans = decode_windows(audio_payload, span_starts, WINDOW_SAMPLES + lead_samples)
+        listening_windows, onset_seconds, speaking_fractions = speech_windows(
+            listening_spans, WINDOW_SAMPLES, lead_samples
+        )
+
+        if speaking_fractions.max() < MIN_SPEECH_FRACTION:
+            return {'windows': None, 'no_speech': True, 'speech_fraction': 0.0}
+
+        # 🎙️ Mostly-speech windows only; if none is, the most talkative one
+        mostly_speaking = speaking_fractions >= 0.5
+        if not mostly_speaking.any():
+            mostly_speaking = speaking_fractions == speaking_fractions.max()
+        return {
+            'windows': listening_windows[mostly_speaking],
+            'no_speech': False,
+            'speech_fraction': round(float(speaking_fractions[mostly_speaking].mean()), 4),
+            'speech_onset_seconds': round(float(span_starts[0] + onset_seconds[0]), 2)
+        }
+
+    def _feature_variant(self, window_count: int, n_mels: int) -> str:
+        """🔏 Everything besides the audio bytes that shapes the features: windows, speech trimming, mel channels."""
+        return f"windows={window_count}|vad={self.speech_lead_seconds}|mels={n_mels}"
+
+    def _feature_mel_sizes(self) -> List[int]:
+        """🧮 The mel channel counts this run's models listen with (a large-v3 cascade tier needs 128)."""
+        return sorted({mel_bins(model_name) for model_name in self.cascade_tiers or [self.linguistic_alchemist_model]})
+
+    def _recall_features(self, audio_path: Path, window_count: int) -> Optional[Dict]:
+        """🧮 A decoded voice rebuilt from the feature shelf - memory-mapped features, no ffmpeg - or None."""
+        if self.feature_shelf is None:
+            return None
+        shelved_features = {}
+        for n_mels in self._feature_mel_sizes():
+            shelved = self.feature_shelf.get(self._voice_fingerprint(audio_path), self._feature_variant(window_count, n_mels))
+            if shelved is None:
+                return None
+            shelved_features[n_mels], decode_details = shelved
+        chorus_logger.info("🧮 Feature shelf holds %s - no decode needed", audio_path.name)
+        return {**decode_details, 'windows': None, 'features': shelved_features}
+
+    def _shelve_features(self, audio_path: Path, window_count: int, decoded_voice: Dict) -> Dict:
+        """🧮 Compute the log-mel features once, here in the decode stage, and keep them for the next run."""
+        if self.feature_shelf is None:
+            return decoded_voice
+        decode_details = {
+            detail: decoded_voice[detail]
+            for detail in ('duration', 'no_speech', 'speech_fraction', 'speech_onset_seconds') if detail in decoded_voice
+        }
+        fresh_features = {}
+        for n_mels in self._feature_mel_sizes():
+            fresh_features[n_mels] = (
+                log_mel_windows(decoded_voice['windows'], n_mels) if decoded_voice['windows'] is not None
+                else np.zeros((0, n_mels, WINDOW_SAMPLES // HOP_LENGTH), dtype=np.float32)
+            )
+            self.feature_shelf.put(self._voice_fingerprint(audio_path), self._feature_variant(window_count, n_mels),
+                                   fresh_features[n_mels], decode_details)
+        return {**decoded_voice, 'features': fresh_features}
+
+    def hear_decoded_voice(self, audio_path: Path, decoded_voice: Dict) -> Dict:
+        """🎭 Route decoded sound to the chosen ritual - swift glance or full transcription."""
+        if self.analysis_mode == 'detect':
+            return self.detect_language(audio_path, decoded_voice=decoded_voice)
+        return self.transcribe_audio(audio_path, decoded_voice=decoded_voice)
+
+    def transcribe_audio(self, audio_path: Path, decoded_voice: Optional[Dict] = None) -> Dict:
         """
         🎭 The Voice Transcription Ritual - Awakening Digital Tongues
         ==========================================================
@@ -134,49 +467,311 @@ class AudioLanguageAnalyzer:
         languages that dance within each audio treasure."
         """
         try:
-            logger.info("🎭 ✨ TRANSCRIPTION RITUAL BEGINS for: %s", audio_path.name)
+            chorus_logger.info("🎭 ✨ TRANSCRIPTION RITUAL BEGINS for: %s", audio_path.name)
+            decoded_voice = decoded_voice or self.decode_voice(audio_path)
+            if decoded_voice.get('no_speech'):
+                return self._voiceless(audio_path, decoded_voice)
 
             # 🌟 The Grand Transcription Ceremony
-            if self.using_apple_silicon_virtuoso:
-                # 🎭 Apple Silicon virtuoso performance
-                mystical_model_path = f"mlx-community/whisper-{self.linguistic_alchemist_model}"
-                logger.info("🍎 Summoning Apple Silicon virtuoso...")
-                transcription_result = mlx_whisper.transcribe(str(audio_path), path_or_hf_repo=mystical_model_path, verbose=False)
-
-                return {
-                    'file_path': str(audio_path),
-                    'detected_language': transcription_result.get('language', 'unknown'),
-                    'transcription': transcription_result.get('text', ''),
-                    'confidence': 0.8,  # MLX doesn't provide confidence scores
-                    'duration': 0,  # MLX doesn't provide duration
-                    'status': 'success'
-                }
-            else:
-                # 🎭 OpenAI virtuoso performance
-                logger.info("🤖 Summoning OpenAI virtuoso...")
-                transcription_result = self.voice_transformation_master.transcribe(str(audio_path))
-
-                return {
-                    'file_path': str(audio_path),
-                    'detected_language': transcription_result.get('language', 'unknown'),
-                    'transcription': transcription_result.get('text', ''),
-                    'confidence': transcription_result.get('confidence', 0),
-                    'duration': transcription_result.get('duration', 0),
-                    'status': 'success'
-                }
+            chorus_logger.info("🤖 Summoning the %s virtuoso...", self.listening_engine.name)
+            self.summon_voice_master(self.linguistic_alchemist_model)
+            transcription_result = self.listening_engine.transcribe(
+                decoded_voice['waveform'], self.linguistic_alchemist_model
+            )
+
+            return {
+                'file_path': str(audio_path),
+                'detected_language': transcription_result['language'],
+                'transcription': transcription_result['text'],
+                'confidence': transcription_result['confidence'],
+                'duration': transcription_result['duration'] or decoded_voice['duration'],
+                **({'speech_fraction': decoded_voice['speech_fraction']} if 'speech_fraction' in decoded_voice else {}),
+                'status': 'success'
+            }
 
         except Exception as mystical_error:
             logger.error("💥 😭 TRANSCRIPTION RITUAL INTERRUPTED for %s: %s", audio_path.name, mystical_error)
-            logger.info("🩹 Attempting graceful recovery...")
+            chorus_logger.info("🩹 Attempting graceful recovery...")
+            return self._lost_voice(audio_path, mystical_error)
+
+    def detect_language(self, audio_path: Path, window_count: Optional[int] = None,
+                        decoded_voice: Optional[Dict] = None) -> Dict:
+        """
+        🎭 The Swift Language Glance - Divining Tongues Without Transcription
+        ====================================================================
+
+        "Why read the whole scroll when the first lines reveal its tongue? I cast
+        Whisper's language-detection spell over one or a few 30-second windows of
+        the log-mel spectrogram and return honest per-language probabilities,
+        leaving the costly full decoding ritual untouched."
+        """
+        try:
+            chorus_logger.info("🔮 ✨ LANGUAGE GLANCE BEGINS for: %s", audio_path.name)
+            decoded_voice = decoded_voice or self.decode_voice(audio_path, window_count)
+            if decoded_voice.get('no_speech'):
+                return self._voiceless(audio_path, decoded_voice)
+
+            # 🪜 Climb the cascade: the cheapest model whose top tongue clears the bar decides
+            cascade_trail = []
+            for deciding_model in self.cascade_tiers or [self.linguistic_alchemist_model]:
+                window_probabilities = self._windows_language_probabilities(decoded_voice, deciding_model)
+
+                # ⚖️ Blend the windows' opinions into one verdict
+                blended_probabilities = self._blend_language_probabilities(window_probabilities)
+                detected_tongue = max(blended_probabilities, key=blended_probabilities.get)
+                cascade_trail.append(f"{deciding_model}:{blended_probabilities[detected_tongue]:.3f}")
+                if blended_probabilities[detected_tongue] >= self.cascade_escalation_threshold:
+                    break
+
+            cascade_record = {
+                'decided_by_model': deciding_model,
+                'cascade_trail': '>'.join(cascade_trail)
+            } if self.cascade_tiers else {}
+
+            speech_record = {
+                speech_key: decoded_voice[speech_key]
+                for speech_key in ('speech_fraction', 'speech_onset_seconds') if speech_key in decoded_voice
+            }
+
             return {
+                **cascade_record,
+                **speech_record,
                 'file_path': str(audio_path),
-                'detected_language': 'error',
+                'detected_language': detected_tongue,
                 'transcription': '',
-                'confidence': 0,
-                'duration': 0,
-                'status': 'error',
-                'error': str(mystical_error)
+                'confidence': blended_probabilities[detected_tongue],
+                'duration': decoded_voice['duration'],
+                'language_probabilities': json.dumps(
+                    {lang: round(prob, 4) for lang, prob in
+                     sorted(blended_probabilities.items(), key=lambda item: -item[1])[:5]}
+                ),
+                'window_languages': ','.join(
+                    max(probs, key=probs.get) for probs in
+                    (self._restrict_to_candidates(p) for p in window_probabilities)
+                ),
+                'status': 'success'
+            }
+
+        except Exception as mystical_error:
+            logger.error("💥 😭 LANGUAGE GLANCE INTERRUPTED for %s: %s", audio_path.name, mystical_error)
+            return self._lost_voice(audio_path, mystical_error)
+
+    @staticmethod
+    def _lost_voice(audio_path: Path, mystical_error: Exception) -> Dict:
+        """🩹 The graceful-recovery result for a voice we could not hear."""
+        return {
+            'file_path': str(audio_path),
+            'detected_language': 'error',
+            'transcription': '',
+            'confidence': 0,
+            'duration': 0,
+            'status': 'error',
+            'error': str(mystical_error)
+        }
+
+    @staticmethod
+    def _broken_voice(audio_path: Path, voice_probe: Dict) -> Dict:
+        """🩺 An empty or cut-off MP3, caught by its headers before any decode or model call."""
+        chorus_logger.info("🩺 %s is %s - skipping decode and the model", audio_path.name, voice_probe['status'])
+        return {
+            'file_path': str(audio_path),
+            'detected_language': 'none',
+            'transcription': '',
+            'confidence': 0,
+            'duration': voice_probe.get('duration') or 0,
+            'status': voice_probe['status'],
+            'error': f"MP3 is {voice_probe['status']} ({voice_probe.get('file_size') or 0} bytes)"
+        }
+
+    @staticmethod
+    def _voiceless(audio_path: Path, decoded_voice: Dict) -> Dict:
+        """🤐 A narration with no speech in it - a broken render; the model was never called."""
+        chorus_logger.info("🤐 No voice found in %s - skipping the model", audio_path.name)
+        return {
+            'file_path': str(audio_path),
+            'detected_language': 'none',
+            'transcription': '',
+            'confidence': 0,
+            'duration': decoded_voice['duration'],
+            'speech_fraction': decoded_voice.get('speech_fraction', 0.0),
+            'status': 'no_speech'
+        }
+
+    async def _hear_in_segments(self, audio_path: Path, decoded_voice: Dict, performance_loop,
+                                inference_ensemble) -> Dict:
+        """
+        🧩 The Relay Reading - One Long Narration, Many Readers
+        ======================================================
+
+        "A long scroll read by a single voice takes minutes; torn at its pauses and
+        handed to every performer at once, it takes moments. Each reader names the
+        tongue of their own passage, and I lay the passages back in order - so a
+        Spanish opening cannot hide in front of an English body."
+        """
+        if decoded_voice.get('no_speech'):
+            return self._voiceless(audio_path, decoded_voice)
+
+        waveform = decoded_voice['waveform']
+        passages = []
+        for segment in decoded_voice['segments']:
+            passage = {
+                'waveform': waveform[int(segment['start'] * SAMPLE_RATE):int(segment['end'] * SAMPLE_RATE)],
+                'duration': segment['end'] - segment['start']
             }
+            if self.speech_lead_seconds is not None and segment['speech_fraction'] < MIN_SPEECH_FRACTION:
+                passage.update(no_speech=True, speech_fraction=segment['speech_fraction'])  # 🤐 a long pause
+            passages.append(passage)
+
+        chorus_logger.info("🧩 %s torn into %d passages", audio_path.name, len(passages))
+        self.stage_clock.count('segments', len(passages))
+        if self.ensemble_size > 1:
+            reader = _ensemble_performer_hears
+        else:
+            reader = self.stage_clock.profiled('inference', lambda task: self.hear_decoded_voice(*task))
+        heard_passages = await asyncio.gather(*(
+            performance_loop.run_in_executor(inference_ensemble, reader, (audio_path, passage))
+            for passage in passages
+        ))
+        return self._stitch_passages(audio_path, decoded_voice, heard_passages)
+
+    def _stitch_passages(self, audio_path: Path, decoded_voice: Dict, heard_passages: List[Dict]) -> Dict:
+        """🧵 Passages back in order: one transcript, the tongue spoken longest, and a per-passage timeline."""
+        language_timeline = [
+            {'start': segment['start'], 'end': segment['end'], 'language': passage['detected_language'],
+             'confidence': round(float(passage['confidence']), 4), 'status': passage['status']}
+            for segment, passage in zip(decoded_voice['segments'], heard_passages)
+        ]
+        spoken_passages = [entry for entry in language_timeline if entry['status'] == 'success']
+        failed_passages = [passage for passage in heard_passages if passage['status'] == 'error']
+        if not spoken_passages:
+            if failed_passages:
+                return self._lost_voice(audio_path, RuntimeError(failed_passages[0].get('error', 'every passage failed')))
+            return self._voiceless(audio_path, decoded_voice)
+        if failed_passages:
+            logger.warning("⚠️ %d of %d passages of %s could not be heard", len(failed_passages),
+                           len(heard_passages), audio_path.name)
+
+        # ⚖️ The tongue spoken for the most seconds names the narration
+        seconds_per_tongue: Dict[str, float] = {}
+        for entry in spoken_passages:
+            seconds_per_tongue[entry['language']] = seconds_per_tongue.get(entry['language'], 0.0) + entry['end'] - entry['start']
+        ruling_tongue = max(seconds_per_tongue, key=seconds_per_tongue.get)
+        ruling_passages = [entry for entry in spoken_passages if entry['language'] == ruling_tongue]
+
+        return {
+            'file_path': str(audio_path),
+            'detected_language': ruling_tongue,
+            'transcription': ' '.join(
+                passage['transcription'].strip() for passage in heard_passages if passage['transcription'].strip()
+            ),
+            'confidence': round(sum(entry['confidence'] * (entry['end'] - entry['start']) for entry in ruling_passages)
+                                / seconds_per_tongue[ruling_tongue], 4),
+            'duration': decoded_voice['duration'],
+            **({'speech_fraction': decoded_voice['speech_fraction']} if 'speech_fraction' in decoded_voice else {}),
+            'segment_languages': ','.join(entry['language'] for entry in spoken_passages),
+            'mixed_languages': len(seconds_per_tongue) > 1,
+            'failed_segments': len(failed_passages),
+            'language_timeline': json.dumps(language_timeline),
+            'status': 'success'
+        }
+
+    @staticmethod
+    def _audio_payload(audio_path):
+        """🌐 What ffmpeg should read: the file on disk, or the in-memory prefix of a distant voice."""
+        return audio_path.payload if isinstance(audio_path, RemoteAudio) else audio_path
+
+    def _windows_language_probabilities(self, decoded_voice: Dict,
+                                        model_name: Optional[str] = None) -> List[Dict[str, float]]:
+        """🔮 One batched forward pass: per-language probabilities for every 30-second window."""
+        model_name = model_name or self.linguistic_alchemist_model
+        self.summon_voice_master(model_name)  # ⏱️ a first-time load is timed as its own stage
+        shelved_features = (decoded_voice.get('features') or {}).get(mel_bins(model_name))
+        if shelved_features is not None:
+            return self.listening_engine.detect_language_features(shelved_features, model_name)
+        return self.listening_engine.detect_language(decoded_voice['windows'], model_name)
+
+    def _restrict_to_candidates(self, probabilities: Dict[str, float]) -> Dict[str, float]:
+        """🌐 Keep only the job's candidate tongues and renormalize their probabilities."""
+        if not self.candidate_tongues:
+            return probabilities
+        restricted = {lang: probabilities.get(lang, 0.0) for lang in self.candidate_tongues}
+        total_weight = sum(restricted.values())
+        if total_weight <= 0:
+            return {lang: 1.0 / len(restricted) for lang in restricted}
+        return {lang: prob / total_weight for lang, prob in restricted.items()}
+
+    def _blend_language_probabilities(self, window_probabilities: List[Dict[str, float]]) -> Dict[str, float]:
+        """⚖️ Average the per-window probabilities (restricted to candidates when requested)."""
+        blended: Dict[str, float] = {}
+        for probabilities in window_probabilities:
+            for lang, prob in self._restrict_to_candidates(probabilities).items():
+                blended[lang] = blended.get(lang, 0.0) + prob / len(window_probabilities)
+        return blended
+
+    def inspect_audio(self, audio_path: Path, window_count: Optional[int] = None) -> Dict:
+        """🎭 Hear one audio treasure end to end: vault, decode, then the chosen ritual."""
+        remembered_result = self._recall_from_vault(audio_path, window_count)
+        if remembered_result is not None:
+            return remembered_result
+
+        if self.analysis_mode == 'detect':
+            fresh_result = self.detect_language(audio_path, window_count)
+        else:
+            fresh_result = self.transcribe_audio(audio_path)
+
+        self._remember_in_vault(audio_path, window_count, fresh_result)
+        return fresh_result
+
+    def _remember_in_vault(self, audio_path: Path, window_count: Optional[int], fresh_result: Dict):
+        """🗄️ Keep successful results so the next run never has to hear these bytes again."""
+        if self.memory_vault is not None and fresh_result.get('status') in ('success', 'no_speech'):
+            self.memory_vault.put(self._voice_fingerprint(audio_path), self._vault_variant(window_count), fresh_result)
+
+    def _vault_variant(self, window_count: Optional[int] = None) -> str:
+        """🔏 Everything besides the audio bytes that shapes a result: model, backend, mode and glance settings."""
+        variant_parts = [
+            f"cascade={','.join(self.cascade_tiers)}@{self.cascade_escalation_threshold}"
+            if self.cascade_tiers else self.linguistic_alchemist_model,
+            self.listening_engine.name,
+            self.analysis_mode
+        ]
+        if self.speech_lead_seconds is not None:
+            variant_parts.append(f"vad={self.speech_lead_seconds}")
+        if self.segment_seconds is not None:
+            variant_parts.append(f"segments={self.segment_seconds}")
+        if self.analysis_mode == 'detect':
+            variant_parts.append(f"windows={window_count or self.detection_window_count}")
+            variant_parts.append(f"candidates={','.join(self.candidate_tongues or ['all'])}")
+        return '|'.join(variant_parts)
+
+    def _voice_fingerprint(self, audio_path: Path) -> str:
+        """🔏 SHA-256 of the audio bytes, computed once per file per run."""
+        path_key = str(audio_path)
+        if path_key not in self._voice_fingerprints:
+            self._voice_fingerprints[path_key] = hash_audio_bytes(self._audio_payload(audio_path))
+        return self._voice_fingerprints[path_key]
+
+    def _probe_voice(self, audio_path: Path) -> Dict:
+        """🩺 The MP3 header probe of a file, read once per run; ``{}`` for other formats."""
+        path_key = str(audio_path)
+        if path_key not in self._voice_probes:
+            if not path_key.lower().split('?')[0].endswith('.mp3'):
+                self._voice_probes[path_key] = {}
+            elif isinstance(audio_path, RemoteAudio):
+                self._voice_probes[path_key] = audio_path.probe
+            else:
+                self._voice_probes[path_key] = probe_mp3_file(audio_path)
+        return self._voice_probes[path_key]
+
+    def _recall_from_vault(self, audio_path: Path, window_count: Optional[int] = None) -> Optional[Dict]:
+        """🗄️ Return a remembered result for these exact bytes, before any model is touched."""
+        if self.memory_vault is None or self.vault_policy == 'rebuild':
+            return None
+        remembered_result = self.memory_vault.get(self._voice_fingerprint(audio_path), self._vault_variant(window_count))
+        if remembered_result is not None:
+            chorus_logger.info("🗄️ Memory vault remembers %s - no model needed", audio_path.name)
+            remembered_result['file_path'] = str(audio_path)
+        return remembered_result
 
     def analyze_metadata(self, audio_path: Path) -> Dict:
         """
@@ -204,36 +799,36 @@ class AudioLanguageAnalyzer:
         if '_en_' in mystical_filename.lower() or mystical_filename.lower().endswith('_en.mp3'):
             linguistic_prophecy['claimed_language'] = 'english'
             linguistic_prophecy['language_code'] = 'en'
-            logger.info("🇺🇸 English sigil detected in %s", mystical_filename)
+            chorus_logger.info("🇺🇸 English sigil detected in %s", mystical_filename)
         elif '_es_' in mystical_filename.lower() or mystical_filename.lower().endswith('_es.mp3'):
             linguistic_prophecy['claimed_language'] = 'spanish'
             linguistic_prophecy['language_code'] = 'es'
-            logger.info("🇪🇸 Spanish sigil detected in %s", mystical_filename)
+            chorus_logger.info("🇪🇸 Spanish sigil detected in %s", mystical_filename)
         elif '_hi_' in mystical_filename.lower() or mystical_filename.lower().endswith('_hi.mp3'):
             linguistic_prophecy['claimed_language'] = 'hindi'
             linguistic_prophecy['language_code'] = 'hi'
-            logger.info("🇮🇳 Hindi sigil detected in %s", mystical_filename)
+            chorus_logger.info("🇮🇳 Hindi sigil detected in %s", mystical_filename)
 
         # 🌟 Additional mystical language patterns
         elif '_hindi' in mystical_filename.lower():
             linguistic_prophecy['claimed_language'] = 'hindi'
             linguistic_prophecy['language_code'] = 'hi'
-            logger.info("🕉️ Ancient Hindi pattern discovered in %s", mystical_filename)
+            chorus_logger.info("🕉️ Ancient Hindi pattern discovered in %s", mystical_filename)
         elif '_spanish' in mystical_filename.lower():
             linguistic_prophecy['claimed_language'] = 'spanish'
             linguistic_prophecy['language_code'] = 'es'
-            logger.info("💃 Spanish flamenco rhythm detected in %s", mystical_filename)
+            chorus_logger.info("💃 Spanish flamenco rhythm detected in %s", mystical_filename)
         elif '_english' in mystical_filename.lower():
             linguistic_prophecy['claimed_language'] = 'english'
             linguistic_prophecy['language_code'] = 'en'
-            logger.info("📚 English literary tradition found in %s", mystical_filename)
+            chorus_logger.info("📚 English literary tradition found in %s", mystical_filename)
 
         # 🎭 The Post ID Revelation Ceremony
         import re  # 📜 The pattern recognition spellbook
         mystical_post_sigil = re.search(r'post_(\d+)', mystical_filename)
         if mystical_post_sigil:
             linguistic_prophecy['post_id'] = int(mystical_post_sigil.group(1))
-            logger.info("📝 Post ID %d revealed!", linguistic_prophecy['post_id'])
+            chorus_logger.info("📝 Post ID %d revealed!", linguistic_prophecy['post_id'])
 
         return linguistic_prophecy
 
@@ -265,8 +860,13 @@ class AudioLanguageAnalyzer:
         normalized_claimed_essence = universal_language_harmony.get(claimed_linguistic_heritage.lower(), claimed_linguistic_heritage.lower())
         normalized_detected_essence = universal_language_harmony.get(detected_vocal_reality.lower(), detected_vocal_reality.lower())
 
-        # ⚖️ The Sacred Judgment - do the linguistic souls harmonize?
-        linguistic_harmony_achieved = normalized_claimed_essence == normalized_detected_essence
+        # ⚖️ The Sacred Judgment - do the linguistic souls harmonize? Every passage must, when there are passages
+        passage_essences = {
+            universal_language_harmony.get(tongue, tongue)
+            for tongue in transcription_result.get('segment_languages', '').split(',') if tongue
+        }
+        linguistic_harmony_achieved = (normalized_claimed_essence == normalized_detected_essence and
+                                       passage_essences <= {normalized_claimed_essence})
         mystical_confidence_level = transcription_result.get('confidence', 0)
 
         # 🎭 Determine the divination confidence level
@@ -286,6 +886,347 @@ class AudioLanguageAnalyzer:
             'analysis_confidence': divination_clarity
         }
 
+    def analyze_file(self, instrument: Path, voice_transcription: Optional[Dict] = None) -> Dict:
+        """
+        🎵 A Single Movement - Metadata, Voice and Harmony for One Audio Treasure
+        ========================================================================
+
+        "Every instrument plays the same three-part movement: the scroll is read,
+        the voice is heard, and the harmony between them is judged."
+        """
+        chorus_logger.info("🎵 Now performing: %s", instrument.name)
+
+        # 🌟 Stage 1: Metadata divination
+        chorus_logger.info("📜 Consulting the ancient scrolls...")
+        with self.stage_clock.span('metadata'):
+            linguistic_metadata = self.stage_clock.profiled('metadata', self.analyze_metadata)(instrument)
+
+        # 🎭 Stage 2: Voice transcription ritual (or the swift language glance)
+        if voice_transcription is None:
+            chorus_logger.info("🎤 Awakening the digital voices...")
+            voice_transcription = self.inspect_audio(instrument)
+
+        # 🩺 The header probe fills in what the engine left blank (MLX reports no duration)
+        voice_probe = self._probe_voice(instrument)
+        if voice_probe:
+            voice_transcription = {
+                **voice_transcription,
+                'mp3_status': voice_probe['status'],
+                'mp3_duration': voice_probe.get('duration'),
+                'bitrate': voice_probe.get('bitrate'),
+                'sample_rate': voice_probe.get('sample_rate')
+            }
+            if not voice_transcription.get('duration'):
+                voice_transcription['duration'] = voice_probe.get('duration') or 0
+
+        # ⚖️ Stage 3: Harmony assessment
+        chorus_logger.info("⚖️ Balancing cultural truths...")
+        with self.stage_clock.span('compare'):
+            harmony_analysis = self.stage_clock.profiled('compare', self.compare_languages)(
+                linguistic_metadata, voice_transcription
+            )
+
+        # 🌟 Combine all mystical insights
+        complete_musical_note = {
+            **linguistic_metadata,
+            **voice_transcription,
+            **harmony_analysis,
+            'processed_at': datetime.now().isoformat()
+        }
+
+        chorus_logger.info("✅ %s - Harmony: %s", instrument.name, 'ACHIEVED' if harmony_analysis['languages_match'] else 'DISCORD')
+        return complete_musical_note
+
+    def listen_to_many(self, instruments: List[Path], window_count: Optional[int] = None) -> List[Dict]:
+        """
+        🎻 The Staged Performance - Fetch, Decode and Hear in Overlapping Acts
+        ======================================================================
+
+        "An orchestra does not wait for one violinist to finish before the next one
+        tunes. Fetchers gather bytes (and consult the memory vault), a decode pool
+        pours them into listening windows, and the inference ensemble hears them -
+        all at once, each act joined to the next by a short bounded queue. When
+        the ensemble falls behind, the queues fill and the fetchers simply wait,
+        so memory never grows beyond a few files in flight."
+        """
+        if not instruments:
+            return []
+        return asyncio.run(self._staged_performance(instruments, window_count))
+
+    async def _staged_performance(self, instruments: List[Path], window_count: Optional[int]) -> List[Dict]:
+        """🎻 The three acts and their bounded queues; voices return in the order they were written."""
+        performance_loop = asyncio.get_running_loop()
+        heard_voices: List[Optional[Dict]] = [None] * len(instruments)
+
+        waiting_instruments: asyncio.Queue = asyncio.Queue()
+        fetched_voices: asyncio.Queue = asyncio.Queue(maxsize=self.queue_depth)
+        decoded_voices: asyncio.Queue = asyncio.Queue(maxsize=self.queue_depth)
+        for numbered_instrument in enumerate(instruments):
+            waiting_instruments.put_nowait(numbered_instrument)
+
+        fetch_crew = ThreadPoolExecutor(max_workers=self.fetch_concurrency, thread_name_prefix='fetch')
+        decode_crew = ThreadPoolExecutor(max_workers=self.decode_concurrency, thread_name_prefix='decode')
+
+        async def act_one_fetch():
+            while True:
+                index, instrument = await waiting_instruments.get()
+                try:
+                    # 🌐 Pull bytes (remote prefix or local hash) off the event loop
+                    with self.stage_clock.span('fetch'):
+                        await performance_loop.run_in_executor(fetch_crew, self._voice_fingerprint, instrument)
+                        voice_probe = await performance_loop.run_in_executor(fetch_crew, self._probe_voice, instrument)
+                    remembered_voice = self._recall_from_vault(instrument, window_count)
+                    if voice_probe.get('status') in ('empty', 'truncated'):
+                        heard_voices[index] = self._broken_voice(instrument, voice_probe)  # 🩺 no decode, no model
+                    elif remembered_voice is not None:
+                        heard_voices[index] = remembered_voice
+                    else:
+                        await fetched_voices.put((index, instrument))  # ⏸️ waits when decode is behind
+                except Exception as mystical_error:
+                    logger.error("💥 😭 FETCH INTERRUPTED for %s: %s", instrument.name, mystical_error)
+                    heard_voices[index] = self._lost_voice(instrument, mystical_error)
+                finally:
+                    waiting_instruments.task_done()
+
+        async def act_two_decode():
+            while True:
+                index, instrument = await fetched_voices.get()
+                try:
+                    with self.stage_clock.span('decode'):
+                        decoded_voice = await performance_loop.run_in_executor(
+                            decode_crew, self.stage_clock.profiled('decode', self.decode_voice), instrument, window_count
+                        )
+                    await decoded_voices.put((index, instrument, decoded_voice))  # ⏸️ waits when inference is behind
+                except Exception as mystical_error:
+                    logger.error("💥 😭 DECODING INTERRUPTED for %s: %s", instrument.name, mystical_error)
+                    heard_voices[index] = self._lost_voice(instrument, mystical_error)
+                finally:
+                    fetched_voices.task_done()
+
+        async def act_three_hear():
+            while True:
+                index, instrument, decoded_voice = await decoded_voices.get()
+                try:
+                    # 🌙 Only assembled if some voice actually needs a model, then kept standing between performances
+                    inference_ensemble = self._assemble_inference_ensemble()
+                    with self.stage_clock.span('inference'):
+                        if self.segment_seconds is not None:
+                            fresh_voice = await self._hear_in_segments(
+                                instrument, decoded_voice, performance_loop, inference_ensemble
+                            )
+                        elif self.ensemble_size > 1:
+                            fresh_voice = await performance_loop.run_in_executor(
+                                inference_ensemble, _ensemble_performer_hears, (instrument, decoded_voice)
+                            )
+                        else:
+                            fresh_voice = await performance_loop.run_in_executor(
+                                inference_ensemble, self.stage_clock.profiled('inference', self.hear_decoded_voice),
+                                instrument, decoded_voice
+                            )
+                    self._remember_in_vault(instrument, window_count, fresh_voice)
+                    heard_voices[index] = fresh_voice
+                except Exception as mystical_error:
+                    logger.error("💥 😭 HEARING INTERRUPTED for %s: %s", instrument.name, mystical_error)
+                    heard_voices[index] = self._lost_voice(instrument, mystical_error)
+                finally:
+                    decoded_voices.task_done()
+
+        stage_hands = (
+            [asyncio.create_task(act_one_fetch()) for _ in range(self.fetch_concurrency)] +
+            [asyncio.create_task(act_two_decode()) for _ in range(self.decode_concurrency)] +
+            [asyncio.create_task(act_three_hear()) for _ in range(self.ensemble_size)]
+        )
+        try:
+            # 🎬 Each act drains completely before the next act's queue is awaited
+            await waiting_instruments.join()
+            await fetched_voices.join()
+            await decoded_voices.join()
+        finally:
+            for stage_hand in stage_hands:
+                stage_hand.cancel()
+            await asyncio.gather(*stage_hands, return_exceptions=True)
+            fetch_crew.shutdown(wait=True)
+            decode_crew.shutdown(wait=True)
+
+        return heard_voices
+
+    def _assemble_inference_ensemble(self):
+        """🎻 One resident-model process per performer, or a single thread sharing this oracle's model."""
+        if self._standing_ensemble is not None:
+            return self._standing_ensemble
+        if self.ensemble_size <= 1:
+            self._standing_ensemble = ThreadPoolExecutor(max_workers=1, thread_name_prefix='inference')
+            return self._standing_ensemble
+
+        # 🧊 Convert the weights once here, so the performers only map the same file
+        for model_name in self.cascade_tiers or [self.linguistic_alchemist_model]:
+            self.listening_engine.prepare(model_name)
+
+        logger.info("🎻 ✨ ENSEMBLE ASSEMBLED! %d performers × %d threads each",
+                    self.ensemble_size, self.threads_per_performer)
+        # 🧼 'spawn' gives performers a clean slate: no inherited ffmpeg pipes that would keep a decoder waiting for EOF
+        self._standing_ensemble = ProcessPoolExecutor(
+            max_workers=self.ensemble_size,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_awaken_ensemble_performer,
+            initargs=(self.oracle_recipe, self.threads_per_performer, self.chorus_tuning)
+        )
+        return self._standing_ensemble
+
+    def retire_ensemble(self):
+        """🎻 Send the standing performers home once no more performances are coming."""
+        if self._standing_ensemble is not None:
+            self._standing_ensemble.shutdown(wait=True)
+            self._standing_ensemble = None
+
+    def _perform_planned_symphony(self, instruments: List[Path]) -> List[Dict]:
+        """
+        🗺️ The Planned Performance - One Verdict per (Job, Language)
+        ============================================================
+
+        "Why hear the same overture twice? The first chunk is the opening of the
+        full narration, so I listen to the cheapest member of each family first.
+        Only when its voice is hesitant, or its windows argue among themselves,
+        do I summon the full narration and glance at its start, middle and end.
+        The final verdict is then sung for every member of the family."
+        """
+        analysis_families = plan_analysis_groups(instruments)
+        logger.info("🗺️ ✨ PLAN DRAWN! %d files gathered into %d (job, language) families",
+                    len(instruments), len(analysis_families))
+
+        # 🎵 First pass: the cheapest representative of every family
+        first_impressions = self.listen_to_many([family['representative'] for family in analysis_families])
+
+        # 🔍 Which families need a closer listen?
+        hesitant_families = [
+            (family, impression) for family, impression in zip(analysis_families, first_impressions)
+            if self._needs_closer_listen(impression)
+        ]
+        closer_listens = self.listen_to_many(
+            [family['escalation_target'] for family, _ in hesitant_families],
+            window_count=self.escalation_window_count
+        )
+        escalated_verdicts = {
+            id(family): verdict for (family, _), verdict in zip(hesitant_families, closer_listens)
+        }
+        if hesitant_families:
+            logger.info("🔍 %d families escalated for a closer listen", len(hesitant_families))
+
+        # 🎶 Fan each family's verdict back out to every member
+        verdict_for_member = {}
+        for family, impression in zip(analysis_families, first_impressions):
+            escalated_verdict = escalated_verdicts.get(id(family))
+            if escalated_verdict is not None and escalated_verdict.get('status') == 'success':
+                family_verdict, verdict_source, plan_tier = escalated_verdict, family['escalation_target'], 'escalated'
+            else:
+                family_verdict, verdict_source, plan_tier = impression, family['representative'], 'representative'
+
+            for member in family['members']:
+                verdict_for_member[str(member)] = {
+                    **family_verdict,
+                    'file_path': str(member),
+                    'verdict_source': verdict_source.name,
+                    'plan_tier': plan_tier
+                }
+
+        return [self.analyze_file(instrument, voice_transcription=verdict_for_member[str(instrument)])
+                for instrument in instruments]
+
+    def _needs_closer_listen(self, impression: Dict) -> bool:
+        """🔍 Escalate when the glance failed, was unsure, or its windows disagreed."""
+        if impression.get('status') != 'success':
+            return True
+        if impression.get('confidence', 0) < self.family_confidence_threshold:
+            return True
+        window_verdicts = [lang for lang in impression.get('window_languages', '').split(',') if lang]
+        return len(set(window_verdicts)) > 1
+
+    def analyze_instruments(self, instruments: List[Path]) -> List[Dict]:
+        """🎼 Hear every instrument (planned or one by one) and judge its harmony - one result row each."""
+        if self.plan_families:
+            return self._perform_planned_symphony(instruments)
+
+        heard_voices = self.listen_to_many(instruments)
+        self.stage_clock.snapshot('listen')
+        return [
+            self.analyze_file(instrument, voice_transcription=voice)
+            for instrument, voice in zip(instruments, heard_voices)
+        ]
+
+    def daemon_expectations(self) -> Dict[str, str]:
+        """
+        🛎️ What a warm daemon must be running for its rows to match ours: the model variant and
+        every setting that shapes how a voice is decoded and heard. The checks that look across
+        rows (transcript tongue, acoustic twins) are ours, so they are not part of it.
+        """
+        return {
+            'variant': self._vault_variant(),
+            'mode': self.analysis_mode,
+            'vad': str(self.speech_lead_seconds),
+            'segments': str(self.segment_seconds),
+            'candidates': ','.join(self.candidate_tongues or ['all']),
+            'detect_windows': str(self.detection_window_count),
+            'cascade': f"{','.join(self.cascade_tiers)}@{self.cascade_escalation_threshold}" if self.cascade_tiers else 'off',
+            'plan_groups': str(self.plan_families),
+            'group_confidence': str(self.family_confidence_threshold),
+            'escalation_windows': str(self.escalation_window_count),
+            'remote_seconds': str(self.distant_listening_seconds)
+        }
+
+    def process_files_via_daemon(self, daemon: DaemonClient) -> Optional[pd.DataFrame]:
+        """
+        🛎️ The Borrowed Orchestra - Letting a Warm Daemon Do the Hearing
+        ===============================================================
+
+        "Why tune a whole orchestra for two notes? When a warm daemon is already
+        on stage with the same model, I hand it the instruments and only write
+        the chronicle myself. If it is absent or plays a different score, I
+        return nothing and the conductor performs locally."
+        """
+        daemon_health = daemon.health()
+        if daemon_health is None:
+            logger.info("🛎️ No warm daemon answering - performing locally")
+            return None
+
+        mystical_audio_instruments = self.gather_instruments()
+        daemon_sources = [
+            {'url': instrument.url, 'name': instrument.name} if isinstance(instrument, RemoteAudio)
+            else {'path': str(Path(instrument).resolve())}
+            for instrument in mystical_audio_instruments
+        ]
+        try:
+            with self.stage_clock.span('daemon'):
+                orchestral_results = daemon.analyze(daemon_sources, self.daemon_expectations())
+        except ConfigurationMismatch as mismatch:
+            logger.warning("🛎️ Warm daemon plays a different score (%s) - performing locally", mismatch)
+            return None
+
+        logger.info("🛎️ ✨ WARM DAEMON ANSWERED! %d movements from %s (%s)", len(orchestral_results),
+                    daemon_health.get('backend'), daemon_health.get('variant'))
+        # 🧭 The daemon files its rows under the paths it resolved; our chronicle keeps the ones we scanned
+        orchestral_results = [{**movement, 'file_path': str(instrument)}
+                              for instrument, movement in zip(mystical_audio_instruments, orchestral_results)]
+        return self.score_results(orchestral_results)
+
+    def gather_instruments(self) -> List[Path]:
+        """🎵 This run's instruments: scanned, narrowed to our shard, and fingerprinted when echoes are hunted."""
+        with self.stage_clock.span('scan'):
+            mystical_audio_instruments = self.stage_clock.profiled('scan', self.get_audio_files)()
+        self.stage_clock.snapshot('scan')
+
+        if self.shard is not None:
+            # 🧭 Only this node's families; the other shards hear the rest and merge_shards joins them
+            shard_index, shard_count = self.shard
+            every_instrument = len(mystical_audio_instruments)
+            mystical_audio_instruments = [instrument for instrument in mystical_audio_instruments
+                                          if shard_of(instrument, shard_count) == shard_index]
+            logger.info("🧭 Shard %d/%d: %d of %d instruments", shard_index, shard_count,
+                        len(mystical_audio_instruments), every_instrument)
+
+        if self.hunt_acoustic_twins:
+            self.find_acoustic_twins(mystical_audio_instruments)
+        return mystical_audio_instruments
+
     def process_files(self) -> pd.DataFrame:
         """
         🎭 The Grand Linguistic Symphony - Processing the Audio Chorus
@@ -296,43 +1237,216 @@ class AudioLanguageAnalyzer:
         chorus, each transcription a musical note in our harmony of understanding."
         """
         # 🎵 Gather the orchestral instruments
-        mystical_audio_instruments = self.get_audio_files()
-        orchestral_results = []
+        mystical_audio_instruments = self.gather_instruments()
 
         logger.info("🎼 ✨ SYMPHONY BEGINS! Processing %d linguistic instruments", len(mystical_audio_instruments))
+        try:
+            orchestral_results = self.analyze_instruments(mystical_audio_instruments)
+        finally:
+            self.retire_ensemble()
+        if self.shard is not None:
+            self.save_shard_results(mystical_audio_instruments, orchestral_results)
 
-        for instrument in mystical_audio_instruments:
-            logger.info("🎵 Now performing: %s", instrument.name)
+        grand_symphonic_score = self.score_results(orchestral_results)
+        logger.info("🏆 ✨ SYMPHONY COMPLETE! %d movements composed!", len(orchestral_results))
+        self.stage_clock.snapshot('analyze')
+        if self.memory_vault is not None:
+            logger.info("🗄️ Memory vault: %d remembered, %d newly heard", self.memory_vault.hits, self.memory_vault.misses)
+            self.stage_clock.count('cache_hits', self.memory_vault.hits)
+            self.stage_clock.count('cache_misses', self.memory_vault.misses)
+        if self.feature_shelf is not None:
+            logger.info("🧮 Feature shelf: %d reused, %d freshly decoded", self.feature_shelf.hits, self.feature_shelf.misses)
+            self.stage_clock.count('feature_cache_hits', self.feature_shelf.hits)
+            self.stage_clock.count('feature_cache_misses', self.feature_shelf.misses)
+        for movement_status, movements in grand_symphonic_score.get('status', pd.Series(dtype=str)).value_counts().items():
+            self.stage_clock.count(f"files_{movement_status}", int(movements))
 
-            # 🌟 Stage 1: Metadata divination
-            logger.info("📜 Consulting the ancient scrolls...")
-            linguistic_metadata = self.analyze_metadata(instrument)
+        return grand_symphonic_score
 
-            # 🎭 Stage 2: Voice transcription ritual
-            logger.info("🎤 Awakening the digital voices...")
-            voice_transcription = self.transcribe_audio(instrument)
+    def score_results(self, orchestral_results: List[Dict]) -> pd.DataFrame:
+        """🎼 One row per movement, plus the checks that look across rows (transcript tongue, acoustic twins)."""
+        logger.info("🎼 ✨ WEAVING THE FINAL MUSICAL SCORE...")
+        grand_symphonic_score = pd.DataFrame(orchestral_results)
+        if 'transcription' in grand_symphonic_score and not grand_symphonic_score.empty:
+            self.cross_check_transcripts(grand_symphonic_score)
+        if self.hunt_acoustic_twins and not grand_symphonic_score.empty:
+            grand_symphonic_score['acoustic_twins'] = [
+                ','.join(self._acoustic_twins.get(self._echo_key(Path(file_path)), []))
+                for file_path in grand_symphonic_score['file_path']
+            ]
+        return grand_symphonic_score
 
-            # ⚖️ Stage 3: Harmony assessment
-            logger.info("⚖️ Balancing cultural truths...")
-            harmony_analysis = self.compare_languages(linguistic_metadata, voice_transcription)
+    def _shard_settings(self) -> Dict:
+        """🧭 What every shard of one run must agree on, and what the merge needs to finish the score."""
+        return {
+            'mode': self.analysis_mode,
+            'variant': self._vault_variant(),
+            'plan_groups': self.plan_families,
+            'fingerprint': self.hunt_acoustic_twins,
+            'twin_score': self.acoustic_twin_score,
+            'transcript_similarity': self.transcript_similarity
+        }
 
-            # 🌟 Combine all mystical insights
-            complete_musical_note = {
-                **linguistic_metadata,
-                **voice_transcription,
-                **harmony_analysis,
-                'processed_at': datetime.now().isoformat()
-            }
+    def save_shard_results(self, instruments: List[Path], orchestral_results: List[Dict]):
+        """🧭 The raw movements of this shard, exactly as heard, for ``merge_shards`` to reassemble."""
+        shard_index, shard_count = self.shard
+        shard_scroll = {
+            'shard': f"{shard_index}/{shard_count}",
+            **self._shard_settings(),
+            'instruments': [
+                {'path': str(instrument), 'name': instrument.name, 'remote': isinstance(instrument, RemoteAudio)}
+                for instrument in instruments
+            ],
+            'results': orchestral_results
+        }
+        with open(self.digital_chronicle_hall / SHARD_RESULTS_FILENAME, 'w') as scroll:
+            json.dump(shard_scroll, scroll)
+        logger.info("🧭 Shard %d/%d results preserved for merging", shard_index, shard_count)
 
-            orchestral_results.append(complete_musical_note)
-            logger.info("✅ %s - Harmony: %s", instrument.name, 'ACHIEVED' if harmony_analysis['languages_match'] else 'DISCORD')
+    def cross_check_transcripts(self, df: pd.DataFrame, sure_enough: float = 0.8):
+        """
+        🔤 The Scribe's Second Opinion - Reading the Transcript's Own Tongue
+        ===================================================================
 
-        # 🎼 Convert to the grand musical score
-        logger.info("🎼 ✨ WEAVING THE FINAL MUSICAL SCORE...")
-        grand_symphonic_score = pd.DataFrame(orchestral_results)
-        logger.info("🏆 ✨ SYMPHONY COMPLETE! %d movements composed!", len(orchestral_results))
+        "The ear can be fooled; the written word rarely is. Every sentence of every
+        transcript is weighed against character-trigram portraits of our tongues -
+        all of them at once - and any sentence that confidently speaks another
+        tongue than the one the oracle heard is counted as a dissenter."
+        """
+        transcript_sentences, sentence_owners = [], []
+        for row, transcript in enumerate(df['transcription'].fillna('')):
+            sentences = split_sentences(transcript)
+            transcript_sentences.extend(sentences)
+            sentence_owners.extend([row] * len(sentences))
+        if not transcript_sentences:
+            return
+
+        sentence_tongues, sentence_certainty = default_identifier().identify(transcript_sentences)
+        written = pd.DataFrame({
+            'row': sentence_owners,
+            'tongue': sentence_tongues,
+            'certainty': sentence_certainty,
+            'characters': [len(sentence) for sentence in transcript_sentences]
+        })
+        written['heard_tongue'] = df['detected_language'].to_numpy()[written['row']]
+        written['dissents'] = ((written['tongue'] != written['heard_tongue']) & (written['tongue'] != 'unknown')
+                               & (written['certainty'] >= sure_enough))
+
+        # ✍️ The written tongue of a transcript is the one most of its characters are in
+        characters_per_tongue = written.groupby(['row', 'tongue'])['characters'].sum()
+        written_tongue = characters_per_tongue.groupby(level='row').idxmax().str[1]
+        tongue_share = characters_per_tongue.groupby(level='row').max() / written.groupby('row')['characters'].sum()
+        dissenters = written.groupby('row')['dissents'].sum()
+
+        df['text_language'] = written_tongue.reindex(range(len(df)))
+        df['text_language_share'] = tongue_share.round(4).reindex(range(len(df)))
+        df['text_disagreeing_sentences'] = dissenters.reindex(range(len(df))).astype('Int64')
+        df['text_audio_disagreement'] = (df['text_disagreeing_sentences'].fillna(0) > 0).astype(bool)
+        logger.info("🔤 Scribe's second opinion: %d sentences read, %d transcripts disagree with their audio verdict",
+                    len(transcript_sentences), int(df['text_audio_disagreement'].sum()))
+
+    @staticmethod
+    def _echo_key(instrument: Path) -> str:
+        """🫆 The (job, lang) an instrument's fingerprint is filed under."""
+        parsed = parse_sample_name(instrument.name)
+        return fingerprint_key(parsed and parsed['job_id'], parsed and parsed['lang'], instrument)
+
+    def _acoustic_fingerprint(self, instrument: Path) -> Tuple[np.ndarray, np.ndarray]:
+        """🫆 Landmark hashes of the opening FINGERPRINT_SECONDS of one voice."""
+        opening = decode_windows(self._audio_payload(instrument), [0.0], int(FINGERPRINT_SECONDS * SAMPLE_RATE))[0]
+        return spectral_peak_hashes(opening)
+
+    def find_acoustic_twins(self, instruments: List[Path]) -> List[Dict]:
+        """
+        🫆 The Echo Hunt - Catching One Narration Filed Under Two Tongues
+        ================================================================
 
-        return grand_symphonic_score
+        "A Spanish scroll that sounds exactly like its English sibling needs no
+        oracle to convict it. I press a fingerprint of each (job, language) into
+        the library's index - kept beside the chronicles, so unchanged voices are
+        never pressed twice - and ask the index who else shares those marks."
+
+        Only the same render echoes; a fresh TTS render of the same script does
+        not, and is caught by the transcript clusters instead.
+        """
+        library_path = self.digital_chronicle_hall / FINGERPRINT_INDEX_FILENAME
+        echo_library = FingerprintIndex.load(library_path) if library_path.exists() else FingerprintIndex()
+
+        unpressed_families = []
+        for family in plan_analysis_groups(instruments):
+            echo_key = self._echo_key(family['representative'])
+            voice_hash = self._voice_fingerprint(family['representative'])
+            if not echo_library.has(echo_key, voice_hash):
+                unpressed_families.append((echo_key, voice_hash, family))
+
+        with self.stage_clock.span('fingerprint'):
+            with ThreadPoolExecutor(max_workers=self.decode_concurrency, thread_name_prefix='fingerprint') as press_crew:
+                pressed_marks = press_crew.map(
+                    self.stage_clock.profiled('fingerprint', self._acoustic_fingerprint),
+                    [family['representative'] for _, _, family in unpressed_families]
+                )
+                for (echo_key, voice_hash, family), (landmarks, landmark_frames) in zip(unpressed_families, pressed_marks):
+                    echo_library.add(echo_key, landmarks, landmark_frames, job_id=family['job_id'], lang=family['lang'],
+                                     file_path=str(family['representative']), sha256=voice_hash)
+            echo_library.save(library_path)
+        logger.info("🫆 Echo library: %d voices (%d newly pressed)", len(echo_library), len(unpressed_families))
+        return self.judge_acoustic_echoes(echo_library)
+
+    def judge_acoustic_echoes(self, echo_library: FingerprintIndex) -> List[Dict]:
+        """🫆 Ask the index for echoing pairs, remember the cross-language ones and write acoustic_duplicates.csv."""
+        with self.stage_clock.span('fingerprint'):
+            acoustic_echoes = echo_library.duplicates(self.acoustic_twin_score)
+        logger.info("🫆 %d echoing pairs among %d voices", len(acoustic_echoes), len(echo_library))
+
+        self._acoustic_twins = {}
+        for echo in acoustic_echoes:
+            if echo['same_job'] and echo['lang_a'] != echo['lang_b']:
+                logger.warning("🫆 🚨 Job %s: '%s' and '%s' are the same recording (score %.2f)",
+                               echo['job_id_a'], echo['lang_a'], echo['lang_b'], echo['score'])
+                self._acoustic_twins.setdefault(echo['key_a'], []).append(echo['lang_b'])
+                self._acoustic_twins.setdefault(echo['key_b'], []).append(echo['lang_a'])
+        self.stage_clock.count('cross_language_duplicates', sum(len(twins) for twins in self._acoustic_twins.values()) // 2)
+
+        pd.DataFrame(acoustic_echoes, columns=[
+            'key_a', 'job_id_a', 'lang_a', 'key_b', 'job_id_b', 'lang_b', 'same_job', 'score',
+            'aligned_landmarks', 'offset_seconds'
+        ]).to_csv(self.digital_chronicle_hall / 'acoustic_duplicates.csv', index=False)
+        return acoustic_echoes
+
+    def cluster_transcripts(self, df: pd.DataFrame) -> List[Dict]:
+        """
+        🧬 The Echoing Scripts - Finding Transcripts That Say the Same Thing
+        ====================================================================
+
+        "An English sermon read under a Spanish name still reads like its English
+        twin. I press every transcript into a MinHash signature, let the LSH
+        buckets name the few pairs worth reading twice, and gather the echoes
+        into clusters - the library's index kept beside the chronicles."
+        """
+        library_path = self.digital_chronicle_hall / TRANSCRIPT_INDEX_FILENAME
+        script_library = TranscriptIndex.load(library_path) if library_path.exists() else TranscriptIndex()
+        for voice in df.to_dict('records'):
+            parsed = parse_sample_name(Path(voice['file_path']).name) or {}
+            script_library.add(
+                voice['file_path'], voice.get('transcription') if isinstance(voice.get('transcription'), str) else '',
+                job_id=parsed.get('job_id'), lang=parsed.get('lang'),
+                claimed_language=voice.get('claimed_language'), detected_language=voice.get('detected_language'),
+                post_id=None if pd.isna(voice.get('post_id')) else int(voice['post_id'])
+            )
+        script_library.save(library_path)
+
+        # 🪞 A chunk echoing its own full narration is expected, not news
+        echo_clusters = script_library.clusters(
+            self.transcript_similarity,
+            keep_pair=lambda first, second: not (first['job_id'] and (first['job_id'], first['lang']) == (second['job_id'], second['lang']))
+        )
+        for echo_cluster in echo_clusters:
+            echo_cluster['languages'] = sorted({member['lang'] or member['claimed_language'] or 'unknown'
+                                                for member in echo_cluster['members']})
+            echo_cluster['cross_language'] = len(echo_cluster['languages']) > 1
+        logger.info("🧬 Script library: %d transcripts, %d echoing clusters (%d across languages)",
+                    len(script_library), len(echo_clusters), sum(cluster['cross_language'] for cluster in echo_clusters))
+        return echo_clusters
 
     def generate_report(self, df: pd.DataFrame):
         """
@@ -355,40 +1469,234 @@ class AudioLanguageAnalyzer:
             (df['detected_language'] != 'unknown')
         ])
 
+        # 🧬 Transcripts that echo one another, across languages or across posts
+        echo_clusters = None
+        if 'transcription' in df and df['transcription'].fillna('').str.strip().any():
+            echo_clusters = self.cluster_transcripts(df)
+            echo_numbers = cluster_label(echo_clusters)
+            df['transcript_cluster'] = pd.array([echo_numbers.get(path) for path in df['file_path']], dtype='Int64')
+            with open(self.digital_chronicle_hall / 'transcript_clusters.json', 'w') as echo_scroll:
+                json.dump(echo_clusters, echo_scroll, indent=2)
+
         # 📊 The Grand Statistical Prophecy
         mystical_summary = {
             'total_files_analyzed': total_symphonic_movements,
             'mismatched_languages': discordant_movements,
             'english_claimed_but_not_detected': english_illusions_shattered,
+            'no_speech_files': int((df['status'] == 'no_speech').sum()) if 'status' in df else 0,
+            'broken_mp3_files': int(df['status'].isin(['empty', 'truncated']).sum()) if 'status' in df else 0,
+            **({'cross_language_duplicate_files': int((df['acoustic_twins'] != '').sum())} if 'acoustic_twins' in df else {}),
+            **({'text_audio_disagreements': int(df['text_audio_disagreement'].sum())}
+               if 'text_audio_disagreement' in df else {}),
+            **({'transcript_clusters': len(echo_clusters),
+                'cross_language_transcript_clusters': sum(cluster['cross_language'] for cluster in echo_clusters)}
+               if echo_clusters is not None else {}),
             'match_rate': (total_symphonic_movements - discordant_movements) / total_symphonic_movements if total_symphonic_movements > 0 else 0,
             'generated_at': datetime.now().isoformat()
         }
 
+        # 🗃️ The detailed musical score - verdicts indexed, transcripts in their own table
+        logger.info("📊 Archiving the detailed musical score...")
+        score_families = [parse_sample_name(Path(file_path).name) or {} for file_path in df['file_path']]
+        score_archive = AnalysisStore(self.digital_chronicle_hall / STORE_FILENAME)
+        mystical_summary['run_id'] = score_archive.record_run(
+            df, mystical_summary, settings=self.archived_settings or self._shard_settings(),
+            job_ids=[family.get('job_id') for family in score_families],
+            langs=[family.get('lang') for family in score_families]
+        )
+        for view_format in self.export_views:
+            for view, view_name in VIEW_FILENAMES.items():
+                score_archive.export(view, self.digital_chronicle_hall / f"{view_name}.{view_format}",
+                                     mystical_summary['run_id'])
+        score_archive.close()
+
         # 💾 Preserve the sacred chronicles
         logger.info("💾 Inscribing the mystical summary...")
         with open(self.digital_chronicle_hall / 'analysis_summary.json', 'w') as sacred_scroll:
             json.dump(mystical_summary, sacred_scroll, indent=2)
 
-        logger.info("📊 Crafting the detailed musical score...")
-        df.to_csv(self.digital_chronicle_hall / 'detailed_analysis.csv', index=False)
-        df.to_json(self.digital_chronicle_hall / 'detailed_analysis.json', orient='records', indent=2)
-
         # 🌐 The Language Distribution Constellation
         logger.info("🌟 Mapping the linguistic constellations...")
         language_galaxies = df.groupby(['claimed_language', 'detected_language']).size().reset_index(name='count')
         language_galaxies.to_csv(self.digital_chronicle_hall / 'language_distribution.csv', index=False)
 
-        # 🎭 The Discord Report - where harmonies failed
-        mystical_discords = df[~df['languages_match']].copy()
-        if not mystical_discords.empty:
-            logger.info("🎭 Documenting the mystical discords...")
-            mystical_discords.to_csv(self.digital_chronicle_hall / 'language_mismatches.csv', index=False)
+        # 🧩 The Passage Timeline - which tongue each stretch of a segmented narration speaks
+        if 'language_timeline' in df:
+            passage_timeline = [
+                {'file_path': file_path, **passage}
+                for file_path, timeline in zip(df['file_path'], df['language_timeline'])
+                if isinstance(timeline, str) for passage in json.loads(timeline)
+            ]
+            pd.DataFrame(passage_timeline).to_csv(self.digital_chronicle_hall / 'language_timeline.csv', index=False)
 
         logger.info("🏛️ ✨ CHRONICLE COMPLETE! Sacred wisdom preserved in %s", self.digital_chronicle_hall)
         logger.info("📜 Mystical Summary: %s", mystical_summary)
 
         return mystical_summary
 
+class WarmOracleService:
+    """
+    🛎️ The Warm Oracle - A Resident Analyzer Behind a Socket
+    =======================================================
+
+    "I keep the voice master awake between audiences. Paths, URLs or raw bytes
+    arrive over the socket, one audience at a time, and leave as the very same
+    result rows the chronicle would hold."
+    """
+
+    def __init__(self, oracle: AudioLanguageAnalyzer):
+        self.oracle = oracle
+        self.awakened_at = time.time()
+        self.audiences_served = 0
+        self._stage_lock = threading.Lock()  # 🔒 The model, cache and ensemble take one audience at a time
+
+    def health(self) -> Dict:
+        return {
+            'status': 'ready',
+            'backend': self.oracle.listening_engine.name,
+            'model': self.oracle.linguistic_alchemist_model,
+            'mode': self.oracle.analysis_mode,
+            **self.oracle.daemon_expectations(),
+            'uptime_seconds': round(time.time() - self.awakened_at, 1),
+            'requests_served': self.audiences_served
+        }
+
+    def _check_expectations(self, expect: Dict):
+        for expectation, wanted in expect.items():
+            running = self.oracle.daemon_expectations().get(expectation)
+            if running is not None and str(wanted) != running:
+                raise ConfigurationMismatch(f"{expectation}: daemon runs {running!r}, request wants {wanted!r}")
+
+    def analyze(self, sources: List[Dict], expect: Dict) -> Dict:
+        self._check_expectations(expect)
+        instruments = []
+        for source in sources:
+            if 'url' in source:
+                instruments.append(RemoteAudio(source['url'], source.get('name') or source['url'],
+                                               self.oracle.distant_listening_seconds, storage_headers()))
+            elif Path(source['path']).is_file():
+                instruments.append(Path(source['path']))
+            else:
+                raise ValueError(f"not a file on the daemon's host: {source['path']}")
+        return self._perform(instruments)
+
+    def analyze_bytes(self, data: bytes, name: str, expect: Dict) -> Dict:
+        self._check_expectations(expect)
+        if not data:
+            raise ValueError('empty audio body')
+        with tempfile.TemporaryDirectory(prefix='warm-oracle-') as cloakroom:
+            delivered_voice = Path(cloakroom) / Path(name).name
+            delivered_voice.write_bytes(data)
+            return self._perform([delivered_voice])
+
+    def _perform(self, instruments: List[Path]) -> Dict:
+        started = time.perf_counter()
+        with self._stage_lock:
+            orchestral_results = self.oracle.analyze_instruments(instruments)
+            self.audiences_served += 1
+        return {'results': orchestral_results, 'elapsed_seconds': round(time.perf_counter() - started, 4)}
+
+
+def merge_shards(shard_dirs: List[str], output_dir: str,
+                 export_views: Optional[List[str]] = None) -> Tuple[AudioLanguageAnalyzer, pd.DataFrame]:
+    """
+    🧭 The Reunion - Many Shards, One Chronicle
+    ===========================================
+
+    "Each node heard its own families; none of them heard the whole choir. I
+    gather their raw movements, put them back in the order a single run would
+    have heard them, join their echo libraries, and only then judge what looks
+    across files - so the chronicle reads as if one oracle had sung it all."
+
+    Raises ``ValueError`` when the shards disagree on their settings or do not
+    cover 1/n … n/n exactly once.
+    """
+    shard_scrolls = []
+    for shard_dir in shard_dirs:
+        with open(Path(shard_dir) / SHARD_RESULTS_FILENAME) as scroll:
+            shard_scrolls.append(json.load(scroll))
+
+    shard_settings = [{setting: scroll[setting] for setting in scroll if setting not in ('shard', 'instruments', 'results')}
+                      for scroll in shard_scrolls]
+    if any(settings != shard_settings[0] for settings in shard_settings):
+        raise ValueError(f"shards were analyzed with different settings: {shard_settings}")
+    shard_numbers = sorted(parse_shard(scroll['shard']) for scroll in shard_scrolls)
+    shard_count = shard_numbers[0][1]
+    if shard_numbers != [(shard_index, shard_count) for shard_index in range(1, shard_count + 1)]:
+        raise ValueError(f"need shards 1/{shard_count} … {shard_count}/{shard_count} exactly once, got "
+                         f"{', '.join(f'{index}/{count}' for index, count in shard_numbers)}")
+
+    settings = shard_settings[0]
+    oracle = AudioLanguageAnalyzer(None, output_dir, mode=settings['mode'], result_cache='off', backend=None,
+                                   fingerprint=settings['fingerprint'], twin_score=settings['twin_score'],
+                                   transcript_similarity=settings['transcript_similarity'], export_views=export_views)
+    oracle.archived_settings = settings
+
+    # 🎼 Back into the order a single run scans them in (sorted paths, or sorted names for distant voices)
+    movements = [
+        (RemoteAudio(instrument['path'], instrument['name']) if instrument['remote'] else Path(instrument['path']), result)
+        for scroll in shard_scrolls for instrument, result in zip(scroll['instruments'], scroll['results'])
+    ]
+    movements.sort(key=lambda movement: movement[0])
+    logger.info("🧭 ✨ %d SHARDS REUNITED! %d movements", shard_count, len(movements))
+
+    if oracle.hunt_acoustic_twins:
+        echo_library = FingerprintIndex()
+        for shard_dir in shard_dirs:
+            shard_library = Path(shard_dir) / FINGERPRINT_INDEX_FILENAME
+            if shard_library.exists():
+                echo_library.update(FingerprintIndex.load(shard_library))
+        echo_library.save(oracle.digital_chronicle_hall / FINGERPRINT_INDEX_FILENAME)
+        oracle.judge_acoustic_echoes(echo_library)
+
+    return oracle, oracle.score_results([result for _, result in movements])
+
+
+def serve_warm_oracle(oracle: AudioLanguageAnalyzer, socket_path: Optional[str], port: Optional[int]):
+    """🛎️ Wake the model now, then answer requests until interrupted."""
+    oracle.summon_voice_master((oracle.cascade_tiers or [oracle.linguistic_alchemist_model])[0])
+    warm_server = make_server(WarmOracleService(oracle), socket_path=socket_path, port=port)
+    logger.info("🛎️ ✨ WARM ORACLE LISTENING on %s", f"http://127.0.0.1:{port}" if port else socket_path)
+    try:
+        warm_server.serve_forever()
+    except KeyboardInterrupt:
+        logger.info("🌙 Warm oracle bids the audience goodnight")
+    finally:
+        warm_server.server_close()
+        oracle.retire_ensemble()
+        if port is None and os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+
+# 🎻 The Ensemble Performer's Private Oracle (one per worker process)
+_ensemble_oracle: Optional['AudioLanguageAnalyzer'] = None
+
+
+def _awaken_ensemble_performer(oracle_recipe: Dict, threads_per_performer: int, chorus_tuning: Tuple[bool, int]):
+    """🎻 Worker initializer: pin the thread count, then summon this performer's oracle once."""
+    global _ensemble_oracle
+    tune_chorus(*chorus_tuning)
+
+    # 🧵 Pin the computational forge's threads before torch ever awakens
+    for thread_knob in ('OMP_NUM_THREADS', 'MKL_NUM_THREADS', 'OPENBLAS_NUM_THREADS'):
+        os.environ[thread_knob] = str(threads_per_performer)
+    try:
+        import torch
+        torch.set_num_threads(threads_per_performer)
+    except ImportError:
+        pass  # 🌙 torch-free engines read the thread knobs above
+
+    _ensemble_oracle = AudioLanguageAnalyzer(**oracle_recipe)
+    # 🧙‍♂️ Load the (first) model once, up front; higher cascade tiers wake only if needed
+    _ensemble_oracle.summon_voice_master((_ensemble_oracle.cascade_tiers or [_ensemble_oracle.linguistic_alchemist_model])[0])
+
+
+def _ensemble_performer_hears(task: Tuple[Path, Dict]) -> Dict:
+    """🎵 Worker task: hear one already-decoded voice with this process's resident oracle."""
+    audio_path, decoded_voice = task
+    return _ensemble_oracle.hear_decoded_voice(audio_path, decoded_voice)
+
+
 def main():
     """
     🎭 The Grand Orchestral Conductor - Main Performance Entry Point
@@ -402,33 +1710,218 @@ def main():
     parser = argparse.ArgumentParser(
         description='🎭 The Mystical Audio Oracle - Linguistic Symphony Conductor'
     )
-    parser.add_argument('--input-dir', required=True,
-                       help='🏰 The enchanted audio sanctuary containing voice treasures')
+    voice_origins = parser.add_mutually_exclusive_group(required=True)
+    voice_origins.add_argument('--input-dir',
+                               help='🏰 The enchanted audio sanctuary containing voice treasures')
+    voice_origins.add_argument('--audio-jobs',
+                               help='🌐 An audio_jobs JSON export; audio_urls are read straight from storage')
+    voice_origins.add_argument('--audio-urls',
+                               help='🌐 A text file with one audio URL per line')
+    voice_origins.add_argument('--serve', action='store_true',
+                               help='🛎️ Run as a warm daemon: keep the model loaded and answer requests')
+    voice_origins.add_argument('--merge-shards', nargs='+', metavar='SHARD_DIR',
+                               help='🧭 Join the output directories of a --shard run into one chronicle (no model needed)')
     parser.add_argument('--output-dir', required=True,
                        help='📚 The hall of linguistic wisdom where chronicles shall be preserved')
+    parser.add_argument('--shard', default=None, metavar='I/N',
+                       help='🧭 Hear only shard I of N (1-based), split by a stable hash of (job, language)')
     parser.add_argument('--whisper-model', default='base',
                        choices=['tiny', 'base', 'small', 'medium', 'large'],
                        help='🧙‍♂️ The voice transformation master model (default: base)')
+    parser.add_argument('--detect-only', action='store_true',
+                       help='🔮 Skip full transcription; run language detection on log-mel windows only')
+    parser.add_argument('--detect-windows', type=int, default=1,
+                       help='⏳ Number of evenly spaced 30s windows to sample in detect-only mode (default: 1)')
+    parser.add_argument('--candidate-languages', default=','.join(DEFAULT_CANDIDATE_LANGUAGES),
+                       help='🌐 Comma-separated languages detection may choose from, or "all" (default: en,es,hi)')
+    parser.add_argument('--workers', type=int, default=1,
+                       help='🎻 Number of worker processes, each with its own resident model (default: 1)')
+    parser.add_argument('--threads-per-worker', type=int, default=None,
+                       help='🧵 Torch threads per worker (default: CPU cores divided by workers)')
+    parser.add_argument('--fetch-concurrency', type=int, default=8,
+                       help='🌐 Concurrent fetchers reading and hashing audio (default: 8)')
+    parser.add_argument('--decode-workers', type=int, default=2,
+                       help='🎧 Concurrent ffmpeg decoders (default: 2)')
+    parser.add_argument('--queue-depth', type=int, default=4,
+                       help='⏸️ Voices allowed to wait between pipeline stages before upstream pauses (default: 4)')
+    parser.add_argument('--remote-seconds', type=float, default=DEFAULT_PREFIX_SECONDS,
+                       help=f'⏳ Seconds fetched (HTTP Range) from the start of each remote file (default: {DEFAULT_PREFIX_SECONDS})')
+    parser.add_argument('--no-vad', action='store_true',
+                       help='🗣️ Do not trim silence/music before detection or short-circuit voiceless files')
+    parser.add_argument('--vad-lead-seconds', type=float, default=15.0,
+                       help='🗣️ How far into each window to look for the first speech (default: 15)')
+    parser.add_argument('--segment-seconds', type=float, default=None,
+                       help='🧩 Transcribe each file as ~N-second passages cut at pauses, spread over --workers, '
+                            'with a per-passage language timeline')
+    parser.add_argument('--fingerprint', action='store_true',
+                       help='🫆 Fingerprint each (job, language) first and flag languages that are the same recording '
+                            '(re-encodes of one render; separate renders of one text need the transcript clusters)')
+    parser.add_argument('--fingerprint-only', action='store_true',
+                       help='🫆 Only the fingerprint check - no Whisper; writes acoustic_duplicates.csv')
+    parser.add_argument('--twin-score', type=float, default=DEFAULT_MATCH_SCORE,
+                       help=f'🫆 Share of time-aligned landmarks that makes two recordings the same (default: {DEFAULT_MATCH_SCORE})')
+    parser.add_argument('--transcript-similarity', type=float, default=DEFAULT_SIMILARITY,
+                       help=f'🧬 Estimated Jaccard similarity at which two transcripts count as the same text '
+                            f'(default: {DEFAULT_SIMILARITY}); clusters go to transcript_clusters.json')
+    parser.add_argument('--backend', default='auto', choices=['auto', *BACKENDS],
+                       help='🧠 Inference engine (default: auto - the fastest installed: '
+                            + ', '.join(available_backends() or ['none']) + ')')
+    parser.add_argument('--cascade',
+                       help='🪜 Comma-separated model tiers for detect-only mode, cheapest first (e.g. tiny,base,small)')
+    parser.add_argument('--escalate-below', type=float, default=0.85,
+                       help='🪜 Move up a cascade tier when the top language probability is below this (default: 0.85)')
+    parser.add_argument('--plan-groups', action='store_true',
+                       help='🗺️ Analyze one representative per (job, language) and fan the verdict out (needs --detect-only)')
+    parser.add_argument('--group-confidence', type=float, default=0.8,
+                       help='🔍 Escalate a family to its full file when the representative is below this confidence (default: 0.8)')
+    parser.add_argument('--escalation-windows', type=int, default=3,
+                       help='⏳ Windows (start … middle … end) sampled when a family is escalated (default: 3)')
+    vault_switches = parser.add_mutually_exclusive_group()
+    vault_switches.add_argument('--no-cache', action='store_true',
+                                help='🌙 Neither read nor write the result cache')
+    vault_switches.add_argument('--rebuild-cache', action='store_true',
+                                help='🔁 Ignore cached results but store fresh ones')
+    parser.add_argument('--cache-max-mb', type=float, default=DEFAULT_CACHE_MAX_MB,
+                       help=f'🗄️ Result cache size cap before LRU eviction (default: {DEFAULT_CACHE_MAX_MB})')
+    parser.add_argument('--feature-cache', default=None,
+                       help='🧮 Directory of cached log-mel features for --detect-only '
+                            '(default: $WHISPER_FEATURE_CACHE or ~/.cache/whisper-features)')
+    parser.add_argument('--no-feature-cache', action='store_true',
+                       help='🌙 Decode every file afresh and keep no features')
+    parser.add_argument('--feature-cache-mb', type=float, default=DEFAULT_FEATURE_CACHE_MAX_MB,
+                       help=f'🧮 Feature cache size cap before LRU eviction (default: {DEFAULT_FEATURE_CACHE_MAX_MB})')
+    parser.add_argument('--export-views', nargs='+', choices=['csv', 'json'], default=[], metavar='FORMAT',
+                       help=f'📤 Also write detailed_analysis and language_mismatches as csv and/or json views '
+                            f'(the run itself always lands in <output-dir>/{STORE_FILENAME})')
+    parser.add_argument('--via-daemon', action='store_true',
+                       help='🛎️ Hand the files to a running warm daemon; analyse locally if none answers')
+    parser.add_argument('--daemon-socket', default=DEFAULT_SOCKET_PATH,
+                       help=f'🛎️ The daemon\'s UNIX socket (default: {DEFAULT_SOCKET_PATH})')
+    parser.add_argument('--daemon-port', type=int, default=None,
+                       help='🛎️ Use localhost HTTP on this port instead of the UNIX socket')
+    parser.add_argument('--metrics-textfile', default=None,
+                       help=f'📈 Where to write the OpenMetrics textfile, e.g. node_exporter\'s textfile directory '
+                            f'(default: <output-dir>/{OPENMETRICS_FILENAME})')
+    parser.add_argument('--profile', action='store_true',
+                       help='🔬 Capture per-stage cProfile and tracemalloc snapshots into <output-dir>/profile '
+                            '(inference is profiled in-process only with --workers 1)')
+    parser.add_argument('--quiet', action='store_true',
+                       help='🤫 Drop the per-file log lines; keep progress, warnings and errors')
+    parser.add_argument('--log-every', type=int, default=1,
+                       help='🎵 Log only every Nth per-file line of each kind (default: 1 = all)')
 
     # 🎭 The performance begins...
     args = parser.parse_args()
+    tune_chorus(args.quiet, args.log_every)
+    if args.plan_groups and not args.detect_only:
+        parser.error('--plan-groups fans a language verdict out to whole families and needs --detect-only')
+    if args.segment_seconds and args.detect_only:
+        parser.error('--segment-seconds splits a full transcription and cannot be combined with --detect-only')
+    if args.cascade and not args.detect_only:
+        parser.error('--cascade decides on language probabilities and needs --detect-only')
+    try:
+        shard = parse_shard(args.shard) if args.shard else None
+    except ValueError as shard_error:
+        parser.error(f'--shard expects I/N with 1 <= I <= N: {shard_error}')
+    if shard and (args.serve or args.via_daemon):
+        parser.error('--shard splits a batch run and cannot be combined with --serve or --via-daemon')
+    if shard and args.fingerprint_only:
+        # 🫆 Shards split a job's languages across nodes, so no node would hold both halves of a twin
+        parser.error('--shard splits (job, language) families and cannot be combined with --fingerprint-only')
+
+    if args.merge_shards:
+        # 🧭 The reunion needs no model: raw movements in, the single-run chronicle out
+        try:
+            analyzer, results_df = merge_shards(args.merge_shards, args.output_dir, args.export_views)
+        except (OSError, ValueError) as merge_error:
+            logger.error("💥 😭 THE SHARDS WOULD NOT REUNITE: %s", merge_error)
+            sys.exit(1)
+        summary = analyzer.generate_report(results_df)
+        print("🧭 %d shards merged: %d voice treasures, match rate %.1f" % (
+            len(args.merge_shards), summary['total_files_analyzed'], summary['match_rate']))
+        print("💾 Sacred chronicles preserved in: %s" % args.output_dir)
+        return
 
     # 🌟 Summon the mystical audio oracle
     logger.info("🎭 ✨ THE MYSTICAL AUDIO ORACLE AWAKENS!")
-    logger.info("🏰 Exploring audio sanctuary: %s", args.input_dir)
+    logger.info("🏰 Exploring audio sanctuary: %s", args.input_dir or args.audio_jobs or args.audio_urls)
     logger.info("📚 Wisdom hall destination: %s", args.output_dir)
     logger.info("🧙‍♂️ Voice master: %s", args.whisper_model)
 
-    analyzer = AudioLanguageAnalyzer(args.input_dir, args.output_dir, args.whisper_model)
+    candidate_languages = None if args.candidate_languages == 'all' else [
+        lang.strip() for lang in args.candidate_languages.split(',') if lang.strip()
+    ]
+    analyzer = AudioLanguageAnalyzer(
+        args.input_dir, args.output_dir, args.whisper_model,
+        mode='detect' if args.detect_only else 'transcribe',
+        candidate_languages=candidate_languages,
+        detect_windows=args.detect_windows,
+        workers=args.workers,
+        threads_per_worker=args.threads_per_worker,
+        result_cache='off' if args.no_cache else 'rebuild' if args.rebuild_cache else 'use',
+        cache_max_mb=args.cache_max_mb,
+        plan_groups=args.plan_groups,
+        group_confidence=args.group_confidence,
+        escalation_windows=args.escalation_windows,
+        audio_jobs_file=args.audio_jobs,
+        audio_urls_file=args.audio_urls,
+        remote_seconds=args.remote_seconds,
+        fetch_concurrency=args.fetch_concurrency,
+        decode_workers=args.decode_workers,
+        queue_depth=args.queue_depth,
+        cascade=[tier.strip() for tier in args.cascade.split(',') if tier.strip()] if args.cascade else None,
+        escalate_below=args.escalate_below,
+        backend=None if args.fingerprint_only else args.backend,  # 🫆 Echoes are heard without a model
+        profile_dir=Path(args.output_dir) / 'profile' if args.profile else None,
+        quiet_chorus=args.quiet,
+        chorus_every=args.log_every,
+        speech_lead_seconds=None if args.no_vad else args.vad_lead_seconds,
+        segment_seconds=args.segment_seconds,
+        fingerprint=args.fingerprint or args.fingerprint_only,
+        twin_score=args.twin_score,
+        transcript_similarity=args.transcript_similarity,
+        feature_cache=None if args.no_feature_cache else args.feature_cache or feature_cache_dir(),
+        feature_cache_max_mb=args.feature_cache_mb,
+        shard=shard,
+        export_views=args.export_views
+    )
+
+    if args.serve:
+        serve_warm_oracle(analyzer, args.daemon_socket, args.daemon_port)
+        return
+
+    if args.fingerprint_only:
+        acoustic_echoes = analyzer.find_acoustic_twins(analyzer.get_audio_files())
+        cross_language_echoes = [echo for echo in acoustic_echoes if echo['same_job'] and echo['lang_a'] != echo['lang_b']]
+        analyzer.stage_clock.write_summary(Path(args.output_dir) / SUMMARY_FILENAME,
+                                           generated_at=datetime.now().isoformat(), mode='fingerprint')
+        print("🫆 Echoing pairs: %d (same job, different language: %d)" % (len(acoustic_echoes), len(cross_language_echoes)))
+        print("💾 acoustic_duplicates.csv preserved in: %s" % args.output_dir)
+        return
 
     # 🎼 The grand symphony performance
     logger.info("🎼 ✨ COMMENCING THE LINGUISTIC SYMPHONY...")
-    results_df = analyzer.process_files()
+    results_df = None
+    if args.via_daemon:
+        results_df = analyzer.process_files_via_daemon(DaemonClient(args.daemon_socket, args.daemon_port))
+    if results_df is None:
+        results_df = analyzer.process_files()
 
     # 📜 The final chronicle
     
     logger.info("📜 ✨ WEAVING THE SACRED CHRONICLES...")
-    summary = analyzer.generate_report(results_df)
+    with analyzer.stage_clock.span('report'):
+        summary = analyzer.stage_clock.profiled('report', analyzer.generate_report)(results_df)
+    analyzer.stage_clock.snapshot('report')
+
+    # ⏱️ Per-stage latencies and counters: JSON for people and the benchmark suite, a textfile for node_exporter
+    run_labels = {'backend': analyzer.listening_engine.name, 'model': args.whisper_model,
+                  'mode': 'detect' if args.detect_only else 'transcribe'}
+    analyzer.stage_clock.write_summary(Path(args.output_dir) / SUMMARY_FILENAME,
+                                       generated_at=datetime.now().isoformat(), **run_labels)
+    analyzer.stage_clock.write_openmetrics(args.metrics_textfile or Path(args.output_dir) / OPENMETRICS_FILENAME,
+                                           labels=run_labels)
+    analyzer.stage_clock.write_profiles()
 
     # 🎉 Triumphant conclusion
     print("\n" + "🎭" + "="*48 + "🎭")
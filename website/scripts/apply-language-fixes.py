@@ -1,4 +1,4 @@
-sn #!/usr/bin/env python3
+#!/usr/bin/env python3
 """
 Apply Language Metadata Fixes to Supabase Database
 ==================================================
@@ -6,6 +6,13 @@ Apply Language Metadata Fixes to Supabase Database
 This script applies the language metadata fixes identified by the analysis.
 It updates the database records to correct incorrect language labels.
 
+With --store, the fixes are queried from the analysis store (analysis.sqlite),
+where generate-language-fix-plan.py recorded them next to the run's verdicts;
+job ids come straight from the store instead of being parsed from file paths.
+
+With --delta, only the items of an incremental plan's fix_plan_delta.csv are
+applied: new, changed and retry items. Resolved items are only reported.
+
 Requirements:
 - requests
 - pandas
@@ -13,6 +20,8 @@ Requirements:
 
 Usage:
 python scripts/apply-language-fixes.py --fix-plan ./fix-plan
+python scripts/apply-language-fixes.py --fix-plan ./fix-plan --store ./analysis/analysis.sqlite
+python scripts/apply-language-fixes.py --fix-plan ./fix-plan --delta
 """
 
 import argparse
@@ -28,6 +37,8 @@ import pandas as pd
 import requests
 from dotenv import load_dotenv
 
+from audio_analysis.analysis_store import AnalysisStore
+
 # Load environment variables
 load_dotenv()
 
@@ -53,6 +64,34 @@ class LanguageFixer:
         print(f"Loaded {len(df)} fixes to apply")
         return df
 
+    def load_fix_plan_delta(self, fix_plan_dir: str) -> pd.DataFrame:
+        """Load the new, changed and retry items of an incremental plan"""
+        delta_path = Path(fix_plan_dir) / 'fix_plan_delta.csv'
+        if not delta_path.exists():
+            raise FileNotFoundError(f"Fix plan delta not found: {delta_path} (generate the plan with --incremental)")
+
+        delta = pd.read_csv(delta_path, dtype={'job_id': object, 'lang': object})
+        resolved = delta['change'] == 'resolved'
+        df = delta[~resolved].reset_index(drop=True)
+        print(f"Loaded {len(df)} fixes to apply from the delta "
+              f"({', '.join(f'{count} {change}' for change, count in df['change'].value_counts().items()) or 'nothing new'}; "
+              f"{int(resolved.sum())} resolved)")
+        return df
+
+    def load_fix_plan_from_store(self, store_path: str, run_id: Optional[int] = None) -> pd.DataFrame:
+        """Load the fix items recorded for a run (default: latest) in the analysis store"""
+        if not Path(store_path).exists():
+            raise FileNotFoundError(f"Analysis store not found: {store_path}")
+
+        store = AnalysisStore(store_path)
+        try:
+            run_id = store.run(run_id)['run_id']
+            df = store.fix_plan(run_id)
+        finally:
+            store.close()
+        print(f"Loaded {len(df)} fixes to apply from run {run_id}")
+        return df
+
     def extract_job_id_from_path(self, file_path: str) -> str:
         """Extract job ID from file path"""
         # Pattern: audio_samples/{job_id}_{lang}_{type}.mp3
@@ -110,8 +149,10 @@ class LanguageFixer:
         print(f"\nProcessing: {file_path}")
         print(f"  Claimed: {claimed_lang} → Detected: {detected_lang}")
 
-        # Extract job ID
-        job_id = self.extract_job_id_from_path(file_path)
+        # Job ID from the analysis store, or extracted from the path
+        job_id = fix_row.get('job_id')
+        if not isinstance(job_id, str) or not job_id:
+            job_id = self.extract_job_id_from_path(file_path)
         if not job_id:
             print(f"  ERROR: Could not extract job ID from {file_path}")
             return False
@@ -188,18 +229,23 @@ class LanguageFixer:
         print(f"\n=== APPLYING {len(fix_plan_df)} LANGUAGE FIXES ===\n")
 
         for idx, fix_row in fix_plan_df.iterrows():
+            # (job_id, lang, issue_type) lets the next incremental plan match results to its items
+            fix_key = {column: fix_row[column] for column in ('job_id', 'lang', 'issue_type')
+                       if column in fix_row and pd.notna(fix_row[column])}
             try:
                 success = self.fix_language_metadata(fix_row)
                 if success:
                     results['successful_fixes'] += 1
                     results['fixes_applied'].append({
                         'file_path': fix_row['file_path'],
+                        **fix_key,
                         'status': 'success'
                     })
                 else:
                     results['failed_fixes'] += 1
                     results['fixes_applied'].append({
                         'file_path': fix_row['file_path'],
+                        **fix_key,
                         'status': 'failed'
                     })
             except Exception as e:
@@ -207,6 +253,7 @@ class LanguageFixer:
                 results['failed_fixes'] += 1
                 results['fixes_applied'].append({
                     'file_path': fix_row['file_path'],
+                    **fix_key,
                     'status': 'error',
                     'error': str(e)
                 })
@@ -247,6 +294,12 @@ class LanguageFixer:
 def main():
     parser = argparse.ArgumentParser(description='Apply language metadata fixes to Supabase database')
     parser.add_argument('--fix-plan', default='./fix-plan', help='Directory containing fix plan')
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument('--store', default=None,
+                        help='analysis.sqlite to query the fixes from (results are still saved to --fix-plan)')
+    source.add_argument('--delta', action='store_true',
+                        help='Apply only the new/changed/retry items of fix_plan_delta.csv in --fix-plan')
+    parser.add_argument('--run', type=int, default=None, help='Run id in --store (default: latest)')
 
     args = parser.parse_args()
 
@@ -260,11 +313,20 @@ def main():
 
     # Load fix plan
     try:
-        fix_plan_df = fixer.load_fix_plan(args.fix_plan)
-    except FileNotFoundError as e:
+        if args.store:
+            fix_plan_df = fixer.load_fix_plan_from_store(args.store, args.run)
+        elif args.delta:
+            fix_plan_df = fixer.load_fix_plan_delta(args.fix_plan)
+        else:
+            fix_plan_df = fixer.load_fix_plan(args.fix_plan)
+    except (FileNotFoundError, LookupError) as e:
         print(f"ERROR: {e}")
         sys.exit(1)
 
+    if fix_plan_df.empty:
+        print("Nothing to apply")
+        return
+
     # Apply fixes
     results = fixer.apply_all_fixes(fix_plan_df)
 
@@ -0,0 +1,27 @@
+"""
+🎭 Audio Analysis Companions
+===========================
+
+Shared building blocks for the audio language scripts in this directory
+(``analyze-audio-languages.py`` and friends). The scripts themselves have
+hyphenated names and cannot be imported, so anything more than one script
+needs lives here.
+
+Modules:
+    backends        - openai-whisper / mlx-whisper / faster-whisper int8 / ONNX Runtime behind one interface
+    instrumentation - stage spans, counters, JSON / OpenMetrics export, cProfile + tracemalloc, sampled logs
+    weight_cache    - converts Whisper weights once and memory-maps them (shared across workers)
+    result_cache    - content-addressed SQLite cache of per-file analysis results
+    decode          - streams only the needed PCM windows from ffmpeg; batched log-mel features
+    feature_cache   - memory-mapped .npy shards of log-mel windows, SQLite-indexed, LRU size cap
+    vad             - vectorized energy voice-activity detection; speech-first windows
+    fingerprint     - spectral-peak landmark hashes and an inverted index for duplicate audio
+    transcript_lsh  - MinHash signatures + banded LSH index clustering near-duplicate transcripts
+    text_language   - character-trigram text language ID (bundled en/es/hi profiles), batch-vectorized
+    analysis_store  - indexed SQLite store of analysis runs (verdicts, transcripts apart); CSV/JSON views on demand
+    fix_rules       - declarative JSON rule table classifying mismatches for the fix plan, as vectorized masks
+    planning        - groups ``{job}_{lang}_full`` / ``_chunk_0`` files into one analysis unit; stable run shards
+    mp3             - MPEG frame headers and a header-only probe (Xing/VBRI/CBR duration, truncation)
+    daemon          - warm-model analysis daemon on a UNIX socket / localhost HTTP, and its client
+    remote          - first-N-seconds HTTP Range fetches of storage URLs; Range-capable fixture server
+"""
@@ -0,0 +1,295 @@
+"""
+🗄️ Indexed Analysis Store
+=========================
+
+Every analysis run used to hand its verdicts on as ``detailed_analysis.csv``
+and ``.json``, with each full transcript inline. Each later step reloaded all of
+it with pandas just to pick out a few mismatches. This store keeps the run in one
+SQLite file next to the analysis (``analysis.sqlite``) instead:
+
+- ``runs``: one row per run, holding its settings, summary and original column order.
+- ``verdicts``: one row per file, keyed by (run_id, file_path). The columns the
+  tools filter on are real columns, indexed on run_id, (job_id, lang),
+  detected_language and languages_match. Everything else rides along as JSON.
+- ``transcripts``: the transcript text, in its own table, so scans of verdicts
+  never read it.
+- ``fix_items``: the fix planner's verdict on each mismatch of a run, which the
+  fix applier joins back onto the verdicts.
+
+The fix planner and applier query it directly. The CSV/JSON files are views
+written on demand, by the analyzer's ``--export-views`` or from the command line:
+
+    python scripts/audio_analysis/analysis_store.py ./analysis/analysis.sqlite --list
+    python scripts/audio_analysis/analysis_store.py ./analysis/analysis.sqlite --view mismatches --output language_mismatches.csv
+"""
+
+import argparse
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Union
+
+import pandas as pd
+
+STORE_FILENAME = 'analysis.sqlite'
+VERDICT_COLUMNS = ['file_path', 'filename', 'job_id', 'lang', 'claimed_language', 'language_code',
+                   'detected_language', 'languages_match', 'confidence', 'duration', 'status']
+VIEWS = {
+    'detailed': {},
+    'mismatches': {'languages_match': False}
+}
+VIEW_FILENAMES = {'detailed': 'detailed_analysis', 'mismatches': 'language_mismatches'}
+_DERIVED_COLUMNS = {'job_id', 'lang'}  # parsed from the file name, not part of the analyzer's rows
+
+
+def _sql_value(value):
+    """NaN/NA become NULL, NumPy scalars become Python ones."""
+    if value is None or (not isinstance(value, (list, dict, str)) and pd.isna(value)):
+        return None
+    return value.item() if hasattr(value, 'item') else value
+
+
+class AnalysisStore:
+    """Runs, verdicts and transcripts of the audio language analysis in one SQLite file."""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(str(self.path), timeout=30)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.executescript('''
+            CREATE TABLE IF NOT EXISTS runs (
+                run_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                created_at REAL NOT NULL,
+                settings_json TEXT NOT NULL,
+                summary_json TEXT NOT NULL,
+                columns_json TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS verdicts (
+                run_id INTEGER NOT NULL,
+                file_path TEXT NOT NULL,
+                filename TEXT,
+                job_id TEXT,
+                lang TEXT,
+                claimed_language TEXT,
+                language_code TEXT,
+                detected_language TEXT,
+                languages_match INTEGER,
+                confidence REAL,
+                duration REAL,
+                status TEXT,
+                extras_json TEXT NOT NULL,
+                PRIMARY KEY (run_id, file_path)
+            );
+            CREATE TABLE IF NOT EXISTS transcripts (
+                run_id INTEGER NOT NULL,
+                file_path TEXT NOT NULL,
+                transcription TEXT NOT NULL,
+                PRIMARY KEY (run_id, file_path)
+            );
+            CREATE TABLE IF NOT EXISTS fix_items (
+                run_id INTEGER NOT NULL,
+                file_path TEXT NOT NULL,
+                issue_type TEXT NOT NULL,
+                priority TEXT NOT NULL,
+                action TEXT NOT NULL,
+                PRIMARY KEY (run_id, file_path)
+            );
+            CREATE INDEX IF NOT EXISTS idx_verdicts_run ON verdicts (run_id);
+            CREATE INDEX IF NOT EXISTS idx_verdicts_job_lang ON verdicts (job_id, lang);
+            CREATE INDEX IF NOT EXISTS idx_verdicts_detected ON verdicts (run_id, detected_language);
+            CREATE INDEX IF NOT EXISTS idx_verdicts_match ON verdicts (run_id, languages_match);
+        ''')
+        self._connection.commit()
+
+    def record_run(self, df: pd.DataFrame, summary: Dict, settings: Optional[Dict] = None,
+                   job_ids: Optional[Sequence] = None, langs: Optional[Sequence] = None) -> int:
+        """Store one run's rows in a single transaction and return its run id."""
+        columns = list(df.columns)
+        core = [column for column in VERDICT_COLUMNS if column in df and column not in _DERIVED_COLUMNS]
+        extras = [column for column in columns if column not in core and column != 'transcription']
+        extras_json = (df[extras].to_json(orient='records', lines=True, force_ascii=False).splitlines()
+                       if extras and len(df) else ['{}'] * len(df))
+        job_ids = list(job_ids) if job_ids is not None else [None] * len(df)
+        langs = list(langs) if langs is not None else [None] * len(df)
+
+        with self._connection:
+            run_id = self._connection.execute(
+                'INSERT INTO runs (created_at, settings_json, summary_json, columns_json) VALUES (?, ?, ?, ?)',
+                (time.time(), json.dumps(settings or {}), json.dumps(summary, default=str), json.dumps(columns))
+            ).lastrowid
+            verdict_columns = ['run_id', *core, 'job_id', 'lang', 'extras_json']
+            self._connection.executemany(
+                f"INSERT INTO verdicts ({', '.join(verdict_columns)}) VALUES ({', '.join('?' * len(verdict_columns))})",
+                [(run_id, *map(_sql_value, row), job_id, lang, extra)
+                 for row, job_id, lang, extra in zip(df[core].itertuples(index=False), job_ids, langs, extras_json)]
+            )
+            if 'transcription' in df:
+                self._connection.executemany(
+                    'INSERT INTO transcripts (run_id, file_path, transcription) VALUES (?, ?, ?)',
+                    [(run_id, str(file_path), text) for file_path, text in zip(df['file_path'], df['transcription'])
+                     if isinstance(text, str) and text]
+                )
+        return run_id
+
+    def latest_run(self) -> Optional[int]:
+        return self._connection.execute('SELECT MAX(run_id) FROM runs').fetchone()[0]
+
+    def _resolve_run(self, run_id: Optional[int]) -> int:
+        resolved = run_id if run_id is not None else self.latest_run()
+        if resolved is None:
+            raise LookupError(f"No analysis runs in {self.path}")
+        return resolved
+
+    def run(self, run_id: Optional[int] = None) -> Dict:
+        """``run_id``, ``created_at``, ``settings``, ``summary`` and ``columns`` of one run (default: latest)."""
+        run_id = self._resolve_run(run_id)
+        row = self._connection.execute(
+            'SELECT created_at, settings_json, summary_json, columns_json FROM runs WHERE run_id = ?', (run_id,)
+        ).fetchone()
+        if row is None:
+            raise LookupError(f"No run {run_id} in {self.path}")
+        return {'run_id': run_id, 'created_at': row[0], 'settings': json.loads(row[1]),
+                'summary': json.loads(row[2]), 'columns': json.loads(row[3])}
+
+    def runs(self) -> List[Dict]:
+        return [{'run_id': run_id, 'created_at': created_at, 'files': files}
+                for run_id, created_at, files in self._connection.execute(
+                    'SELECT runs.run_id, runs.created_at, COUNT(verdicts.file_path) FROM runs '
+                    'LEFT JOIN verdicts ON verdicts.run_id = runs.run_id GROUP BY runs.run_id ORDER BY runs.run_id'
+                )]
+
+    @staticmethod
+    def _where(run_id: int, equals: Dict, table: str = ''):
+        unknown = set(equals) - set(VERDICT_COLUMNS)
+        if unknown:
+            raise ValueError(f"Cannot filter verdicts on {sorted(unknown)}")
+        prefix = f"{table}." if table else ''
+        clauses = [f"{prefix}run_id = ?"] + [f"{prefix}{column} = ?" for column in equals]
+        values = [run_id] + [int(value) if isinstance(value, bool) else value for value in equals.values()]
+        return ' AND '.join(clauses), values
+
+    def count(self, run_id: Optional[int] = None, **equals) -> int:
+        where, values = self._where(self._resolve_run(run_id), equals)
+        return self._connection.execute(f"SELECT COUNT(*) FROM verdicts WHERE {where}", values).fetchone()[0]
+
+    def verdicts(self, run_id: Optional[int] = None, columns: Sequence[str] = VERDICT_COLUMNS, **equals) -> pd.DataFrame:
+        """
+        Indexed verdict columns of one run (default: latest), filtered by equality.
+
+        ``store.verdicts(languages_match=False, status='success')`` is an index
+        lookup; no transcript or extra column is read.
+        """
+        unknown = set(columns) - set(VERDICT_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown verdict columns {sorted(unknown)}")
+        where, values = self._where(self._resolve_run(run_id), equals)
+        verdicts = pd.read_sql_query(
+            f"SELECT {', '.join(columns)} FROM verdicts WHERE {where} ORDER BY rowid", self._connection, params=values
+        )
+        if 'languages_match' in verdicts:
+            verdicts['languages_match'] = verdicts['languages_match'].fillna(0).astype(bool)
+        return verdicts
+
+    def transcripts(self, run_id: Optional[int] = None, file_paths: Optional[Sequence[str]] = None) -> Dict[str, str]:
+        """``{file_path: transcription}`` for a run, or just for the given files."""
+        run_id = self._resolve_run(run_id)
+        if file_paths is None:
+            rows = self._connection.execute(
+                'SELECT file_path, transcription FROM transcripts WHERE run_id = ?', (run_id,)
+            )
+            return dict(rows)
+        transcripts = {}
+        for path in file_paths:
+            row = self._connection.execute(
+                'SELECT transcription FROM transcripts WHERE run_id = ? AND file_path = ?', (run_id, str(path))
+            ).fetchone()
+            if row is not None:
+                transcripts[str(path)] = row[0]
+        return transcripts
+
+    def record_fix_plan(self, run_id: int, items: pd.DataFrame):
+        """Replace a run's fix plan with ``items`` (file_path, issue_type, priority, action)."""
+        with self._connection:
+            self._connection.execute('DELETE FROM fix_items WHERE run_id = ?', (run_id,))
+            if items.empty:
+                return
+            self._connection.executemany(
+                'INSERT INTO fix_items (run_id, file_path, issue_type, priority, action) VALUES (?, ?, ?, ?, ?)',
+                [(run_id, str(item.file_path), item.issue_type, item.priority, item.action)
+                 for item in items[['file_path', 'issue_type', 'priority', 'action']].itertuples(index=False)]
+            )
+
+    def fix_plan(self, run_id: Optional[int] = None) -> pd.DataFrame:
+        """A run's fix items joined with their verdicts (job_id, lang, claimed and detected language)."""
+        return pd.read_sql_query(
+            'SELECT fix_items.file_path, verdicts.job_id, verdicts.lang, fix_items.issue_type, '
+            'verdicts.claimed_language, verdicts.detected_language, verdicts.confidence, '
+            'fix_items.priority, fix_items.action '
+            'FROM fix_items JOIN verdicts '
+            'ON verdicts.run_id = fix_items.run_id AND verdicts.file_path = fix_items.file_path '
+            'WHERE fix_items.run_id = ? ORDER BY fix_items.rowid',
+            self._connection, params=(self._resolve_run(run_id),)
+        )
+
+    def frame(self, run_id: Optional[int] = None, **equals) -> pd.DataFrame:
+        """Whole rows in the analyzer's original column order, transcripts joined back in."""
+        run = self.run(run_id)
+        where, values = self._where(run['run_id'], equals, table='verdicts')
+        stored_columns = [column for column in VERDICT_COLUMNS if column not in _DERIVED_COLUMNS]
+        rows = self._connection.execute(
+            f"SELECT {', '.join('verdicts.' + column for column in stored_columns)}, verdicts.extras_json, "
+            f"transcripts.transcription FROM verdicts LEFT JOIN transcripts "
+            f"ON transcripts.run_id = verdicts.run_id AND transcripts.file_path = verdicts.file_path "
+            f"WHERE {where} ORDER BY verdicts.rowid",
+            values
+        ).fetchall()
+
+        records = []
+        for row in rows:
+            record = dict(zip(stored_columns, row[:len(stored_columns)]))
+            record.update(json.loads(row[-2]))
+            record['transcription'] = row[-1] if row[-1] is not None else ''
+            records.append(record)
+        frame = pd.DataFrame.from_records(records, columns=run['columns'])
+        if 'languages_match' in frame:
+            frame['languages_match'] = frame['languages_match'].fillna(0).astype(bool)
+        return frame
+
+    def export(self, view: str, path: Union[str, Path], run_id: Optional[int] = None) -> int:
+        """Write a view (``detailed`` or ``mismatches``) as CSV or JSON, by suffix; returns its row count."""
+        if view not in VIEWS:
+            raise ValueError(f"Unknown view {view!r}; expected one of {sorted(VIEWS)}")
+        path = Path(path)
+        rows = self.frame(run_id, **VIEWS[view])
+        if path.suffix == '.json':
+            rows.to_json(path, orient='records', indent=2, force_ascii=False)
+        elif path.suffix == '.csv':
+            rows.to_csv(path, index=False)
+        else:
+            raise ValueError(f"Views are written as .csv or .json, not {path.suffix!r}")
+        return len(rows)
+
+    def close(self):
+        self._connection.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='List the runs of an analysis store or export one of its views')
+    parser.add_argument('store', help=f'Path to {STORE_FILENAME}')
+    parser.add_argument('--list', action='store_true', help='List stored runs')
+    parser.add_argument('--view', choices=sorted(VIEWS), default='detailed', help='View to export (default: detailed)')
+    parser.add_argument('--run', type=int, default=None, help='Run id (default: latest)')
+    parser.add_argument('--output', default=None, help='.csv or .json file (default: the view name as CSV)')
+    args = parser.parse_args()
+
+    store = AnalysisStore(args.store)
+    if args.list:
+        for stored_run in store.runs():
+            created = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(stored_run['created_at']))
+            print(f"run {stored_run['run_id']}: {stored_run['files']} files, {created}")
+    else:
+        output = args.output or f"{VIEW_FILENAMES[args.view]}.csv"
+        print(f"{store.export(args.view, output, args.run)} rows written to {output}")
+    store.close()
@@ -0,0 +1,312 @@
+"""
+🧠 Pluggable Whisper Inference Backends
+======================================
+
+Everything above the model - metadata, language comparison, reports - only
+needs three things from it: load a model size, detect the language of a batch
+of 30-second windows, and transcribe a waveform. Each backend below provides
+exactly that, so the analyzer never has to know which engine is listening.
+Language detection also accepts precomputed Whisper log-mel features
+(``detect_language_features``), so cached features skip decode and mel entirely.
+
+Backends:
+    openai-whisper      - the reference PyTorch implementation
+    mlx-whisper         - Apple Silicon (Metal) port
+    faster-whisper-int8 - CTranslate2 with int8 weights; the quick one on Linux CPUs
+    onnxruntime         - Whisper exported to ONNX (via optimum), run on ONNX Runtime
+
+``auto`` picks the fastest one that is installed, in ``AUTO_PREFERENCE`` order.
+All inputs are 16 kHz mono float32, as produced by ``audio_analysis.decode``.
+"""
+
+import importlib.util
+import os
+import platform
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+
+from audio_analysis.decode import SAMPLE_RATE, WINDOW_SAMPLES, batched_log_mel
+from audio_analysis.weight_cache import ensure_cached_weights, load_whisper_mmap, weight_cache_dir
+
+# Fastest first. MLX only ever installs on Apple Silicon, where it beats the CPU engines.
+AUTO_PREFERENCE = ('mlx-whisper', 'faster-whisper-int8', 'onnxruntime', 'openai-whisper')
+
+
+class InferenceBackend:
+    """Load / detect_language / transcribe over one Whisper engine, keeping each model size resident."""
+
+    name = 'abstract'
+    requires: tuple = ()
+
+    def __init__(self):
+        self._models: Dict[str, object] = {}
+        self.load_seconds: Dict[str, float] = {}
+
+    @classmethod
+    def available(cls) -> bool:
+        return all(importlib.util.find_spec(module) is not None for module in cls.requires)
+
+    def load(self, model_name: str):
+        """Load ``model_name`` (tiny, base, small, ...) once and return it."""
+        if model_name not in self._models:
+            started = time.perf_counter()
+            self._models[model_name] = self._load(model_name)
+            self.load_seconds[model_name] = time.perf_counter() - started
+        return self._models[model_name]
+
+    def prepare(self, model_name: str):
+        """One-off work (downloads, conversions) to finish before a worker pool starts loading in parallel."""
+
+    def is_loaded(self, model_name: str) -> bool:
+        return model_name in self._models
+
+    def _load(self, model_name: str):
+        raise NotImplementedError
+
+    def detect_language(self, windows: np.ndarray, model_name: str) -> List[Dict[str, float]]:
+        """Per-language probabilities for each row of a ``(n, 480000)`` window batch."""
+        raise NotImplementedError
+
+    def detect_language_features(self, features: np.ndarray, model_name: str) -> List[Dict[str, float]]:
+        """The same, from ``(n, n_mels, 3000)`` Whisper log-mel features (``decode.log_mel_windows``)."""
+        raise NotImplementedError
+
+    def transcribe(self, waveform: np.ndarray, model_name: str) -> Dict:
+        """Return ``language``, ``text``, ``confidence`` and (when known) ``duration``."""
+        raise NotImplementedError
+
+
+class OpenAIWhisperBackend(InferenceBackend):
+    name = 'openai-whisper'
+    requires = ('whisper', 'torch')
+
+    def _load(self, model_name: str):
+        import whisper
+
+        cache_dir = weight_cache_dir()
+        if cache_dir is not None:
+            try:
+                model, _ = load_whisper_mmap(model_name, cache_dir)
+                return model
+            except TypeError:
+                pass  # torch < 2.1 has no mmap=True; fall back to a plain load
+        return whisper.load_model(model_name)
+
+    def prepare(self, model_name: str):
+        cache_dir = weight_cache_dir()
+        if cache_dir is not None:
+            ensure_cached_weights(model_name, cache_dir)
+
+    def detect_language(self, windows, model_name):
+        model = self.load(model_name)
+        mel_batch = batched_log_mel(windows, n_mels=model.dims.n_mels, device=model.device)
+        _, language_probabilities = model.detect_language(mel_batch)
+        return [{lang: float(prob) for lang, prob in probs.items()} for probs in language_probabilities]
+
+    def detect_language_features(self, features, model_name):
+        import torch
+
+        model = self.load(model_name)
+        mel_batch = torch.from_numpy(np.array(features, dtype=np.float32)).to(model.device)
+        _, language_probabilities = model.detect_language(mel_batch)
+        return [{lang: float(prob) for lang, prob in probs.items()} for probs in language_probabilities]
+
+    def transcribe(self, waveform, model_name):
+        result = self.load(model_name).transcribe(waveform)
+        return {
+            'language': result.get('language', 'unknown'),
+            'text': result.get('text', ''),
+            'confidence': result.get('confidence', 0),
+            'duration': result.get('duration')
+        }
+
+
+class MLXWhisperBackend(InferenceBackend):
+    name = 'mlx-whisper'
+    requires = ('mlx_whisper',)
+
+    @classmethod
+    def available(cls) -> bool:
+        return super().available() and platform.system() == 'Darwin' and platform.machine() == 'arm64'
+
+    @staticmethod
+    def _repo(model_name: str) -> str:
+        return f"mlx-community/whisper-{model_name}"
+
+    def _load(self, model_name: str):
+        from mlx_whisper.load_models import load_model
+        return load_model(self._repo(model_name))
+
+    def detect_language(self, windows, model_name):
+        import mlx.core as mx
+        from mlx_whisper.audio import log_mel_spectrogram
+        from mlx_whisper.decoding import detect_language
+
+        model = self.load(model_name)
+        mel_batch = mx.stack([log_mel_spectrogram(window, n_mels=model.dims.n_mels) for window in windows])
+        _, language_probabilities = detect_language(model, mel_batch.astype(mx.float16))
+        return [{lang: float(prob) for lang, prob in probs.items()} for probs in language_probabilities]
+
+    def detect_language_features(self, features, model_name):
+        import mlx.core as mx
+        from mlx_whisper.decoding import detect_language
+
+        # MLX keeps mel channels last: (batch, frames, n_mels)
+        mel_batch = mx.array(np.ascontiguousarray(np.swapaxes(features, 1, 2), dtype=np.float32))
+        _, language_probabilities = detect_language(self.load(model_name), mel_batch.astype(mx.float16))
+        return [{lang: float(prob) for lang, prob in probs.items()} for probs in language_probabilities]
+
+    def transcribe(self, waveform, model_name):
+        import mlx_whisper
+        result = mlx_whisper.transcribe(waveform, path_or_hf_repo=self._repo(model_name), verbose=False)
+        return {
+            'language': result.get('language', 'unknown'),
+            'text': result.get('text', ''),
+            'confidence': 0.8,  # MLX doesn't provide confidence scores
+            'duration': None
+        }
+
+
+class FasterWhisperBackend(InferenceBackend):
+    """CTranslate2 on CPU with int8 weights; honours ``OMP_NUM_THREADS`` for its thread count."""
+
+    name = 'faster-whisper-int8'
+    requires = ('faster_whisper',)
+
+    def _load(self, model_name: str):
+        from faster_whisper import WhisperModel
+        return WhisperModel(model_name, device='cpu', compute_type='int8')
+
+    def detect_language(self, windows, model_name):
+        model = self.load(model_name)
+        frames = WINDOW_SAMPLES // model.feature_extractor.hop_length
+        features = np.stack([model.feature_extractor(window)[:, :frames] for window in windows])
+        return self.detect_language_features(features, model_name)
+
+    def detect_language_features(self, features, model_name):
+        model = self.load(model_name)
+        encoder_output = model.encode(np.ascontiguousarray(features, dtype=np.float32))
+        return [
+            {token.strip('<|>'): float(prob) for token, prob in token_probs}
+            for token_probs in model.model.detect_language(encoder_output)
+        ]
+
+    def transcribe(self, waveform, model_name):
+        segments, info = self.load(model_name).transcribe(waveform, beam_size=5)
+        return {
+            'language': info.language,
+            'text': ''.join(segment.text for segment in segments),
+            'confidence': float(info.language_probability),
+            'duration': info.duration
+        }
+
+
+class ONNXRuntimeBackend(InferenceBackend):
+    """
+    Whisper exported to ONNX once (into ``ONNX_CACHE_DIR``) and served by ONNX Runtime on CPU.
+
+    Language detection is one decoder step after ``<|startoftranscript|>``, with
+    the softmax taken over the language tokens only - the same rule Whisper uses.
+    """
+
+    name = 'onnxruntime'
+    requires = ('onnxruntime', 'optimum', 'transformers')
+
+    def __init__(self):
+        super().__init__()
+        self.cache_dir = Path(os.environ.get('ONNX_CACHE_DIR', Path.home() / '.cache' / 'whisper-onnx'))
+
+    def _load(self, model_name: str):
+        import onnxruntime
+        from optimum.onnxruntime import ORTModelForSpeechSeq2Seq
+        from transformers import WhisperProcessor
+        from transformers.models.whisper.tokenization_whisper import LANGUAGES
+
+        session_options = onnxruntime.SessionOptions()
+        session_options.intra_op_num_threads = int(os.environ.get('OMP_NUM_THREADS', 0))
+
+        hub_id = f"openai/whisper-{model_name}"
+        exported_dir = self.cache_dir / f"whisper-{model_name}"
+        if not exported_dir.exists():
+            model = ORTModelForSpeechSeq2Seq.from_pretrained(hub_id, export=True)
+            model.save_pretrained(exported_dir)
+            WhisperProcessor.from_pretrained(hub_id).save_pretrained(exported_dir)
+
+        model = ORTModelForSpeechSeq2Seq.from_pretrained(
+            exported_dir, provider='CPUExecutionProvider', session_options=session_options
+        )
+        processor = WhisperProcessor.from_pretrained(exported_dir)
+        tokenizer = processor.tokenizer
+        vocabulary = tokenizer.get_vocab()
+        language_codes = [code for code in LANGUAGES if f"<|{code}|>" in vocabulary]
+        language_ids = tokenizer.convert_tokens_to_ids([f"<|{code}|>" for code in language_codes])
+        sot_id = tokenizer.convert_tokens_to_ids('<|startoftranscript|>')
+        return model, processor, language_codes, np.array(language_ids), sot_id
+
+    def _features(self, processor, windows):
+        return processor.feature_extractor(list(windows), sampling_rate=SAMPLE_RATE, return_tensors='pt').input_features
+
+    def detect_language(self, windows, model_name):
+        _, processor, _, _, _ = self.load(model_name)
+        return self.detect_language_features(self._features(processor, windows), model_name)
+
+    def detect_language_features(self, features, model_name):
+        import torch
+
+        model, _, language_codes, language_ids, sot_id = self.load(model_name)
+        features = torch.as_tensor(np.array(features, dtype=np.float32))
+        decoder_input_ids = torch.full((len(features), 1), sot_id, dtype=torch.long)
+        logits = model(input_features=features, decoder_input_ids=decoder_input_ids).logits[:, -1, :]
+        language_logits = np.asarray(logits, dtype=np.float64)[:, language_ids]
+        language_logits -= language_logits.max(axis=1, keepdims=True)
+        probabilities = np.exp(language_logits)
+        probabilities /= probabilities.sum(axis=1, keepdims=True)
+        return [dict(zip(language_codes, row.tolist())) for row in probabilities]
+
+    def transcribe(self, waveform, model_name):
+        model, processor, _, _, _ = self.load(model_name)
+        windows = [waveform[start:start + WINDOW_SAMPLES] for start in range(0, max(len(waveform), 1), WINDOW_SAMPLES)]
+
+        first_window = np.zeros((1, WINDOW_SAMPLES), dtype=np.float32)
+        first_window[0, :len(windows[0])] = windows[0]
+        opening_probabilities = self.detect_language(first_window, model_name)[0]
+        language = max(opening_probabilities, key=opening_probabilities.get)
+
+        generated = model.generate(input_features=self._features(processor, windows),
+                                   language=language, task='transcribe')
+        return {
+            'language': language,
+            'text': ' '.join(text.strip() for text in processor.batch_decode(generated, skip_special_tokens=True)),
+            'confidence': opening_probabilities[language],
+            'duration': len(waveform) / SAMPLE_RATE
+        }
+
+
+BACKENDS = {backend.name: backend for backend in
+            (OpenAIWhisperBackend, MLXWhisperBackend, FasterWhisperBackend, ONNXRuntimeBackend)}
+
+
+def mel_bins(model_name: str) -> int:
+    """Mel channels a model size expects: 128 for large-v3 and turbo, 80 for every other size."""
+    return 128 if model_name.startswith('large-v3') or 'turbo' in model_name else 80
+
+
+def available_backends() -> List[str]:
+    return [name for name in AUTO_PREFERENCE if BACKENDS[name].available()]
+
+
+def create_backend(name: str = 'auto') -> InferenceBackend:
+    """Instantiate ``name``, or the fastest installed backend for ``auto``. Raises ``RuntimeError``."""
+    if name == 'auto':
+        installed = available_backends()
+        if not installed:
+            raise RuntimeError(f"no Whisper backend installed (tried {', '.join(AUTO_PREFERENCE)})")
+        name = installed[0]
+    if name not in BACKENDS:
+        raise RuntimeError(f"unknown backend {name!r}; choose from auto, {', '.join(BACKENDS)}")
+    if not BACKENDS[name].available():
+        raise RuntimeError(f"backend {name!r} is not installed (needs {', '.join(BACKENDS[name].requires)})")
+    return BACKENDS[name]()
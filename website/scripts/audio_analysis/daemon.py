@@ -0,0 +1,163 @@
+"""
+🛎️ Warm-Model Analysis Daemon
+============================
+
+Importing torch/whisper and loading a model costs far more than hearing one or
+two freshly generated files. The daemon keeps an analyzer (and its model)
+resident and answers over HTTP - on a local UNIX socket by default, or on a
+localhost TCP port.
+
+Endpoints:
+    GET  /health                    - backend, model, mode, uptime, requests served
+    POST /analyze                   - JSON ``{"sources": [{"path": ...} | {"url": ..., "name": ...}],
+                                      "expect": {"variant": ..., "vad": ..., "plan_groups": ...}}``
+    POST /analyze?name=<file.mp3>   - raw audio bytes in the body (``application/octet-stream``)
+
+Answers are ``{"results": [...], "elapsed_seconds": ...}``; every result is the
+same row the analyzer stores in ``analysis.sqlite``. A request whose
+``expect`` does not match the daemon's configuration gets ``409`` so the caller
+can fall back to analysing locally.
+
+The server side only needs a *service* object with ``health()``,
+``analyze(sources, expect)`` and ``analyze_bytes(data, name, expect)``.
+"""
+
+import http.client
+import json
+import os
+import socket
+import socketserver
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs, urlencode, urlparse
+
+DEFAULT_SOCKET_PATH = str(Path(os.environ.get('XDG_RUNTIME_DIR', '/tmp')) / 'audio-analysis.sock')
+
+
+class ConfigurationMismatch(Exception):
+    """The request expects a model, backend or mode the daemon is not running."""
+
+
+class AnalysisRequestHandler(BaseHTTPRequestHandler):
+    """Routes /health and /analyze to the server's ``service``."""
+
+    server_version = 'AudioAnalysisDaemon/1.0'
+
+    def address_string(self) -> str:
+        # UNIX socket peers have no (host, port)
+        return self.client_address[0] if isinstance(self.client_address, tuple) and self.client_address else 'local'
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _reply(self, status: int, document: Dict):
+        body = json.dumps(document, default=str).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if urlparse(self.path).path != '/health':
+            return self._reply(404, {'error': 'not found'})
+        self._reply(200, self.server.service.health())
+
+    def do_POST(self):
+        request_url = urlparse(self.path)
+        if request_url.path != '/analyze':
+            return self._reply(404, {'error': 'not found'})
+        body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        try:
+            if self.headers.get('Content-Type', '').startswith('application/json'):
+                request = json.loads(body or b'{}')
+                answer = self.server.service.analyze(request.get('sources', []), request.get('expect', {}))
+            else:
+                query = parse_qs(request_url.query)
+                name = query.get('name', ['upload.mp3'])[0]
+                expect = {key: values[0] for key, values in query.items() if key != 'name'}
+                answer = self.server.service.analyze_bytes(body, name, expect)
+        except ConfigurationMismatch as mismatch:
+            return self._reply(409, {'error': str(mismatch)})
+        except (ValueError, KeyError) as bad_request:
+            return self._reply(400, {'error': str(bad_request)})
+        except Exception as failure:
+            return self._reply(500, {'error': str(failure)})
+        self._reply(200, answer)
+
+
+class UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def server_bind(self):
+        if os.path.exists(self.server_address):
+            os.unlink(self.server_address)  # a stale socket from a previous daemon
+        super().server_bind()
+        os.chmod(self.server_address, 0o600)
+
+
+def make_server(service, socket_path: Optional[str] = None, port: Optional[int] = None, verbose: bool = False):
+    """A threaded HTTP server for ``service`` on a UNIX socket, or on 127.0.0.1:``port`` when given."""
+    if port is not None:
+        server = ThreadingHTTPServer(('127.0.0.1', port), AnalysisRequestHandler)
+    else:
+        server = UnixHTTPServer(socket_path or DEFAULT_SOCKET_PATH, AnalysisRequestHandler)
+    server.service = service
+    server.verbose = verbose
+    return server
+
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, socket_path: str, timeout: float):
+        super().__init__('localhost', timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.socket_path)
+
+
+class DaemonClient:
+    """Talks to a running daemon; ``health()`` returns ``None`` when nothing is listening."""
+
+    def __init__(self, socket_path: Optional[str] = None, port: Optional[int] = None, timeout: float = 600.0):
+        self.socket_path = socket_path or DEFAULT_SOCKET_PATH
+        self.port = port
+        self.timeout = timeout
+
+    def _connection(self, timeout: Optional[float] = None) -> http.client.HTTPConnection:
+        if self.port is not None:
+            return http.client.HTTPConnection('127.0.0.1', self.port, timeout=timeout or self.timeout)
+        return UnixHTTPConnection(self.socket_path, timeout or self.timeout)
+
+    def _request(self, method: str, path: str, body: bytes = None, content_type: str = None,
+                 timeout: Optional[float] = None) -> Dict:
+        connection = self._connection(timeout)
+        try:
+            connection.request(method, path, body=body, headers={'Content-Type': content_type} if content_type else {})
+            response = connection.getresponse()
+            document = json.loads(response.read() or b'{}')
+        finally:
+            connection.close()
+        if response.status == 409:
+            raise ConfigurationMismatch(document.get('error', 'configuration mismatch'))
+        if response.status != 200:
+            raise RuntimeError(f"daemon answered {response.status}: {document.get('error')}")
+        return document
+
+    def health(self) -> Optional[Dict]:
+        try:
+            return self._request('GET', '/health', timeout=2.0)
+        except (OSError, RuntimeError, ValueError):
+            return None
+
+    def analyze(self, sources: List[Dict], expect: Optional[Dict] = None) -> List[Dict]:
+        body = json.dumps({'sources': sources, 'expect': expect or {}}).encode()
+        return self._request('POST', '/analyze', body, 'application/json')['results']
+
+    def analyze_bytes(self, data: bytes, name: str, expect: Optional[Dict] = None) -> List[Dict]:
+        query = urlencode({'name': name, **(expect or {})})
+        return self._request('POST', f"/analyze?{query}", data, 'application/octet-stream')['results']
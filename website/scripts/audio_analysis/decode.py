@@ -0,0 +1,222 @@
+"""
+🎧 Streaming Audio Decode and Batched Log-Mel Features
+=====================================================
+
+Whisper's own ``load_audio`` spawns ffmpeg and converts a whole file into one
+float32 array before any work can start. Language detection only ever looks at
+a few 30-second windows, so this module asks ffmpeg for exactly those seconds,
+streams the PCM through a pipe straight into preallocated NumPy buffers, and
+turns many windows into one batched log-mel tensor for a single forward pass.
+
+Peak memory per call is ``windows x 30 s x 16 kHz``, regardless of how long the
+narration is. Sources may be a file path or the raw bytes of an audio file.
+"""
+
+import json
+import subprocess
+import threading
+from pathlib import Path
+from typing import List, Sequence, Union
+
+import numpy as np
+
+SAMPLE_RATE = 16000
+WINDOW_SECONDS = 30
+WINDOW_SAMPLES = SAMPLE_RATE * WINDOW_SECONDS
+N_FFT = 400
+HOP_LENGTH = 160
+
+AudioSource = Union[str, Path, bytes]
+
+
+def _ffmpeg_input(source: AudioSource) -> str:
+    return 'pipe:0' if isinstance(source, (bytes, bytearray)) else str(source)
+
+
+def _run_with_stdin(command: List[str], source: AudioSource) -> subprocess.Popen:
+    """Start ``command``; when the source is in memory, feed it on stdin from a helper thread."""
+    in_memory = isinstance(source, (bytes, bytearray))
+    process = subprocess.Popen(
+        command,
+        stdin=subprocess.PIPE if in_memory else subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL
+    )
+    if in_memory:
+        def feed_stdin():
+            try:
+                process.stdin.write(source)
+            except (BrokenPipeError, OSError, ValueError):
+                pass  # ffmpeg stops reading once it has the seconds it needs
+            finally:
+                try:
+                    process.stdin.close()
+                except (OSError, ValueError):
+                    pass
+        threading.Thread(target=feed_stdin, daemon=True).start()
+    return process
+
+
+def probe_duration(source: AudioSource) -> float:
+    """Return the duration in seconds reported by ffprobe, or 0.0 when unknown."""
+    process = _run_with_stdin(
+        ['ffprobe', '-v', 'error', '-show_entries', 'format=duration', '-of', 'json', _ffmpeg_input(source)],
+        source
+    )
+    # The stdin feeder thread owns stdin, so read stdout ourselves rather than communicate()
+    output = process.stdout.read()
+    process.stdout.close()
+    process.wait()
+    try:
+        return float(json.loads(output or b'{}')['format']['duration'])
+    except (KeyError, TypeError, ValueError):
+        return 0.0
+
+
+def read_pcm_window(source: AudioSource, start_seconds: float, out: np.ndarray,
+                    sample_rate: int = SAMPLE_RATE) -> int:
+    """
+    Decode ``len(out)`` samples starting at ``start_seconds`` into ``out`` (float32, mono).
+
+    ffmpeg seeks on the input and stops after the requested duration, so only the
+    needed seconds are decoded. Samples past the end of the audio are left as
+    zeros. Returns the number of samples actually decoded.
+    """
+    window_samples = len(out)
+    pcm_bytes = np.zeros(window_samples, dtype=np.int16)
+    pcm_view = memoryview(pcm_bytes).cast('B')
+
+    process = _run_with_stdin([
+        'ffmpeg', '-nostdin', '-threads', '0',
+        '-ss', f'{max(0.0, start_seconds):.3f}',
+        '-i', _ffmpeg_input(source),
+        '-t', f'{window_samples / sample_rate:.3f}',
+        '-f', 's16le', '-ac', '1', '-acodec', 'pcm_s16le', '-ar', str(sample_rate),
+        '-'
+    ], source)
+
+    bytes_read = 0
+    while bytes_read < len(pcm_view):
+        chunk_size = process.stdout.readinto(pcm_view[bytes_read:])
+        if not chunk_size:
+            break
+        bytes_read += chunk_size
+    process.stdout.close()
+    process.wait()
+
+    samples_read = bytes_read // 2
+    np.multiply(pcm_bytes, 1.0 / 32768.0, out=out, casting='unsafe')
+    out[samples_read:] = 0.0
+    return samples_read
+
+
+def window_start_times(duration_seconds: float, window_count: int,
+                       window_seconds: float = WINDOW_SECONDS) -> List[float]:
+    """Evenly spaced window starts covering start … middle … end of the audio."""
+    final_start = max(0.0, duration_seconds - window_seconds)
+    return sorted({round(float(start), 3) for start in np.linspace(0.0, final_start, max(1, window_count))})
+
+
+def decode_windows(source: AudioSource, start_times: Sequence[float],
+                   window_samples: int = WINDOW_SAMPLES) -> np.ndarray:
+    """Decode fixed-size windows into one preallocated ``(len(start_times), window_samples)`` array."""
+    windows = np.zeros((len(start_times), window_samples), dtype=np.float32)
+    for row, start_seconds in enumerate(start_times):
+        read_pcm_window(source, start_seconds, windows[row])
+    return windows
+
+
+def batched_log_mel(windows: np.ndarray, n_mels: int = 80, device=None):
+    """
+    Whisper's log-mel spectrogram for a whole batch of 30-second windows at once.
+
+    Matches ``whisper.log_mel_spectrogram`` per window (including the per-window
+    dynamic-range clamp) and returns a ``(batch, n_mels, 3000)`` torch tensor.
+    """
+    import torch
+    from whisper.audio import mel_filters
+
+    audio = torch.from_numpy(np.ascontiguousarray(windows, dtype=np.float32))
+    if device is not None:
+        audio = audio.to(device)
+
+    stft = torch.stft(audio, N_FFT, HOP_LENGTH, window=torch.hann_window(N_FFT).to(audio.device),
+                      return_complex=True)
+    magnitudes = stft[..., :-1].abs() ** 2
+    mel_spec = mel_filters(audio.device, n_mels) @ magnitudes
+
+    log_spec = torch.clamp(mel_spec, min=1e-10).log10()
+    log_spec = torch.maximum(log_spec, log_spec.amax(dim=(-2, -1), keepdim=True) - 8.0)
+    return (log_spec + 4.0) / 4.0
+
+
+def mel_filterbank(n_mels: int = 80, sample_rate: int = SAMPLE_RATE, n_fft: int = N_FFT) -> np.ndarray:
+    """Slaney-style mel filters, ``(n_mels, n_fft // 2 + 1)`` - the matrix Whisper ships in ``mel_filters.npz``."""
+    def hz_to_mel(hz):
+        hz = np.asarray(hz, dtype=np.float64)
+        return np.where(hz >= 1000.0, 15.0 + np.log(np.maximum(hz, 1e-10) / 1000.0) / (np.log(6.4) / 27.0), hz * 3.0 / 200.0)
+
+    def mel_to_hz(mel):
+        return np.where(mel >= 15.0, 1000.0 * np.exp((np.log(6.4) / 27.0) * (mel - 15.0)), mel * 200.0 / 3.0)
+
+    fft_frequencies = np.fft.rfftfreq(n_fft, 1.0 / sample_rate)
+    mel_edges = mel_to_hz(np.linspace(hz_to_mel(0.0), hz_to_mel(sample_rate / 2), n_mels + 2))
+    ramps = mel_edges[:, None] - fft_frequencies[None, :]
+    rising = -ramps[:-2] / np.diff(mel_edges)[:-1, None]
+    falling = ramps[2:] / np.diff(mel_edges)[1:, None]
+    weights = np.maximum(0.0, np.minimum(rising, falling))
+    weights *= (2.0 / (mel_edges[2:] - mel_edges[:-2]))[:, None]
+    return weights.astype(np.float32)
+
+
+def log_mel_windows(windows: np.ndarray, n_mels: int = 80) -> np.ndarray:
+    """
+    ``batched_log_mel`` in plain NumPy: a ``(batch, n_mels, 3000)`` float32 array.
+
+    Needs neither torch nor openai-whisper, so features can be computed (and
+    cached) in the decode stage whichever backend will hear them.
+    """
+    audio = np.pad(np.ascontiguousarray(windows, dtype=np.float32), [(0, 0), (N_FFT // 2, N_FFT // 2)], mode='reflect')
+    frames = np.lib.stride_tricks.sliding_window_view(audio, N_FFT, axis=-1)[:, ::HOP_LENGTH][:, :-1]
+    periodic_hann = (0.5 - 0.5 * np.cos(2.0 * np.pi * np.arange(N_FFT) / N_FFT)).astype(np.float32)
+    magnitudes = np.abs(np.fft.rfft(frames * periodic_hann, axis=-1)) ** 2
+    mel_spec = mel_filterbank(n_mels) @ magnitudes.transpose(0, 2, 1)
+
+    log_spec = np.log10(np.maximum(mel_spec, 1e-10))
+    log_spec = np.maximum(log_spec, log_spec.max(axis=(-2, -1), keepdims=True) - 8.0)
+    return ((log_spec + 4.0) / 4.0).astype(np.float32)
+
+
+def decode_all(source: AudioSource, sample_rate: int = SAMPLE_RATE) -> np.ndarray:
+    """
+    Decode a whole (usually in-memory, already truncated) source into one float32 array.
+
+    The buffer is sized from ffprobe's duration and doubled whenever ffmpeg has
+    more to give, so a piped or headerless input whose duration is unknown (or
+    understated) is still read to the end, as ``whisper.load_audio`` does.
+    """
+    duration_seconds = probe_duration(source)
+    pcm_bytes = np.zeros(int((max(duration_seconds, 0.0) + 1.0) * sample_rate), dtype=np.int16)
+
+    process = _run_with_stdin([
+        'ffmpeg', '-nostdin', '-threads', '0',
+        '-i', _ffmpeg_input(source),
+        '-f', 's16le', '-ac', '1', '-acodec', 'pcm_s16le', '-ar', str(sample_rate),
+        '-'
+    ], source)
+
+    bytes_read = 0
+    while True:
+        if bytes_read == pcm_bytes.nbytes:
+            pcm_bytes = np.concatenate([pcm_bytes, np.zeros_like(pcm_bytes)])
+        chunk_size = process.stdout.readinto(memoryview(pcm_bytes).cast('B')[bytes_read:])
+        if not chunk_size:
+            break
+        bytes_read += chunk_size
+    process.stdout.close()
+    process.wait()
+
+    samples_read = bytes_read // 2
+    waveform = np.empty(samples_read, dtype=np.float32)
+    np.multiply(pcm_bytes[:samples_read], 1.0 / 32768.0, out=waveform, casting='unsafe')
+    return waveform
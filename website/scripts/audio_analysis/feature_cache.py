@@ -0,0 +1,174 @@
+"""
+🧮 Memory-Mapped Log-Mel Feature Cache
+=====================================
+
+A second run with a different model size or backend hears exactly the same
+windows as the first one, yet decoding the MP3 and computing its log-mel
+spectrogram is most of the CPU time of a language glance. This cache keeps the
+``(windows, n_mels, 3000)`` float32 features of every file on disk, keyed by
+the SHA-256 of the audio bytes and the window parameters (window count, VAD
+lead, mel channels), so later runs and benchmark sweeps hand them straight to
+inference.
+
+Each entry is one ``.npy`` shard under a two-level directory
+(``ab/abcdef…-1a2b3c4d.npy``) and is opened with ``mmap_mode='r'``: a hit costs a few
+page faults, not a read. A small SQLite index next to the shards keeps sizes,
+the decode metadata (duration, speech fraction, onset) and last access; the
+shards are capped in total size and evicted least recently used first.
+
+The cache lives in ``WHISPER_FEATURE_CACHE`` (default ``~/.cache/whisper-features``);
+set it to ``off`` to disable it.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+
+import numpy as np
+
+DEFAULT_FEATURE_CACHE = Path.home() / '.cache' / 'whisper-features'
+DEFAULT_FEATURE_CACHE_MAX_MB = 2048
+INDEX_FILENAME = 'features.sqlite'
+
+
+def feature_cache_dir() -> Optional[Path]:
+    configured = os.environ.get('WHISPER_FEATURE_CACHE')
+    if configured == 'off':
+        return None
+    return Path(configured) if configured else DEFAULT_FEATURE_CACHE
+
+
+class FeatureCache:
+    """Log-mel feature shards on disk, indexed in SQLite and capped in size (LRU)."""
+
+    def __init__(self, cache_dir: Union[str, Path], max_mb: float = DEFAULT_FEATURE_CACHE_MAX_MB):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self.hits = 0
+        self.misses = 0
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # Decode threads share one connection behind a lock; WAL lets other runs read meanwhile
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(self.cache_dir / INDEX_FILENAME), timeout=30, check_same_thread=False)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute('''
+            CREATE TABLE IF NOT EXISTS feature_shards (
+                cache_key TEXT PRIMARY KEY,
+                content_sha256 TEXT NOT NULL,
+                variant TEXT NOT NULL,
+                shard_path TEXT NOT NULL,
+                metadata_json TEXT NOT NULL,
+                size_bytes INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+        ''')
+        self._connection.execute(
+            'CREATE INDEX IF NOT EXISTS idx_feature_shards_last_access ON feature_shards (last_access)'
+        )
+        self._connection.commit()
+
+    @staticmethod
+    def make_key(content_sha256: str, variant: str) -> str:
+        return f"{content_sha256}:{variant}"
+
+    @staticmethod
+    def shard_name(content_sha256: str, variant: str) -> str:
+        """``ab/abcdef…-<variant digest>.npy`` - 256 directories keep any one of them small."""
+        variant_digest = hashlib.sha256(variant.encode()).hexdigest()[:8]
+        return f"{content_sha256[:2]}/{content_sha256}-{variant_digest}.npy"
+
+    def get(self, content_sha256: str, variant: str) -> Optional[Tuple[np.ndarray, Dict]]:
+        """``(memory-mapped features, metadata)`` for this audio + variant, or None."""
+        cache_key = self.make_key(content_sha256, variant)
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT shard_path, metadata_json FROM feature_shards WHERE cache_key = ?', (cache_key,)
+            ).fetchone()
+            if row is not None:
+                try:
+                    features = np.load(self.cache_dir / row[0], mmap_mode='r')
+                except (OSError, ValueError):
+                    features = None  # shard removed or torn under us: forget the row
+                    self._connection.execute('DELETE FROM feature_shards WHERE cache_key = ?', (cache_key,))
+                if features is not None:
+                    self._connection.execute(
+                        'UPDATE feature_shards SET last_access = ? WHERE cache_key = ?', (time.time(), cache_key)
+                    )
+                self._connection.commit()
+                if features is not None:
+                    self.hits += 1
+                    return features, json.loads(row[1])
+            self.misses += 1
+            return None
+
+    def put(self, content_sha256: str, variant: str, features: np.ndarray, metadata: Dict):
+        """Write a shard (atomically) and index it, replacing any previous one, then enforce the size cap."""
+        shard_path = self.shard_name(content_sha256, variant)
+        target = self.cache_dir / shard_path
+        target.parent.mkdir(exist_ok=True)
+        staging = target.with_name(f".{target.stem}.{os.getpid()}.npy")
+        np.save(staging, np.ascontiguousarray(features, dtype=np.float32))
+        staging.replace(target)  # racing workers never map half a shard
+
+        now = time.time()
+        with self._lock:
+            self._connection.execute(
+                'INSERT OR REPLACE INTO feature_shards '
+                '(cache_key, content_sha256, variant, shard_path, metadata_json, size_bytes, created_at, last_access) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                (self.make_key(content_sha256, variant), content_sha256, variant, shard_path,
+                 json.dumps(metadata), target.stat().st_size, now, now)
+            )
+            self._connection.commit()
+            self._evict_locked()
+
+    def total_bytes(self) -> int:
+        with self._lock:
+            return self._total_bytes_locked()
+
+    def _total_bytes_locked(self) -> int:
+        return self._connection.execute('SELECT COALESCE(SUM(size_bytes), 0) FROM feature_shards').fetchone()[0]
+
+    def evict(self):
+        """Drop least recently used shards until the cache fits under its cap."""
+        with self._lock:
+            self._evict_locked()
+
+    def _evict_locked(self):
+        total_bytes = self._total_bytes_locked()
+        if total_bytes <= self.max_bytes:
+            return
+
+        doomed = []
+        for cache_key, shard_path, size_bytes in self._connection.execute(
+            'SELECT cache_key, shard_path, size_bytes FROM feature_shards ORDER BY last_access ASC'
+        ):
+            if total_bytes <= self.max_bytes:
+                break
+            doomed.append((cache_key, shard_path))
+            total_bytes -= size_bytes
+
+        self._connection.executemany('DELETE FROM feature_shards WHERE cache_key = ?',
+                                     [(cache_key,) for cache_key, _ in doomed])
+        self._connection.commit()
+        for _, shard_path in doomed:
+            # An open memory map keeps its pages until it is closed; unlinking is safe on POSIX
+            (self.cache_dir / shard_path).unlink(missing_ok=True)
+
+    def clear(self):
+        with self._lock:
+            shard_paths = self._connection.execute('SELECT shard_path FROM feature_shards').fetchall()
+            self._connection.execute('DELETE FROM feature_shards')
+            self._connection.commit()
+        for (shard_path,) in shard_paths:
+            (self.cache_dir / shard_path).unlink(missing_ok=True)
+
+    def close(self):
+        self._connection.close()
@@ -0,0 +1,212 @@
+"""
+🫆 Acoustic Fingerprints
+=======================
+
+A narration uploaded under the wrong language is sometimes a byte-different
+re-encode of another language's audio. Running Whisper over every file to find
+that out is slow; comparing fingerprints is not.
+
+Only the *same render* is caught: a re-encode, a volume change, a chunk cut
+from its full file. Two separate TTS renders of one text are not - their
+pacing and fine spectral detail differ, so almost no landmarks line up. The
+19587fa4 ``en``/``es``/``hi`` samples in audio_samples are three English
+renders of the same script and score about 0.0005 against each other, far
+below ``DEFAULT_MATCH_SCORE``. That case is left to the transcripts:
+``transcript_lsh`` puts those files in one cluster, because they say the same thing.
+
+``spectral_peak_hashes`` finds the loudest local peaks of the 0-4 kHz
+spectrogram and hashes pairs of nearby peaks as ``(f1, f2, dt)`` landmarks, each
+remembered with the frame it starts at. Landmarks survive re-encoding, volume
+changes and a different start offset. ``FingerprintIndex`` keeps the landmarks
+of every (job, lang) in one hash-sorted inverted index: a lookup is a binary
+search per landmark, and two recordings match when many shared landmarks agree
+on the *same* time offset. Checking one file costs the same whether the library
+holds ten files or ten thousand, and there is no pairwise comparison.
+
+Everything is NumPy; the index is saved as one ``.npz`` next to the analysis.
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from audio_analysis.decode import SAMPLE_RATE
+
+FINGERPRINT_INDEX_FILENAME = 'fingerprint_index.npz'
+FINGERPRINT_SECONDS = 60.0     # the opening that gets fingerprinted
+FFT_SIZE = 1024
+HOP_SIZE = 512                 # 32 ms frames at 16 kHz
+MAX_FREQUENCY_BIN = 256        # 4 kHz: the voice, not the codec's hiss
+PEAK_SPREAD = 5                # a peak is the maximum of its 11 x 11 neighbourhood
+PEAKS_PER_FRAME = 5
+FAN_OUT = 8                    # each peak is paired with the next 8 peaks ...
+MAX_PAIR_FRAMES = 63           # ... that start within ~2 s
+MAX_POSTINGS = 200             # landmarks this common say nothing about identity
+DEFAULT_MATCH_SCORE = 0.2
+
+
+def spectral_peak_hashes(pcm: np.ndarray, sample_rate: int = SAMPLE_RATE) -> Tuple[np.ndarray, np.ndarray]:
+    """Return ``(hashes, frame_offsets)`` of the spectral-peak landmarks in a mono waveform."""
+    if sample_rate != SAMPLE_RATE:
+        raise ValueError(f"fingerprints are computed at {SAMPLE_RATE} Hz, not {sample_rate}")
+    if len(pcm) < FFT_SIZE:
+        return np.zeros(0, dtype=np.uint32), np.zeros(0, dtype=np.int32)
+
+    frames = np.lib.stride_tricks.sliding_window_view(pcm.astype(np.float32), FFT_SIZE)[::HOP_SIZE]
+    spectrum = np.abs(np.fft.rfft(frames * np.hanning(FFT_SIZE).astype(np.float32), axis=-1))
+    log_spectrum = 20.0 * np.log10(spectrum[:, 1:MAX_FREQUENCY_BIN + 1] + 1e-6)
+
+    # 🏔️ Local maxima via a separable sliding maximum (time, then frequency)
+    padded = np.pad(log_spectrum, PEAK_SPREAD, mode='constant', constant_values=-np.inf)
+    neighbourhood = np.lib.stride_tricks.sliding_window_view(padded, 2 * PEAK_SPREAD + 1, axis=0).max(axis=-1)
+    neighbourhood = np.lib.stride_tricks.sliding_window_view(neighbourhood, 2 * PEAK_SPREAD + 1, axis=1).max(axis=-1)
+    is_peak = (log_spectrum == neighbourhood) & (log_spectrum > np.median(log_spectrum) + 10.0)
+
+    # 🎯 At most PEAKS_PER_FRAME peaks per frame, the loudest ones
+    candidates = np.where(is_peak, log_spectrum, -np.inf)
+    keep = min(PEAKS_PER_FRAME, candidates.shape[1])
+    loudest = np.argpartition(-candidates, keep - 1, axis=1)[:, :keep]
+    peak_frames = np.repeat(np.arange(len(candidates)), keep)
+    peak_bins = loudest.ravel()
+    real = np.isfinite(candidates[peak_frames, peak_bins])
+    peak_frames, peak_bins = peak_frames[real], peak_bins[real]
+
+    # 🔗 Pair every peak with the next FAN_OUT peaks in time
+    hashes, offsets = [], []
+    for step in range(1, FAN_OUT + 1):
+        anchor_frames, anchor_bins = peak_frames[:-step], peak_bins[:-step]
+        frame_gaps = peak_frames[step:] - anchor_frames
+        paired = (frame_gaps > 0) & (frame_gaps <= MAX_PAIR_FRAMES)
+        hashes.append((anchor_bins[paired].astype(np.uint32) << 14) |
+                      (peak_bins[step:][paired].astype(np.uint32) << 6) |
+                      frame_gaps[paired].astype(np.uint32))
+        offsets.append(anchor_frames[paired].astype(np.int32))
+    if not hashes:
+        return np.zeros(0, dtype=np.uint32), np.zeros(0, dtype=np.int32)
+    return np.concatenate(hashes), np.concatenate(offsets)
+
+
+def fingerprint_key(job_id: Optional[str], lang: Optional[str], audio_path) -> str:
+    """``{job_id}_{lang}`` for sample-named files, the path itself otherwise."""
+    return f"{job_id}_{lang}" if job_id and lang else str(audio_path)
+
+
+class FingerprintIndex:
+    """Landmarks of many recordings in one hash-sorted inverted index."""
+
+    def __init__(self):
+        self.entries: Dict[str, Dict] = {}   # key → job_id, lang, file_path, sha256, landmark_count
+        self._landmarks: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        self._postings = None                # (hashes, owners, offsets) sorted by hash, built lazily
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def has(self, key: str, sha256: str) -> bool:
+        return key in self.entries and self.entries[key].get('sha256') == sha256
+
+    def add(self, key: str, hashes: np.ndarray, offsets: np.ndarray, **details):
+        """Add (or replace) the landmarks of one recording; ``details`` are kept alongside."""
+        self.entries[key] = {**details, 'landmark_count': int(len(hashes))}
+        self._landmarks[key] = (hashes.astype(np.uint32), offsets.astype(np.int32))
+        self._postings = None
+
+    def update(self, other: 'FingerprintIndex'):
+        """Add every recording of another index (e.g. one shard's), replacing same-key entries."""
+        for key, (hashes, offsets) in other._landmarks.items():
+            details = {name: value for name, value in other.entries[key].items() if name != 'landmark_count'}
+            self.add(key, hashes, offsets, **details)
+
+    def _build_postings(self):
+        keys = list(self.entries)
+        if not keys:
+            return np.zeros(0, np.uint32), np.zeros(0, np.int32), np.zeros(0, np.int32), keys
+        hashes = np.concatenate([self._landmarks[key][0] for key in keys])
+        offsets = np.concatenate([self._landmarks[key][1] for key in keys])
+        owners = np.repeat(np.arange(len(keys), dtype=np.int32), [len(self._landmarks[key][0]) for key in keys])
+        order = np.argsort(hashes, kind='stable')
+        return hashes[order], owners[order], offsets[order], keys
+
+    def query(self, hashes: np.ndarray, offsets: np.ndarray) -> Dict[str, Tuple[int, int]]:
+        """``{key: (aligned_votes, frame_offset)}`` for every recording sharing time-aligned landmarks."""
+        if self._postings is None:
+            self._postings = self._build_postings()
+        posted_hashes, posted_owners, posted_offsets, keys = self._postings
+
+        first = np.searchsorted(posted_hashes, hashes, 'left')
+        counts = np.searchsorted(posted_hashes, hashes, 'right') - first
+        useful = (counts > 0) & (counts <= MAX_POSTINGS)
+        first, counts = first[useful], counts[useful]
+        if not counts.size:
+            return {}
+
+        # 📮 Expand every landmark into its postings without a Python loop
+        query_rows = np.repeat(np.flatnonzero(useful), counts)
+        run_starts = np.repeat(np.cumsum(counts) - counts, counts)
+        postings = np.repeat(first, counts) + np.arange(counts.sum()) - run_starts
+        owners = posted_owners[postings].astype(np.int64)
+        shifts = posted_offsets[postings].astype(np.int64) - offsets[query_rows]
+
+        # 🗳️ Votes per (recording, offset); each recording keeps its best offset
+        ballots, votes = np.unique((owners << 32) | (shifts + (1 << 31)), return_counts=True)
+        ballot_owners = ballots >> 32
+        order = np.lexsort((-votes, ballot_owners))
+        winners = order[np.r_[True, ballot_owners[order][1:] != ballot_owners[order][:-1]]]
+        return {
+            keys[int(ballot_owners[winner])]: (int(votes[winner]), int((ballots[winner] & 0xFFFFFFFF) - (1 << 31)))
+            for winner in winners
+        }
+
+    def duplicates(self, min_score: float = DEFAULT_MATCH_SCORE) -> List[Dict]:
+        """
+        Every pair of recordings that share enough time-aligned landmarks.
+
+        ``score`` is the aligned votes over the smaller recording's landmark count;
+        ``offset_seconds`` is how much later the shared audio comes in the second recording.
+        """
+        pairs = []
+        for key, (hashes, offsets) in self._landmarks.items():
+            for other, (votes, frame_offset) in self.query(hashes, offsets).items():
+                if other <= key:
+                    continue  # 🪞 itself, or a pair already seen from the other side
+                smaller = min(self.entries[key]['landmark_count'], self.entries[other]['landmark_count']) or 1
+                score = votes / smaller
+                if score < min_score:
+                    continue
+                first, second = self.entries[key], self.entries[other]
+                pairs.append({
+                    'key_a': key, 'job_id_a': first.get('job_id'), 'lang_a': first.get('lang'),
+                    'key_b': other, 'job_id_b': second.get('job_id'), 'lang_b': second.get('lang'),
+                    'same_job': bool(first.get('job_id')) and first.get('job_id') == second.get('job_id'),
+                    'score': round(score, 4),
+                    'aligned_landmarks': votes,
+                    'offset_seconds': round(frame_offset * HOP_SIZE / SAMPLE_RATE, 2)
+                })
+        return sorted(pairs, key=lambda pair: (-pair['score'], pair['key_a'], pair['key_b']))
+
+    def save(self, path: Union[str, Path]):
+        keys = list(self.entries)
+        path = Path(path)
+        staging = path.with_name(f".{path.stem}.staging.npz")
+        np.savez_compressed(
+            staging,
+            entries=np.array(json.dumps([{'key': key, **self.entries[key]} for key in keys])),
+            hashes=np.concatenate([self._landmarks[key][0] for key in keys]) if keys else np.zeros(0, np.uint32),
+            offsets=np.concatenate([self._landmarks[key][1] for key in keys]) if keys else np.zeros(0, np.int32),
+            counts=np.array([len(self._landmarks[key][0]) for key in keys], dtype=np.int64)
+        )
+        staging.replace(path)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> 'FingerprintIndex':
+        index = cls()
+        with np.load(path) as stored:
+            entries = json.loads(str(stored['entries']))
+            boundaries = np.cumsum(np.r_[0, stored['counts']])
+            for entry, start, end in zip(entries, boundaries[:-1], boundaries[1:]):
+                key = entry.pop('key')
+                entry.pop('landmark_count', None)
+                index.add(key, stored['hashes'][start:end], stored['offsets'][start:end], **entry)
+        return index
@@ -0,0 +1,187 @@
+"""
+📐 Declarative Fix Rules
+=======================
+
+The fix planner sorts every mismatch into an issue type with a priority,
+action, cost, impact and time estimate. Those decisions live in a rule table
+(``fix_rules.json`` next to this module, or any JSON file passed with
+``--rules``) rather than in Python:
+
+    {"scope": {"languages_match": {"equals": false}, "status": {"equals": "success"}},
+     "rules": [{"issue_type": "English misclassified",
+                "when": {"claimed_language": {"equals": "english"},
+                         "detected_language": {"not_in": ["en", "unknown"]}},
+                "priority": "HIGH", "action": "...", "estimated_cost": "...",
+                "business_impact": "...", "hours": 2},
+               ...]}
+
+Rows outside ``scope`` are never classified; the first rule whose ``when``
+holds wins, and an empty ``when`` catches everything left. Conditions are
+``equals`` / ``not_equals`` / ``in`` / ``not_in`` (case-insensitive for text)
+and ``below`` / ``at_least`` for numbers.
+
+Every condition is one boolean mask over the whole frame. Text columns are
+turned into categoricals once, a condition is decided per *category* (a handful
+of languages and statuses), and the answer is gathered back through the
+category codes, so a million rows are classified in well under a second. The
+issue columns come back as categoricals too. Measure it with:
+
+    python scripts/audio_analysis/fix_rules.py --benchmark 10000 100000 1000000
+"""
+
+import argparse
+import json
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+RULES_PATH = Path(__file__).with_name('fix_rules.json')
+RULE_FIELDS = ['issue_type', 'priority', 'action', 'estimated_cost', 'business_impact']
+TEXT_OPERATORS = {'equals', 'not_equals', 'in', 'not_in'}
+NUMBER_OPERATORS = {'below', 'at_least'}
+
+
+class FixRuleTable:
+    """An ordered table of conditions → issue type, priority, action, cost, impact and hours."""
+
+    def __init__(self, table: Dict):
+        self.scope = table.get('scope', {})
+        self.rules = table['rules']
+        for rule in self.rules:
+            missing = [field for field in RULE_FIELDS if field not in rule]
+            if missing:
+                raise ValueError(f"rule {rule.get('issue_type', '?')!r} is missing {missing}")
+        for conditions in [self.scope, *(rule.get('when', {}) for rule in self.rules)]:
+            for column, condition in conditions.items():
+                if len(condition) != 1 or not set(condition) <= TEXT_OPERATORS | NUMBER_OPERATORS:
+                    raise ValueError(f"condition on {column!r} needs exactly one of "
+                                     f"{sorted(TEXT_OPERATORS | NUMBER_OPERATORS)}, got {condition}")
+
+    @classmethod
+    def load(cls, path: Union[str, Path] = RULES_PATH) -> 'FixRuleTable':
+        with open(path, encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    @property
+    def issue_types(self) -> List[str]:
+        return [rule['issue_type'] for rule in self.rules]
+
+    @property
+    def hours(self) -> Dict[str, float]:
+        return {rule['issue_type']: float(rule.get('hours', 0)) for rule in self.rules}
+
+    @staticmethod
+    def _condition_mask(column: pd.Series, operator: str, wanted) -> np.ndarray:
+        if operator in NUMBER_OPERATORS:
+            numbers = pd.to_numeric(column, errors='coerce').to_numpy(dtype=float)
+            with np.errstate(invalid='ignore'):
+                return numbers < wanted if operator == 'below' else numbers >= wanted  # NaN is neither
+
+        if isinstance(wanted, bool) or pd.api.types.is_bool_dtype(column):
+            hits = column.fillna(False).to_numpy(dtype=bool) == bool(wanted)
+            return ~hits if operator in ('not_equals', 'not_in') else hits
+
+        # 🏷️ Decide once per category, then gather through the codes; code -1 (missing) lands on the trailing False
+        if not isinstance(column.dtype, pd.CategoricalDtype):
+            column = column.astype('category')
+        wanted = [str(value).lower() for value in (wanted if isinstance(wanted, list) else [wanted])]
+        category_hits = np.append(column.cat.categories.astype(str).str.lower().isin(wanted), False)
+        hits = category_hits[column.cat.codes.to_numpy()]
+        return ~hits if operator in ('not_equals', 'not_in') else hits
+
+    def _conditions_mask(self, df: pd.DataFrame, conditions: Dict, columns: Dict[str, pd.Series]) -> np.ndarray:
+        mask = np.ones(len(df), dtype=bool)
+        for column_name, condition in conditions.items():
+            if column_name not in df:
+                raise KeyError(f"rule column {column_name!r} is not in the analysis")
+            if column_name not in columns:
+                column = df[column_name]
+                if not (pd.api.types.is_bool_dtype(column) or pd.api.types.is_numeric_dtype(column)
+                        or isinstance(column.dtype, pd.CategoricalDtype)):
+                    column = column.astype('category')
+                columns[column_name] = column
+            (operator, wanted), = condition.items()
+            mask &= self._condition_mask(columns[column_name], operator, wanted)
+        return mask
+
+    def classify(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        The in-scope rows that some rule claims, in rule order (stable within a
+        rule), with the rule's fields added as categorical columns.
+        """
+        columns: Dict[str, pd.Series] = {}
+        unclaimed = self._conditions_mask(df, self.scope, columns)
+        rule_numbers = np.full(len(df), -1, dtype=np.int16)
+        for rule_number, rule in enumerate(self.rules):
+            claimed = unclaimed & self._conditions_mask(df, rule.get('when', {}), columns)
+            rule_numbers[claimed] = rule_number
+            unclaimed &= ~claimed
+
+        positions = np.flatnonzero(rule_numbers >= 0)
+        positions = positions[np.argsort(rule_numbers[positions], kind='stable')]
+        kept_rules = rule_numbers[positions]
+        classified = df.iloc[positions].reset_index(drop=True)
+        for field in RULE_FIELDS:
+            values = [rule[field] for rule in self.rules]
+            categories = list(dict.fromkeys(values))
+            codes = np.array([categories.index(value) for value in values], dtype=np.int16)
+            classified[field] = pd.Categorical.from_codes(codes[kept_rules], categories=categories)
+        return classified
+
+
+def synthetic_analysis(rows: int, seed: int = 0) -> pd.DataFrame:
+    """Verdict columns shaped like the analysis store's, for benchmarking."""
+    rng = np.random.default_rng(seed)
+    claimed_codes = rng.integers(0, 3, rows)
+    detected = np.array(['en', 'es', 'hi', 'unknown'], dtype=object)[
+        np.where(rng.random(rows) < 0.8, claimed_codes, rng.integers(0, 4, rows))
+    ]
+    return pd.DataFrame({
+        'file_path': [f"audio_samples/{row:08x}_full.mp3" for row in range(rows)],
+        'claimed_language': np.array(['english', 'spanish', 'hindi'], dtype=object)[claimed_codes],
+        'detected_language': detected,
+        'languages_match': detected == np.array(['en', 'es', 'hi'], dtype=object)[claimed_codes],
+        'confidence': rng.random(rows).round(4),
+        'status': np.where(rng.random(rows) < 0.97, 'success', 'no_speech').astype(object)
+    })
+
+
+def benchmark(sizes: List[int], rules: Optional[FixRuleTable] = None, repeat: int = 3) -> List[Dict]:
+    """Best-of-``repeat`` classification time for synthetic analyses of each size."""
+    rules = rules or FixRuleTable.load()
+    report = []
+    for rows in sizes:
+        analysis = synthetic_analysis(rows)
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            classified = rules.classify(analysis)
+            timings.append(time.perf_counter() - started)
+        best = min(timings)
+        report.append({'rows': rows, 'classified': len(classified), 'seconds': round(best, 4),
+                       'rows_per_second': round(rows / best) if best else None})
+    return report
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Check a fix rule table or benchmark its classification')
+    parser.add_argument('--rules', default=str(RULES_PATH), help='Rule table JSON (default: the bundled one)')
+    parser.add_argument('--benchmark', nargs='+', type=int, metavar='ROWS', default=[10_000, 100_000, 1_000_000],
+                        help='Synthetic analysis sizes (default: 10000 100000 1000000)')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed runs per size; the best is kept (default: 3)')
+    parser.add_argument('--output', default=None, help='Also write the results as JSON')
+    args = parser.parse_args()
+
+    table = FixRuleTable.load(args.rules)
+    print(f"{len(table.rules)} rules: {', '.join(table.issue_types)}")
+    results = benchmark(args.benchmark, table, max(1, args.repeat))
+    for result in results:
+        print(f"{result['rows']:>10,} rows: {result['seconds']:.4f}s "
+              f"({result['rows_per_second']:,} rows/s, {result['classified']:,} classified)")
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"Results written to {args.output}")
@@ -0,0 +1,196 @@
+"""
+⏱️ Pipeline Instrumentation
+==========================
+
+Spans, counters and optional profiling for the analysis pipeline.
+
+Every stage (scan, fetch, decode, inference, metadata, compare, report,
+model_load) appends its wall-clock seconds to a ``StageClock``; counters track
+cache hits, misses and per-status file counts. ``write_summary`` dumps both as
+JSON, and ``write_openmetrics`` writes a textfile that node_exporter's textfile
+collector can pick up. With profiling on, ``profiled`` runs a stage's work under
+a per-thread cProfile (merged per stage) and ``snapshot`` records tracemalloc's
+top allocations at phase boundaries.
+
+``SampledLogFilter`` lets only every Nth occurrence of each log message through,
+so per-file chatter stays readable and cheap on large runs.
+"""
+
+import cProfile
+import io
+import json
+import logging
+import os
+import pstats
+import threading
+import time
+import tracemalloc
+from collections import defaultdict
+from contextlib import contextmanager
+from functools import wraps
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+PERCENTILES = (50, 90, 95, 99)
+METRIC_PREFIX = 'audio_analysis'
+SUMMARY_FILENAME = 'pipeline_metrics.json'
+OPENMETRICS_FILENAME = 'pipeline_metrics.prom'
+
+
+class StageClock:
+    """Collects wall-clock latencies per named stage, plain counters and (optionally) profiles."""
+
+    def __init__(self, profile_dir: Optional[Path] = None):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.counters: Dict[str, int] = defaultdict(int)
+        self.profile_dir = Path(profile_dir) if profile_dir else None
+        self._stage_profiles: Dict[str, pstats.Stats] = {}
+        self._memory_phases: List[Dict] = []
+        self._last_snapshot = None
+        self._lock = threading.Lock()
+        if self.profile_dir is not None:
+            self.profile_dir.mkdir(parents=True, exist_ok=True)
+            tracemalloc.start(10)
+
+    @contextmanager
+    def span(self, stage: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - started)
+
+    def record(self, stage: str, seconds: float):
+        with self._lock:
+            self.latencies[stage].append(seconds)
+
+    def count(self, counter: str, amount: int = 1):
+        with self._lock:
+            self.counters[counter] += amount
+
+    def profiled(self, stage: str, work: Callable) -> Callable:
+        """``work`` itself, or - when profiling - ``work`` run under its own cProfile, merged into ``stage``."""
+        if self.profile_dir is None:
+            return work
+
+        @wraps(work)
+        def profiled_work(*args, **kwargs):
+            profile = cProfile.Profile()
+            profile.enable()
+            try:
+                return work(*args, **kwargs)
+            finally:
+                profile.disable()
+                with self._lock:
+                    if stage in self._stage_profiles:
+                        self._stage_profiles[stage].add(profile)
+                    else:
+                        self._stage_profiles[stage] = pstats.Stats(profile)
+        return profiled_work
+
+    def snapshot(self, phase: str, top: int = 25):
+        """When profiling: record tracemalloc's current/peak and the top allocation growth since the last phase."""
+        if self.profile_dir is None:
+            return
+        snapshot = tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap*>'),
+        ])
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        statistics = (snapshot.compare_to(self._last_snapshot, 'lineno') if self._last_snapshot is not None
+                      else snapshot.statistics('lineno'))
+        self._last_snapshot = snapshot
+
+        with open(self.profile_dir / f"tracemalloc_{len(self._memory_phases):02d}_{phase}.txt", 'w') as f:
+            f.write(f"phase={phase} current={current} peak={peak}\n")
+            for statistic in statistics[:top]:
+                f.write(f"{statistic}\n")
+        self._memory_phases.append({'phase': phase, 'traced_bytes': current, 'peak_traced_bytes': peak})
+
+    def write_profiles(self, top: int = 30):
+        """One ``<stage>.pstats`` (for snakeviz / pstats) and a cumulative-time text summary per stage."""
+        if self.profile_dir is None:
+            return
+        for stage, stats in self._stage_profiles.items():
+            stats.dump_stats(str(self.profile_dir / f"{stage}.pstats"))
+            listing = io.StringIO()
+            pstats.Stats(str(self.profile_dir / f"{stage}.pstats"), stream=listing).sort_stats('cumulative').print_stats(top)
+            (self.profile_dir / f"{stage}.txt").write_text(listing.getvalue())
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """``{stage: {count, total_seconds, p50_ms, p90_ms, p95_ms, p99_ms, max_ms}}``."""
+        stages = {}
+        with self._lock:
+            for stage, samples in sorted(self.latencies.items()):
+                samples_ms = np.asarray(samples) * 1000.0
+                stages[stage] = {
+                    'count': len(samples),
+                    'total_seconds': round(float(samples_ms.sum()) / 1000.0, 4),
+                    **{f"p{q}_ms": round(float(value), 2)
+                       for q, value in zip(PERCENTILES, np.percentile(samples_ms, PERCENTILES))},
+                    'max_ms': round(float(samples_ms.max()), 2)
+                }
+        return stages
+
+    def write_summary(self, path: Path, **context) -> Path:
+        document = {
+            **context,
+            'stages': self.summary(),
+            'counters': dict(sorted(self.counters.items()))
+        }
+        if self._memory_phases:
+            document['memory'] = self._memory_phases
+        with open(path, 'w') as f:
+            json.dump(document, f, indent=2)
+        return path
+
+    def write_openmetrics(self, path: Path, labels: Optional[Dict[str, str]] = None) -> Path:
+        """Text exposition for node_exporter's textfile collector; written to a temp file and renamed into place."""
+        base_labels = ''.join(f',{key}="{value}"' for key, value in sorted((labels or {}).items()))
+        lines = [
+            f"# HELP {METRIC_PREFIX}_stage_seconds Wall-clock seconds spent per pipeline stage.",
+            f"# TYPE {METRIC_PREFIX}_stage_seconds summary",
+        ]
+        with self._lock:
+            for stage, samples in sorted(self.latencies.items()):
+                stage_labels = f'stage="{stage}"{base_labels}'
+                for q, value in zip(PERCENTILES, np.percentile(samples, PERCENTILES)):
+                    lines.append(f'{METRIC_PREFIX}_stage_seconds{{{stage_labels},quantile="{q / 100}"}} {value:.6f}')
+                lines.append(f'{METRIC_PREFIX}_stage_seconds_sum{{{stage_labels}}} {sum(samples):.6f}')
+                lines.append(f'{METRIC_PREFIX}_stage_seconds_count{{{stage_labels}}} {len(samples)}')
+
+            for counter, value in sorted(self.counters.items()):
+                metric = f"{METRIC_PREFIX}_{counter}_total"
+                lines.append(f"# TYPE {metric} counter")
+                lines.append(f"{metric}{{{base_labels.lstrip(',')}}} {value}")
+
+        lines.append(f"# TYPE {METRIC_PREFIX}_last_run_timestamp_seconds gauge")
+        lines.append(f"{METRIC_PREFIX}_last_run_timestamp_seconds{{{base_labels.lstrip(',')}}} {time.time():.0f}")
+        lines.append('# EOF')
+
+        path = Path(path)
+        staging = path.with_name(f".{path.name}.{os.getpid()}")
+        staging.write_text('\n'.join(lines) + '\n')
+        staging.replace(path)
+        return path
+
+
+class SampledLogFilter(logging.Filter):
+    """Let through the 1st, (N+1)th, (2N+1)th ... occurrence of each distinct message template."""
+
+    def __init__(self, every: int):
+        super().__init__()
+        self.every = max(1, every)
+        self._seen: Dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        with self._lock:
+            occurrence = self._seen[record.msg]
+            self._seen[record.msg] += 1
+        return occurrence % self.every == 0
@@ -0,0 +1,282 @@
+"""
+🎼 MP3 Frame Headers Without Decoding
+====================================
+
+Just enough of the MPEG audio frame format to work with partial MP3 files:
+skip a leading ID3v2 tag, read the first frame header (bitrate, sample rate,
+frame length), and find the last complete frame in a byte prefix so a Range
+download can be cut on a clean frame boundary.
+
+``probe_mp3`` reads duration, bitrate and sample rate from the first few
+kilobytes plus the total size. VBR files carry an exact frame count in a
+Xing/Info (LAME) or VBRI header; for plain CBR files the count comes from the
+size. The same headers state how many bytes the encoder wrote, so a file that
+is shorter than that - an interrupted upload, a half-written TTS output - is
+caught without decoding a sample. ``probe_mp3_file`` also checks that a local
+file ends on a complete frame.
+"""
+
+import os
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+PROBE_HEAD_BYTES = 16 * 1024
+PROBE_TAIL_BYTES = 8 * 1024
+ID3V1_SIZE = 128
+TRUNCATION_TOLERANCE = 0.98  # share of the announced bytes a file must have
+MIN_AUDIO_FRAMES = 4  # ~0.1 s; fewer audio frames than this is a stub, not speech
+
+# Bitrates in kbps indexed by [version_family][layer][bitrate_index]
+_BITRATES_KBPS = {
+    'mpeg1': {
+        1: (0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+        2: (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+        3: (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    },
+    'mpeg2': {
+        1: (0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+        2: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+        3: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    },
+}
+
+_SAMPLE_RATES = {
+    '1': (44100, 48000, 32000),
+    '2': (22050, 24000, 16000),
+    '2.5': (11025, 12000, 8000),
+}
+
+_VERSION_BITS = {0b00: '2.5', 0b10: '2', 0b11: '1'}
+_LAYER_BITS = {0b01: 3, 0b10: 2, 0b11: 1}
+
+
+def id3v2_size(data: bytes) -> int:
+    """Size in bytes of a leading ID3v2 tag (header and footer included), or 0."""
+    if len(data) < 10 or data[:3] != b'ID3':
+        return 0
+    tag_size = (data[6] & 0x7F) << 21 | (data[7] & 0x7F) << 14 | (data[8] & 0x7F) << 7 | (data[9] & 0x7F)
+    has_footer = bool(data[5] & 0x10)
+    return 10 + tag_size + (10 if has_footer else 0)
+
+
+def parse_frame_header(data: bytes, offset: int = 0) -> Optional[Dict]:
+    """Decode the 4-byte MPEG audio frame header at ``offset``, or return None if it is not one."""
+    if offset + 4 > len(data):
+        return None
+    b1, b2, b3 = data[offset + 1], data[offset + 2], data[offset + 3]
+    if data[offset] != 0xFF or (b1 & 0xE0) != 0xE0:
+        return None
+
+    version = _VERSION_BITS.get((b1 >> 3) & 0b11)
+    layer = _LAYER_BITS.get((b1 >> 1) & 0b11)
+    bitrate_index = (b2 >> 4) & 0x0F
+    sample_rate_index = (b2 >> 2) & 0b11
+    if version is None or layer is None or bitrate_index in (0, 15) or sample_rate_index == 3:
+        return None
+
+    bitrate = _BITRATES_KBPS['mpeg1' if version == '1' else 'mpeg2'][layer][bitrate_index] * 1000
+    sample_rate = _SAMPLE_RATES[version][sample_rate_index]
+    padding = (b2 >> 1) & 0x01
+
+    if layer == 1:
+        samples_per_frame = 384
+        frame_length = (12 * bitrate // sample_rate + padding) * 4
+    else:
+        samples_per_frame = 1152 if (layer == 2 or version == '1') else 576
+        frame_length = samples_per_frame // 8 * bitrate // sample_rate + padding
+
+    return {
+        'version': version,
+        'layer': layer,
+        'bitrate': bitrate,
+        'sample_rate': sample_rate,
+        'channel_mode': (b3 >> 6) & 0b11,
+        'padding': padding,
+        'samples_per_frame': samples_per_frame,
+        'frame_length': frame_length,
+    }
+
+
+def find_first_frame(data: bytes, start: int = 0, confirm_frames: int = 2) -> Optional[int]:
+    """
+    Offset of the first complete frame at or after ``start`` that is followed by
+    ``confirm_frames`` more complete frames (guards against false syncs in tag data).
+    A frame whose declared length runs past the end of ``data`` never counts, so a
+    stub of a header or two has no first frame at all.
+    """
+    offset = data.find(b'\xff', start)
+    while offset != -1 and offset + 4 <= len(data):
+        next_offset = offset
+        for _ in range(confirm_frames + 1):
+            header = parse_frame_header(data, next_offset)
+            if not header or next_offset + header['frame_length'] > len(data):
+                break
+            next_offset += header['frame_length']
+        else:
+            return offset
+        offset = data.find(b'\xff', offset + 1)
+    return None
+
+
+def last_frame_boundary(data: bytes) -> int:
+    """Length of the longest prefix of ``data`` that ends exactly on a complete frame."""
+    offset = find_first_frame(data, id3v2_size(data))
+    if offset is None:
+        return 0
+    while True:
+        header = parse_frame_header(data, offset)
+        if not header or offset + header['frame_length'] > len(data):
+            return offset
+        offset += header['frame_length']
+
+
+def _side_info_length(header: Dict) -> int:
+    """Bytes of Layer III side information after the 4-byte header (where a Xing tag starts)."""
+    mono = header['channel_mode'] == 0b11
+    if header['version'] == '1':
+        return 17 if mono else 32
+    return 9 if mono else 17
+
+
+def parse_xing(data: bytes, frame_offset: int, header: Dict) -> Optional[Dict]:
+    """The Xing/Info tag in the first frame: frame count, byte count and the LAME encoder delay/padding."""
+    tag_offset = frame_offset + 4 + _side_info_length(header)
+    if data[tag_offset:tag_offset + 4] not in (b'Xing', b'Info') or tag_offset + 8 > len(data):
+        return None
+    flags = int.from_bytes(data[tag_offset + 4:tag_offset + 8], 'big')
+    cursor = tag_offset + 8
+    tag = {'vbr': data[tag_offset:tag_offset + 4] == b'Xing', 'frames': None, 'bytes': None,
+           'encoder_delay': 0, 'encoder_padding': 0}
+    if flags & 0x1:
+        tag['frames'] = int.from_bytes(data[cursor:cursor + 4], 'big')
+        cursor += 4
+    if flags & 0x2:
+        tag['bytes'] = int.from_bytes(data[cursor:cursor + 4], 'big')
+        cursor += 4
+    cursor += 100 if flags & 0x4 else 0  # seek table
+    cursor += 4 if flags & 0x8 else 0    # quality
+    # 🏷️ LAME extension: 9-byte encoder string ... then 12-bit delay and 12-bit padding at +21
+    if data[cursor:cursor + 4] == b'LAME' and cursor + 24 <= len(data):
+        delay_padding = int.from_bytes(data[cursor + 21:cursor + 24], 'big')
+        tag['encoder_delay'], tag['encoder_padding'] = delay_padding >> 12, delay_padding & 0xFFF
+    return tag
+
+
+def parse_vbri(data: bytes, frame_offset: int) -> Optional[Dict]:
+    """The Fraunhofer VBRI tag, always 32 bytes after the first frame header."""
+    tag_offset = frame_offset + 4 + 32
+    if data[tag_offset:tag_offset + 4] != b'VBRI' or tag_offset + 18 > len(data):
+        return None
+    return {'vbr': True,
+            'bytes': int.from_bytes(data[tag_offset + 10:tag_offset + 14], 'big'),
+            'frames': int.from_bytes(data[tag_offset + 14:tag_offset + 18], 'big'),
+            'encoder_delay': 0, 'encoder_padding': 0}
+
+
+def probe_mp3(head: bytes, total_size: Optional[int] = None, has_id3v1: bool = False) -> Dict:
+    """
+    Duration, bitrate and sample rate from the start of an MP3 and (optionally) its total size.
+
+    ``head`` only needs the ID3v2 tag and the first frame - a Range-fetched prefix
+    and its Content-Length are enough. Returns a dict with ``status``:
+    ``'ok'``, ``'empty'`` (no bytes, no MPEG frames, or fewer than
+    ``MIN_AUDIO_FRAMES`` of them), or ``'truncated'`` (fewer bytes or frames than
+    the Xing/VBRI header announces), plus ``duration``, ``bitrate``
+    (average, bit/s), ``sample_rate``, ``channels``, ``frames``, ``vbr``,
+    ``duration_source`` (``'xing'``, ``'vbri'`` or ``'cbr'``), ``audio_start``,
+    ``expected_bytes`` and ``file_size``.
+    """
+    if total_size == 0 or not head:
+        return {'status': 'empty', 'duration': 0.0, 'file_size': total_size or 0}
+    audio_start = find_first_frame(head, id3v2_size(head))
+    header = parse_frame_header(head, audio_start) if audio_start is not None else None
+    if header is None:
+        return {'status': 'empty', 'duration': 0.0, 'file_size': total_size}
+
+    tag = None
+    if header['layer'] == 3:
+        tag = parse_xing(head, audio_start, header) or parse_vbri(head, audio_start)
+    audio_end = (total_size - (ID3V1_SIZE if has_id3v1 else 0)) if total_size is not None else None
+
+    if tag and tag['frames']:
+        samples = tag['frames'] * header['samples_per_frame'] - tag['encoder_delay'] - tag['encoder_padding']
+        duration = max(samples, 0) / header['sample_rate']
+        # 📏 The tag frame itself holds no audio; the announced byte count includes it
+        expected_bytes = tag['bytes']
+        audio_bytes = expected_bytes or ((audio_end - audio_start) if audio_end is not None else None)
+        bitrate = int(audio_bytes * 8 / duration) if audio_bytes and duration else header['bitrate']
+        source = 'vbri' if head[audio_start + 36:audio_start + 40] == b'VBRI' else 'xing'
+        frames = tag['frames']
+    else:
+        expected_bytes = None
+        bitrate = header['bitrate']
+        duration = (audio_end - audio_start) * 8 / bitrate if audio_end is not None else None
+        frames = round(duration * header['sample_rate'] / header['samples_per_frame']) if duration else None
+        source = 'cbr'
+
+    truncated = (expected_bytes is not None and audio_end is not None
+                 and audio_end - audio_start < expected_bytes * TRUNCATION_TOLERANCE)
+    status = 'truncated' if truncated else 'ok'
+    if status == 'ok' and audio_end is not None:
+        # 🧮 Audio frames actually on disk; a tag frame holds none, so it is left out
+        if source == 'cbr':
+            frames_present = (audio_end - audio_start) * 8 / bitrate * header['sample_rate'] / header['samples_per_frame']
+        else:
+            average_frame = expected_bytes / frames if expected_bytes else header['frame_length']
+            frames_present = (audio_end - audio_start - header['frame_length']) / average_frame
+        if frames_present < MIN_AUDIO_FRAMES:
+            status = 'truncated' if source != 'cbr' and frames >= MIN_AUDIO_FRAMES else 'empty'
+    return {
+        'status': status,
+        'duration': round(duration, 3) if duration is not None else None,
+        'bitrate': bitrate,
+        'sample_rate': header['sample_rate'],
+        'channels': 1 if header['channel_mode'] == 0b11 else 2,
+        'frames': frames,
+        'vbr': bool(tag and tag['vbr']),
+        'duration_source': source,
+        'audio_start': audio_start,
+        'expected_bytes': expected_bytes,
+        'file_size': total_size,
+    }
+
+
+def ends_on_frame(tail: bytes) -> Optional[bool]:
+    """
+    Whether the last bytes of an MP3 finish with a complete frame (an ID3v1 tag may follow).
+
+    ``None`` when no frame chain can be found in ``tail``; ``False`` when the last
+    frame announces more bytes than are left.
+    """
+    if tail[-ID3V1_SIZE:-ID3V1_SIZE + 3] == b'TAG':
+        tail = tail[:-ID3V1_SIZE]
+    offset = find_first_frame(tail, 0, confirm_frames=3)
+    if offset is None:
+        return None
+    while offset + 4 <= len(tail):
+        header = parse_frame_header(tail, offset)
+        if header is None:
+            return None  # trailing junk that is not a frame: nothing to conclude
+        offset += header['frame_length']
+    return offset <= len(tail) and (offset == len(tail) or len(tail) - offset < 4)
+
+
+def probe_mp3_file(path: Union[str, Path]) -> Dict:
+    """``probe_mp3`` for a local file (head and size only), plus a check that it ends on a whole frame."""
+    total_size = os.path.getsize(path)
+    if total_size == 0:
+        return {'status': 'empty', 'duration': 0.0, 'file_size': 0}
+    with open(path, 'rb') as audio_file:
+        head = audio_file.read(PROBE_HEAD_BYTES)
+        tag_size = id3v2_size(head)
+        if tag_size + 4 > len(head):  # 🖼️ a large embedded cover: read past the tag
+            audio_file.seek(0)
+            head = audio_file.read(tag_size + PROBE_HEAD_BYTES)
+        # 🔚 The tail never reaches back into the ID3v2 tag, so a short file is walked from its first frame
+        audio_file.seek(max(min(tag_size, total_size), total_size - PROBE_TAIL_BYTES))
+        tail = audio_file.read()
+
+    probe = probe_mp3(head, total_size, has_id3v1=tail[-ID3V1_SIZE:-ID3V1_SIZE + 3] == b'TAG')
+    if probe['status'] == 'ok' and ends_on_frame(tail) is False:
+        probe['status'] = 'truncated'
+    return probe
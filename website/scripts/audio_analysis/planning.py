@@ -0,0 +1,99 @@
+"""
+🗺️ Prefix-Aware Analysis Planning
+================================
+
+``download-audio-samples.py`` saves every language of a job as
+``{job_id}_{lang}_full.mp3`` and, when chunks exist, ``{job_id}_{lang}_chunk_0.mp3``.
+The first chunk is the opening of the full file, so analyzing both decodes the
+same audio twice. This module groups files by (job_id, lang) so the analyzer
+can listen to the cheapest member of each group once and fan the verdict back
+out to every file in it.
+
+For runs spread over several machines, ``shard_of`` assigns every (job_id, lang)
+to one of n shards by a stable hash, so a family never straddles two shards and
+every machine agrees on the split without talking to the others.
+"""
+
+import hashlib
+import re
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+SAMPLE_NAME_PATTERN = re.compile(
+    r'^(?P<job_id>[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})'
+    r'_(?P<lang>[a-z]{2,3})_(?P<kind>full|chunk_(?P<chunk_index>\d+))\.\w+$',
+    re.IGNORECASE
+)
+SHARD_RESULTS_FILENAME = 'shard_results.json'
+
+
+def parse_sample_name(filename: str) -> Optional[Dict]:
+    """Split ``{job_id}_{lang}_{full|chunk_N}.ext`` into its parts, or return None."""
+    match = SAMPLE_NAME_PATTERN.match(filename)
+    if not match:
+        return None
+    chunk_index = match.group('chunk_index')
+    return {
+        'job_id': match.group('job_id').lower(),
+        'lang': match.group('lang').lower(),
+        'is_full': match.group('kind').lower() == 'full',
+        'chunk_index': int(chunk_index) if chunk_index is not None else None
+    }
+
+
+def _listening_cost(audio_path) -> int:
+    """Bytes on disk as a stand-in for decode cost; unknown sizes sort last."""
+    try:
+        return Path(audio_path).stat().st_size
+    except (OSError, TypeError):
+        return 1 << 62
+
+
+def plan_analysis_groups(audio_paths: List) -> List[Dict]:
+    """
+    Group audio files by (job_id, lang) and pick a representative for each group.
+
+    The representative is the first chunk when there is one (it is a prefix of
+    the full file), otherwise the cheapest member. Files whose names do not follow
+    the sample naming scheme become groups of one. Groups keep the order in which
+    their first member appears in ``audio_paths``.
+    """
+    groups: Dict[tuple, Dict] = {}
+    for audio_path in audio_paths:
+        parsed = parse_sample_name(audio_path.name)
+        group_key = (parsed['job_id'], parsed['lang']) if parsed else (str(audio_path), None)
+        group = groups.setdefault(group_key, {
+            'job_id': parsed['job_id'] if parsed else None,
+            'lang': parsed['lang'] if parsed else None,
+            'members': [],
+            'full': None,
+            'first_chunk': None
+        })
+        group['members'].append(audio_path)
+        if parsed and parsed['is_full']:
+            group['full'] = audio_path
+        elif parsed and parsed['chunk_index'] == 0:
+            group['first_chunk'] = audio_path
+
+    for group in groups.values():
+        group['representative'] = group['first_chunk'] or min(group['members'], key=_listening_cost)
+        # The file to escalate to: the full narration when we have it
+        group['escalation_target'] = group['full'] or group['representative']
+
+    return list(groups.values())
+
+
+def parse_shard(spec: str) -> Tuple[int, int]:
+    """``'2/4'`` → ``(2, 4)``; shards are numbered from 1. Raises ``ValueError``."""
+    index, _, count = spec.partition('/')
+    index, count = int(index), int(count)
+    if not 1 <= index <= count:
+        raise ValueError(f"shard {spec!r} is not between 1/{count} and {count}/{count}")
+    return index, count
+
+
+def shard_of(audio_path, shard_count: int) -> int:
+    """The 1-based shard of a file: a SHA-256 of its ``{job_id}_{lang}`` (or, failing that, its name)."""
+    parsed = parse_sample_name(audio_path.name)
+    shard_key = f"{parsed['job_id']}_{parsed['lang']}" if parsed else audio_path.name
+    return int.from_bytes(hashlib.sha256(shard_key.encode()).digest()[:8], 'big') % shard_count + 1
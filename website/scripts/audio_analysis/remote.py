@@ -0,0 +1,278 @@
+"""
+🌐 Remote Audio via HTTP Range Reads
+===================================
+
+Lets the analyzer read production audio straight from Supabase storage URLs
+instead of downloading every multi-megabyte MP3 first. Only the first N
+seconds of each file are fetched with an HTTP ``Range`` request, cut on an MP3
+frame boundary, and kept in memory.
+
+Sources come from an ``audio_jobs`` export (``audio_urls[lang]`` plus the first
+entry of ``language_statuses[lang].chunk_audio_urls``) or from a plain list of
+URLs. ``RangeRequestHandler`` serves a local directory with Range support, so
+the whole path can be exercised against the ``audio_samples/`` fixtures:
+
+    python scripts/audio_analysis/remote.py --serve ./audio_samples --port 8765
+"""
+
+import argparse
+import json
+import os
+import re
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import unquote, urlparse
+
+import requests
+
+try:
+    from .mp3 import find_first_frame, id3v2_size, last_frame_boundary, parse_frame_header, probe_mp3
+except ImportError:  # run directly as a script to serve fixtures
+    from mp3 import find_first_frame, id3v2_size, last_frame_boundary, parse_frame_header, probe_mp3
+
+DEFAULT_PREFIX_SECONDS = 60
+HEADER_PROBE_BYTES = 16 * 1024
+PREFIX_SAFETY_MARGIN = 1.1
+
+
+class RemoteAudio:
+    """
+    An audio file that lives behind a URL.
+
+    Quacks enough like a ``Path`` for the analyzer (``.name``, ``str()``), and
+    fetches its first ``prefix_seconds`` lazily on first access to ``.payload``.
+    """
+
+    def __init__(self, url: str, name: str, prefix_seconds: float = DEFAULT_PREFIX_SECONDS,
+                 headers: Optional[Dict[str, str]] = None):
+        self.url = url
+        self.name = name
+        self.prefix_seconds = prefix_seconds
+        self.headers = headers or {}
+        self.content_length: Optional[int] = None
+        self.first_frame: Optional[Dict] = None
+        self._payload: Optional[bytes] = None
+
+    def __str__(self) -> str:
+        return self.url
+
+    def __repr__(self) -> str:
+        return f"RemoteAudio({self.url!r}, name={self.name!r})"
+
+    def __lt__(self, other) -> bool:
+        return (self.name, self.url) < (other.name, other.url)
+
+    def __getstate__(self) -> Dict:
+        # Worker processes only need the handle; the fetched bytes stay with the fetcher
+        return {**self.__dict__, '_payload': None}
+
+    @property
+    def payload(self) -> bytes:
+        if self._payload is None:
+            self._payload, self.content_length, self.first_frame = fetch_audio_prefix(
+                self.url, self.prefix_seconds, headers=self.headers
+            )
+        return self._payload
+
+    @property
+    def probe(self) -> Dict:
+        """``probe_mp3`` of the fetched prefix and Content-Length: whole-file duration, bitrate, integrity."""
+        return probe_mp3(self.payload, self.content_length)
+
+    @property
+    def estimated_duration(self) -> float:
+        """Whole-file duration from the Xing/VBRI frame count, or Content-Length and the first frame's bitrate."""
+        return self.probe.get('duration') or 0.0
+
+
+def _ranged_get(session: requests.Session, url: str, first_byte: int, last_byte: int,
+                headers: Dict[str, str]) -> Tuple[bytes, Optional[int]]:
+    """
+    GET bytes ``first_byte..last_byte`` and the total size; copes with servers that ignore Range.
+
+    A server that answers ``200`` sends the file from byte 0, so the bytes before
+    ``first_byte`` are read and dropped - the result always starts where it was asked to.
+    """
+    response = session.get(url, headers={**headers, 'Range': f'bytes={first_byte}-{last_byte}'},
+                           stream=True, timeout=30)
+    response.raise_for_status()
+
+    total_size = None
+    content_range = response.headers.get('Content-Range', '')
+    match = re.match(r'bytes \d+-\d+/(\d+)', content_range)
+    if match:
+        total_size = int(match.group(1))
+    elif response.headers.get('Content-Length') and response.status_code == 200:
+        total_size = int(response.headers['Content-Length'])
+
+    wanted = last_byte - first_byte + 1
+    if response.status_code == 206:
+        body = response.content
+    else:
+        # 🐢 Range ignored: the whole file from byte 0 - read up to what we asked for, then hang up
+        body = bytearray()
+        for chunk in response.iter_content(chunk_size=64 * 1024):
+            body.extend(chunk)
+            if len(body) >= first_byte + wanted:
+                break
+        response.close()
+        body = bytes(body[first_byte:first_byte + wanted])
+    return body, total_size
+
+
+def fetch_audio_prefix(url: str, seconds: float = DEFAULT_PREFIX_SECONDS,
+                       session: Optional[requests.Session] = None,
+                       headers: Optional[Dict[str, str]] = None) -> Tuple[bytes, Optional[int], Optional[Dict]]:
+    """
+    Fetch roughly the first ``seconds`` of an MP3 with Range requests.
+
+    A small probe request reads any ID3v2 tag and the first frame header; its
+    bitrate tells us how many bytes the requested seconds need. The result is
+    trimmed to the last complete frame. Returns ``(bytes, total_size, first_frame_header)``.
+    """
+    session = session or requests.Session()
+    headers = headers or {}
+
+    probe, total_size = _ranged_get(session, url, 0, HEADER_PROBE_BYTES - 1, headers)
+    tag_size = id3v2_size(probe)
+    if tag_size + 4 > len(probe) and (total_size is None or len(probe) < total_size):
+        probe, total_size = _ranged_get(session, url, 0, tag_size + HEADER_PROBE_BYTES - 1, headers)
+
+    frame_offset = find_first_frame(probe, tag_size)
+    first_frame = parse_frame_header(probe, frame_offset) if frame_offset is not None else None
+    if first_frame is None:
+        return probe, total_size, None  # not an MP3 we understand; let ffmpeg try the probe
+
+    wanted_bytes = frame_offset + int(seconds * first_frame['bitrate'] / 8 * PREFIX_SAFETY_MARGIN)
+    if total_size is not None:
+        wanted_bytes = min(wanted_bytes, total_size)
+
+    if wanted_bytes <= len(probe):
+        body = probe[:wanted_bytes]
+    else:
+        remainder, _ = _ranged_get(session, url, len(probe), wanted_bytes - 1, headers)
+        body = probe + remainder
+
+    if total_size is None or len(body) < total_size:
+        body = body[:last_frame_boundary(body)]
+    return body, total_size, first_frame
+
+
+def probe_remote_mp3(url: str, session: Optional[requests.Session] = None,
+                     headers: Optional[Dict[str, str]] = None) -> Dict:
+    """``probe_mp3`` from one small Range request (two with a large ID3v2 tag); adds ``total_size``."""
+    session = session or requests.Session()
+    headers = headers or {}
+    probe, total_size = _ranged_get(session, url, 0, HEADER_PROBE_BYTES - 1, headers)
+    tag_size = id3v2_size(probe)
+    if tag_size + 4 > len(probe) and (total_size is None or len(probe) < total_size):
+        probe, total_size = _ranged_get(session, url, 0, tag_size + HEADER_PROBE_BYTES - 1, headers)
+    return {**probe_mp3(probe, total_size), 'total_size': total_size}
+
+
+def storage_headers() -> Dict[str, str]:
+    service_key = os.getenv('SUPABASE_SERVICE_ROLE_KEY')
+    return {'Authorization': f'Bearer {service_key}'} if service_key else {}
+
+
+def sources_from_audio_jobs(jobs_file: str, prefix_seconds: float = DEFAULT_PREFIX_SECONDS,
+                            include_first_chunk: bool = True) -> List[RemoteAudio]:
+    """
+    Build remote sources from an ``audio_jobs`` export, named the way
+    ``download-audio-samples.py`` names its files so metadata parsing and
+    (job, language) planning work unchanged.
+    """
+    with open(jobs_file, 'r') as f:
+        jobs = json.load(f)
+
+    headers = storage_headers()
+    sources = []
+    for job in jobs:
+        job_id = job.get('id', 'unknown')
+        for lang, url in (job.get('audio_urls') or {}).items():
+            if not url:
+                continue
+            sources.append(RemoteAudio(url, f"{job_id}_{lang}_full.mp3", prefix_seconds, headers))
+
+            chunk_urls = ((job.get('language_statuses') or {}).get(lang) or {}).get('chunk_audio_urls') or []
+            if include_first_chunk and chunk_urls:
+                sources.append(RemoteAudio(chunk_urls[0], f"{job_id}_{lang}_chunk_0.mp3", prefix_seconds, headers))
+    return sources
+
+
+def sources_from_url_list(urls_file: str, prefix_seconds: float = DEFAULT_PREFIX_SECONDS) -> List[RemoteAudio]:
+    """One URL per line; blank lines and ``#`` comments are skipped."""
+    headers = storage_headers()
+    sources = []
+    with open(urls_file, 'r') as f:
+        for line in f:
+            url = line.strip()
+            if url and not url.startswith('#'):
+                name = Path(unquote(urlparse(url).path)).name or url
+                sources.append(RemoteAudio(url, name, prefix_seconds, headers))
+    return sources
+
+
+class RangeRequestHandler(SimpleHTTPRequestHandler):
+    """``SimpleHTTPRequestHandler`` plus single-range ``Range: bytes=a-b`` support."""
+
+    def send_head(self):
+        range_header = self.headers.get('Range')
+        match = re.fullmatch(r'bytes=(\d*)-(\d*)', range_header or '')
+        path = self.translate_path(self.path)
+        if not match or not os.path.isfile(path):
+            return super().send_head()
+
+        file_size = os.path.getsize(path)
+        first_text, last_text = match.groups()
+        if first_text:
+            first_byte = int(first_text)
+            last_byte = min(int(last_text), file_size - 1) if last_text else file_size - 1
+        else:
+            first_byte = max(0, file_size - int(last_text or 0))
+            last_byte = file_size - 1
+        if first_byte >= file_size or first_byte > last_byte:
+            self.send_error(416, 'Requested Range Not Satisfiable')
+            return None
+
+        audio_file = open(path, 'rb')
+        audio_file.seek(first_byte)
+        self._range_remaining = last_byte - first_byte + 1
+        self.send_response(206)
+        self.send_header('Content-Type', self.guess_type(path))
+        self.send_header('Content-Range', f'bytes {first_byte}-{last_byte}/{file_size}')
+        self.send_header('Content-Length', str(self._range_remaining))
+        self.send_header('Accept-Ranges', 'bytes')
+        self.end_headers()
+        return audio_file
+
+    def copyfile(self, source, outputfile):
+        remaining = getattr(self, '_range_remaining', None)
+        if remaining is None:
+            return super().copyfile(source, outputfile)
+        while remaining > 0:
+            chunk = source.read(min(64 * 1024, remaining))
+            if not chunk:
+                break
+            outputfile.write(chunk)
+            remaining -= len(chunk)
+        self._range_remaining = None
+
+
+def serve_directory(directory: str, host: str = '127.0.0.1', port: int = 8765) -> ThreadingHTTPServer:
+    """Create (but do not start) a Range-capable HTTP server for ``directory``."""
+    handler = lambda *args, **kwargs: RangeRequestHandler(*args, directory=directory, **kwargs)  # noqa: E731
+    return ThreadingHTTPServer((host, port), handler)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Serve a directory with HTTP Range support')
+    parser.add_argument('--serve', required=True, help='Directory to serve, e.g. ./audio_samples')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    args = parser.parse_args()
+
+    server = serve_directory(args.serve, args.host, args.port)
+    print(f"Serving {args.serve} with Range support on http://{args.host}:{args.port}/")
+    server.serve_forever()
@@ -0,0 +1,122 @@
+"""
+🗄️ Content-Addressed Analysis Result Cache
+=========================================
+
+Remembers the result of analyzing a piece of audio, keyed by the SHA-256 of
+the audio bytes plus the analysis variant (model, backend, mode and any
+detection parameters). A renamed or re-downloaded file with identical bytes
+is still a hit; a different model or mode is a miss.
+
+The cache is a single SQLite file that can be shared by several worker
+processes. It is capped in size and evicts the least recently used entries.
+"""
+
+import hashlib
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+DEFAULT_CACHE_FILENAME = 'analysis_cache.sqlite'
+DEFAULT_CACHE_MAX_MB = 512
+
+
+def hash_audio_bytes(source: Union[Path, bytes]) -> str:
+    """Return the SHA-256 hex digest of a file's contents or of raw bytes."""
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return hashlib.sha256(source).hexdigest()
+    with open(source, 'rb') as audio_file:
+        return hashlib.file_digest(audio_file, 'sha256').hexdigest()
+
+
+class AnalysisResultCache:
+    """SQLite-backed LRU cache of analysis result dicts."""
+
+    def __init__(self, db_path: Union[str, Path], max_mb: float = DEFAULT_CACHE_MAX_MB):
+        self.db_path = Path(db_path)
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self.hits = 0
+        self.misses = 0
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # The warm daemon answers from handler threads; callers serialise access themselves
+        self._connection = sqlite3.connect(str(self.db_path), timeout=30, check_same_thread=False)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute('''
+            CREATE TABLE IF NOT EXISTS analysis_results (
+                cache_key TEXT PRIMARY KEY,
+                content_sha256 TEXT NOT NULL,
+                variant TEXT NOT NULL,
+                result_json TEXT NOT NULL,
+                size_bytes INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+        ''')
+        self._connection.execute(
+            'CREATE INDEX IF NOT EXISTS idx_analysis_results_last_access ON analysis_results (last_access)'
+        )
+        self._connection.commit()
+
+    @staticmethod
+    def make_key(content_sha256: str, variant: str) -> str:
+        return f"{content_sha256}:{variant}"
+
+    def get(self, content_sha256: str, variant: str) -> Optional[Dict]:
+        """Return the cached result for this audio + variant, or None."""
+        cache_key = self.make_key(content_sha256, variant)
+        row = self._connection.execute(
+            'SELECT result_json FROM analysis_results WHERE cache_key = ?', (cache_key,)
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+
+        self._connection.execute(
+            'UPDATE analysis_results SET last_access = ? WHERE cache_key = ?', (time.time(), cache_key)
+        )
+        self._connection.commit()
+        self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, content_sha256: str, variant: str, result: Dict):
+        """Store a result, replacing any previous entry, then enforce the size cap."""
+        result_json = json.dumps(result)
+        now = time.time()
+        self._connection.execute(
+            'INSERT OR REPLACE INTO analysis_results '
+            '(cache_key, content_sha256, variant, result_json, size_bytes, created_at, last_access) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?)',
+            (self.make_key(content_sha256, variant), content_sha256, variant,
+             result_json, len(result_json), now, now)
+        )
+        self._connection.commit()
+        self.evict()
+
+    def evict(self):
+        """Drop least recently used entries until the cache fits under its cap."""
+        total_bytes = self._connection.execute(
+            'SELECT COALESCE(SUM(size_bytes), 0) FROM analysis_results'
+        ).fetchone()[0]
+        if total_bytes <= self.max_bytes:
+            return
+
+        doomed_keys = []
+        for cache_key, size_bytes in self._connection.execute(
+            'SELECT cache_key, size_bytes FROM analysis_results ORDER BY last_access ASC'
+        ):
+            if total_bytes <= self.max_bytes:
+                break
+            doomed_keys.append((cache_key,))
+            total_bytes -= size_bytes
+
+        self._connection.executemany('DELETE FROM analysis_results WHERE cache_key = ?', doomed_keys)
+        self._connection.commit()
+
+    def clear(self):
+        self._connection.execute('DELETE FROM analysis_results')
+        self._connection.commit()
+
+    def close(self):
+        self._connection.close()
@@ -0,0 +1,179 @@
+"""
+🔤 Character N-gram Text Language Identification
+===============================================
+
+A second opinion on language that never listens to audio. A text is scored
+against per-language character-trigram profiles: log-probabilities of the most
+frequent trigrams, bundled in ``text_language_profiles.json`` for en, es and hi.
+The profiles were built from the Strapi admin's own en/es/hi interface strings
+plus a few paragraphs of narration-style prose.
+
+Scoring is vectorized over whole batches of sentences. The batch is joined into
+one array of code points, every trigram is hashed with a few integer operations
+into a 2^20-bucket weight table, and each sentence's per-language totals are
+one ``np.bincount`` each. A single core scores well over a million short
+sentences a minute.
+
+The analyzer uses it to check transcripts sentence by sentence against the
+audio verdict. ``regenerate-affected-audio.py`` uses it to refuse sending
+untranslated text to TTS. Rebuild the profiles from plain-text corpora with:
+
+    python scripts/audio_analysis/text_language.py --build en=corpus_en.txt es=corpus_es.txt hi=corpus_hi.txt
+"""
+
+import argparse
+import json
+import re
+from collections import Counter
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+PROFILE_PATH = Path(__file__).with_name('text_language_profiles.json')
+PROFILE_SIZE = 2000            # trigrams kept per language
+HASH_BITS = 20
+BATCH_SENTENCES = 100_000
+SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?।॥])\s+|\n+')
+_SEPARATOR = 0                 # code point between sentences; no trigram spans it
+_SPACE = 32
+
+
+def _code_points(text: str) -> np.ndarray:
+    return np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32)
+
+
+def _normalized_code_points(text: str) -> np.ndarray:
+    """Lowercased code points with digits and punctuation as single spaces; separators are kept."""
+    points = _code_points(text.lower()).copy()
+    ascii_noise = (points < 128) & ~((points >= 97) & (points <= 122)) & (points != _SEPARATOR)
+    wider_noise = (((points >= 0x00A0) & (points <= 0x00BF)) | ((points >= 0x2000) & (points <= 0x206F)) |
+                   ((points >= 0x0964) & (points <= 0x096F)))  # Latin-1 punctuation, general punctuation, danda, Devanagari digits
+    points[ascii_noise | wider_noise] = _SPACE
+    repeated_space = (points == _SPACE) & np.r_[False, points[:-1] == _SPACE]
+    return points[~repeated_space]
+
+
+def _trigram_buckets(points: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """``(bucket per trigram, mask of trigrams not crossing a separator)`` for a code-point array."""
+    if len(points) < 3:
+        return np.zeros(0, dtype=np.uint32), np.zeros(0, dtype=bool)
+    first, second, third = points[:-2], points[1:-1], points[2:]
+    with np.errstate(over='ignore'):
+        mixed = (first * np.uint32(0x9E3779B1)) ^ (second * np.uint32(0x85EBCA77)) ^ (third * np.uint32(0xC2B2AE3D))
+    whole = (first != _SEPARATOR) & (second != _SEPARATOR) & (third != _SEPARATOR)
+    return mixed >> np.uint32(32 - HASH_BITS), whole
+
+
+def split_sentences(text: str) -> List[str]:
+    return [sentence.strip() for sentence in SENTENCE_BOUNDARY.split(text or '') if sentence.strip()]
+
+
+def build_profile(texts: Iterable[str], size: int = PROFILE_SIZE) -> Dict:
+    """Log-probabilities of the ``size`` most frequent trigrams, plus a floor for everything else."""
+    trigrams = Counter()
+    for text in texts:
+        padded = ''.join(chr(point) for point in _normalized_code_points(f" {text} "))
+        trigrams.update(padded[index:index + 3] for index in range(len(padded) - 2))
+    total = sum(trigrams.values())
+    kept = dict(trigrams.most_common(size))
+    return {
+        'floor': round(float(np.log(0.5 / total)), 4),
+        'trigrams': {trigram: round(float(np.log(count / total)), 4) for trigram, count in kept.items()}
+    }
+
+
+class TextLanguageIdentifier:
+    """Scores batches of sentences against trigram profiles; ``identify`` is the whole API."""
+
+    def __init__(self, profiles: Optional[Dict[str, Dict]] = None):
+        profiles = profiles or load_profiles()
+        self.languages = sorted(profiles)
+        self.weights = np.empty((1 << HASH_BITS, len(self.languages)), dtype=np.float32)
+        for column, language in enumerate(self.languages):
+            self.weights[:, column] = profiles[language]['floor']
+            trigrams = list(profiles[language]['trigrams'])
+            if trigrams:
+                buckets, _ = _trigram_buckets(_code_points('\x01'.join(trigrams)))
+                starts = np.arange(len(trigrams)) * 4  # each trigram and its '\x01' joiner take four code points
+                self.weights[buckets[starts], column] = list(profiles[language]['trigrams'].values())
+
+    def identify(self, sentences: Sequence[str]) -> Tuple[List[str], np.ndarray]:
+        """``(language per sentence, confidence per sentence)``; sentences with no letters are ``'unknown'``."""
+        languages: List[str] = []
+        confidences = []
+        for batch_start in range(0, len(sentences), BATCH_SENTENCES):
+            batch = sentences[batch_start:batch_start + BATCH_SENTENCES]
+            batch_languages, batch_confidences = self._identify_batch(batch)
+            languages.extend(batch_languages)
+            confidences.append(batch_confidences)
+        return languages, np.concatenate(confidences) if confidences else np.zeros(0, dtype=np.float32)
+
+    def _identify_batch(self, sentences: Sequence[str]) -> Tuple[List[str], np.ndarray]:
+        points = _normalized_code_points('\x00'.join(f" {sentence} " for sentence in sentences))
+        buckets, whole = _trigram_buckets(points)
+        owners = np.cumsum(points[:-2] == _SEPARATOR)[whole] if len(points) >= 3 else np.zeros(0, dtype=np.int64)
+        buckets = buckets[whole]
+
+        trigram_counts = np.bincount(owners, minlength=len(sentences))
+        scores = np.stack([
+            np.bincount(owners, weights=self.weights[buckets, column], minlength=len(sentences))
+            for column in range(len(self.languages))
+        ], axis=1)
+        best = scores.argmax(axis=1)
+
+        # ⚖️ Confidence: softmax over the per-language log-likelihoods, tempered by sentence length
+        tempered = (scores - scores.max(axis=1, keepdims=True)) / np.sqrt(np.maximum(trigram_counts, 1))[:, None]
+        probabilities = np.exp(tempered)
+        confidence = probabilities.max(axis=1) / probabilities.sum(axis=1)
+
+        heard = trigram_counts > 0
+        return ([self.languages[column] if ok else 'unknown' for column, ok in zip(best, heard)],
+                np.where(heard, confidence, 0.0).astype(np.float32))
+
+    def dominant_language(self, text: str) -> Dict:
+        """
+        The language of most of a text's characters, and how its sentences split.
+
+        Returns ``language``, ``share`` (of sentence characters in that language),
+        ``sentence_languages`` and ``sentences``.
+        """
+        sentences = split_sentences(text)
+        languages, _ = self.identify(sentences)
+        characters = Counter()
+        for sentence, language in zip(sentences, languages):
+            characters[language] += len(sentence)
+        if not characters:
+            return {'language': 'unknown', 'share': 0.0, 'sentence_languages': [], 'sentences': []}
+        language, count = characters.most_common(1)[0]
+        return {'language': language, 'share': round(count / sum(characters.values()), 4),
+                'sentence_languages': languages, 'sentences': sentences}
+
+
+def load_profiles(path: Path = PROFILE_PATH) -> Dict[str, Dict]:
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)['profiles']
+
+
+@lru_cache(maxsize=1)
+def default_identifier() -> TextLanguageIdentifier:
+    """The identifier over the bundled profiles, built once per process."""
+    return TextLanguageIdentifier()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Rebuild the bundled trigram profiles from plain-text corpora')
+    parser.add_argument('--build', nargs='+', required=True, metavar='LANG=FILE',
+                        help='One plain-text corpus per language, e.g. en=corpus_en.txt')
+    parser.add_argument('--size', type=int, default=PROFILE_SIZE, help=f'Trigrams per language (default: {PROFILE_SIZE})')
+    args = parser.parse_args()
+
+    built = {}
+    for assignment in args.build:
+        language, corpus_path = assignment.split('=', 1)
+        built[language] = build_profile(Path(corpus_path).read_text(encoding='utf-8').splitlines(), args.size)
+        print(f"{language}: {len(built[language]['trigrams'])} trigrams from {corpus_path}")
+    with open(PROFILE_PATH, 'w', encoding='utf-8') as f:
+        json.dump({'ngram': 3, 'profiles': built}, f, ensure_ascii=False, separators=(',', ':'))
+    print(f"Profiles written to {PROFILE_PATH}")
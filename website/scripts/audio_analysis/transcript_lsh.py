@@ -0,0 +1,192 @@
+"""
+🧬 Near-Duplicate Transcripts (MinHash + LSH)
+============================================
+
+Two "different language" files that say the same thing have near-identical
+transcripts. Comparing every transcript with every other is quadratic; this
+module keeps it roughly linear.
+
+Each transcript becomes a set of character 5-gram shingles (hashed with NumPy
+over the raw bytes) and then a 128-value MinHash signature from a
+multiply-shift hash family. The fraction of equal signature values estimates
+the Jaccard similarity of two shingle sets. For locality-sensitive hashing the
+signature is cut into 32 bands of 4 rows. Transcripts that collide in any band
+become candidates: with these bands a pair at Jaccard 0.5 collides with
+probability ~0.87, a pair at 0.2 with ~0.05. Candidates are grouped per band
+by sorting, not by a nested loop. Only candidates are scored, and the
+confirmed pairs are joined into clusters with union-find.
+
+The index (keys, details and signatures) is saved as one ``.npz`` next to the
+analysis, so later runs add to it instead of starting over.
+"""
+
+import json
+import re
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+import numpy as np
+
+TRANSCRIPT_INDEX_FILENAME = 'transcript_lsh.npz'
+SHINGLE_SIZE = 5
+SIGNATURE_SIZE = 128
+BANDS = 32
+ROWS_PER_BAND = SIGNATURE_SIZE // BANDS
+DEFAULT_SIMILARITY = 0.5
+
+_PERMUTATIONS = np.random.default_rng(20250908).integers(1, 2 ** 63, size=(2, SIGNATURE_SIZE), dtype=np.uint64) | np.uint64(1)
+_SHINGLE_WEIGHTS = np.uint64(1099511628211) ** np.arange(SHINGLE_SIZE, dtype=np.uint64)  # FNV prime powers
+_EMPTY_SIGNATURE = np.full(SIGNATURE_SIZE, np.iinfo(np.uint32).max, dtype=np.uint32)
+
+
+def normalize_transcript(text: str) -> str:
+    return re.sub(r'\s+', ' ', re.sub(r'[^\w\s]', ' ', text.lower())).strip()
+
+
+def shingle_hashes(text: str) -> np.ndarray:
+    """Distinct 64-bit hashes of the character 5-grams of a normalized transcript."""
+    encoded = np.frombuffer(normalize_transcript(text).encode('utf-8'), dtype=np.uint8).astype(np.uint64)
+    if len(encoded) < SHINGLE_SIZE:
+        return encoded[:0]
+    with np.errstate(over='ignore'):
+        return np.unique(np.lib.stride_tricks.sliding_window_view(encoded, SHINGLE_SIZE) @ _SHINGLE_WEIGHTS)
+
+
+def minhash_signature(text: str) -> np.ndarray:
+    """128 minimums of ``(a * shingle + b) >> 32`` - one per hash function in the family."""
+    shingles = shingle_hashes(text)
+    if not len(shingles):
+        return _EMPTY_SIGNATURE.copy()
+    with np.errstate(over='ignore'):
+        hashed = (shingles[None, :] * _PERMUTATIONS[0][:, None] + _PERMUTATIONS[1][:, None]) >> np.uint64(32)
+    return hashed.min(axis=1).astype(np.uint32)
+
+
+class TranscriptIndex:
+    """MinHash signatures of many transcripts with banded LSH lookups."""
+
+    def __init__(self):
+        self.entries: Dict[str, Dict] = {}
+        self._signatures: Dict[str, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def add(self, key: str, text: str, **details):
+        """Add (or replace) one transcript; empty transcripts are ignored."""
+        if not normalize_transcript(text):
+            self.entries.pop(key, None)
+            self._signatures.pop(key, None)
+            return
+        self.entries[key] = details
+        self._signatures[key] = minhash_signature(text)
+
+    def similarity(self, key: str, other: str) -> float:
+        """Estimated Jaccard similarity of two indexed transcripts."""
+        return float(np.mean(self._signatures[key] == self._signatures[other]))
+
+    @staticmethod
+    def _band_keys(signatures: np.ndarray) -> np.ndarray:
+        """One 64-bit key per (transcript, band): the band's four 32-bit rows folded together."""
+        halves = np.ascontiguousarray(signatures).view(np.uint64).reshape(len(signatures), BANDS, ROWS_PER_BAND // 2)
+        with np.errstate(over='ignore'):
+            return halves[..., 0] ^ (halves[..., 1] * np.uint64(0x9E3779B97F4A7C15))
+
+    def candidate_pairs(self) -> np.ndarray:
+        """``(n, 2)`` index pairs (into ``self.entries`` order) that share at least one LSH band."""
+        keys = list(self.entries)
+        if len(keys) < 2:
+            return np.zeros((0, 2), dtype=np.int64)
+        signatures = np.stack([self._signatures[key] for key in keys])
+        band_keys = self._band_keys(signatures)
+
+        pairs = []
+        for band in range(BANDS):
+            bucket_values, buckets = np.unique(band_keys[:, band], return_inverse=True)
+            if len(bucket_values) == len(keys):
+                continue  # every transcript alone in its bucket
+            order = np.argsort(buckets, kind='stable')
+            sorted_buckets = buckets[order]
+            run_edges = np.flatnonzero(np.r_[True, sorted_buckets[1:] != sorted_buckets[:-1], True])
+            for start, end in zip(run_edges[:-1], run_edges[1:]):
+                if end - start > 1:
+                    members = order[start:end]
+                    left, right = np.triu_indices(len(members), k=1)
+                    pairs.append(np.stack([members[left], members[right]], axis=1))
+        if not pairs:
+            return np.zeros((0, 2), dtype=np.int64)
+        return np.unique(np.sort(np.concatenate(pairs), axis=1), axis=0)
+
+    def clusters(self, min_similarity: float = DEFAULT_SIMILARITY, keep_pair=None) -> List[Dict]:
+        """
+        Near-duplicate clusters, most similar first.
+
+        ``keep_pair(details_a, details_b)`` may veto a confirmed pair (e.g. a chunk
+        and its own full file). Each cluster lists its members, its confirmed pairs
+        with their similarity, and the lowest / mean pairwise similarity.
+        """
+        keys = list(self.entries)
+        parents = list(range(len(keys)))
+
+        def root(node):
+            while parents[node] != node:
+                parents[node] = parents[parents[node]]
+                node = parents[node]
+            return node
+
+        confirmed = []
+        for left, right in self.candidate_pairs():
+            score = self.similarity(keys[left], keys[right])
+            if score < min_similarity:
+                continue
+            if keep_pair is not None and not keep_pair(self.entries[keys[left]], self.entries[keys[right]]):
+                continue
+            confirmed.append((int(left), int(right), score))
+            parents[root(left)] = root(right)
+
+        grouped: Dict[int, Dict] = {}
+        for left, right, score in confirmed:
+            cluster = grouped.setdefault(root(left), {'members': set(), 'pairs': []})
+            cluster['members'].update((left, right))
+            cluster['pairs'].append({'a': keys[left], 'b': keys[right], 'similarity': round(score, 4)})
+
+        report = []
+        for cluster in grouped.values():
+            scores = [pair['similarity'] for pair in cluster['pairs']]
+            report.append({
+                'members': [{'key': keys[member], **self.entries[keys[member]]} for member in sorted(cluster['members'])],
+                'pairs': sorted(cluster['pairs'], key=lambda pair: -pair['similarity']),
+                'min_similarity': min(scores),
+                'mean_similarity': round(float(np.mean(scores)), 4)
+            })
+        report.sort(key=lambda cluster: (-cluster['mean_similarity'], cluster['members'][0]['key']))
+        for number, cluster in enumerate(report):
+            cluster['cluster'] = number
+        return report
+
+    def save(self, path: Union[str, Path]):
+        keys = list(self.entries)
+        path = Path(path)
+        staging = path.with_name(f".{path.stem}.staging.npz")
+        np.savez_compressed(
+            staging,
+            entries=np.array(json.dumps([{'key': key, **self.entries[key]} for key in keys])),
+            signatures=(np.stack([self._signatures[key] for key in keys]) if keys
+                        else np.zeros((0, SIGNATURE_SIZE), dtype=np.uint32))
+        )
+        staging.replace(path)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> 'TranscriptIndex':
+        index = cls()
+        with np.load(path) as stored:
+            for entry, signature in zip(json.loads(str(stored['entries'])), stored['signatures']):
+                key = entry.pop('key')
+                index.entries[key] = entry
+                index._signatures[key] = signature.copy()
+        return index
+
+
+def cluster_label(clusters: List[Dict]) -> Dict[str, Optional[int]]:
+    """``{key: cluster number}`` for every clustered transcript."""
+    return {member['key']: cluster['cluster'] for cluster in clusters for member in cluster['members']}
@@ -0,0 +1,86 @@
+"""
+🧊 Memory-Mapped Whisper Weight Cache
+====================================
+
+``whisper.load_model()`` unpickles the whole checkpoint into fresh memory on
+every call, and every pool worker pays that again. This module converts a
+model once into a zip-format torch file holding its ready-to-use float32
+``state_dict``, then loads it with ``torch.load(mmap=True)`` into a model built
+on the ``meta`` device with ``load_state_dict(assign=True)``. No weights are
+copied: parameters are views onto the mapped file, so every worker on the host
+shares the same read-only page-cache pages and a "load" is mostly page faults.
+
+The cache lives in ``WHISPER_WEIGHT_CACHE`` (default ``~/.cache/whisper-mmap``);
+set it to ``off`` to fall back to ``whisper.load_model``.
+"""
+
+import os
+import time
+from pathlib import Path
+from typing import Optional, Tuple
+
+DEFAULT_WEIGHT_CACHE = Path.home() / '.cache' / 'whisper-mmap'
+
+
+def weight_cache_dir() -> Optional[Path]:
+    configured = os.environ.get('WHISPER_WEIGHT_CACHE')
+    if configured == 'off':
+        return None
+    return Path(configured) if configured else DEFAULT_WEIGHT_CACHE
+
+
+def cached_weights_path(model_name: str, cache_dir: Path) -> Path:
+    return cache_dir / f"{model_name}.mmap.pt"
+
+
+def ensure_cached_weights(model_name: str, cache_dir: Path) -> Path:
+    """Convert ``model_name`` once (download included); a no-op when the cache file already exists."""
+    import torch
+    import whisper
+
+    target = cached_weights_path(model_name, cache_dir)
+    if target.exists():
+        return target
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    model = whisper.load_model(model_name, device='cpu')
+    staging = target.with_name(f".{target.name}.{os.getpid()}")
+    torch.save({'dims': vars(model.dims), 'model_state_dict': model.state_dict()}, staging)
+    staging.replace(target)  # atomic, so racing workers never see half a file
+    return target
+
+
+def load_whisper_mmap(model_name: str, cache_dir: Path, device: Optional[str] = None) -> Tuple[object, float]:
+    """Return ``(model, load_seconds)`` with weights mapped from the cache (converted on first use)."""
+    import torch
+    import whisper
+    from whisper.model import AudioEncoder, ModelDimensions, TextDecoder, Whisper
+
+    weights_path = ensure_cached_weights(model_name, cache_dir)
+    started = time.perf_counter()
+    checkpoint = torch.load(weights_path, mmap=True, weights_only=True, map_location='cpu')
+    dims = ModelDimensions(**checkpoint['dims'])
+    # Whisper.__init__ on the meta device, minus its sparse buffer (to_sparse has no meta kernel)
+    model = Whisper.__new__(Whisper)
+    torch.nn.Module.__init__(model)
+    model.dims = dims
+    with torch.device('meta'):
+        model.encoder = AudioEncoder(dims.n_mels, dims.n_audio_ctx, dims.n_audio_state,
+                                     dims.n_audio_head, dims.n_audio_layer)
+        model.decoder = TextDecoder(dims.n_vocab, dims.n_text_ctx, dims.n_text_state,
+                                    dims.n_text_head, dims.n_text_layer)
+    model.load_state_dict(checkpoint['model_state_dict'], assign=True)
+
+    # Non-persistent buffers are not in the state_dict: rebuild the causal mask and alignment_heads
+    causal_mask = torch.empty(dims.n_text_ctx, dims.n_text_ctx).fill_(-float('inf')).triu_(1)
+    model.decoder.register_buffer('mask', causal_mask, persistent=False)
+    alignment_heads = torch.zeros(dims.n_text_layer, dims.n_text_head, dtype=torch.bool)
+    alignment_heads[dims.n_text_layer // 2:] = True
+    model.register_buffer('alignment_heads', alignment_heads.to_sparse(), persistent=False)
+    if model_name in whisper._ALIGNMENT_HEADS:
+        model.set_alignment_heads(whisper._ALIGNMENT_HEADS[model_name])
+
+    device = device or ('cuda' if torch.cuda.is_available() else 'cpu')
+    if device != 'cpu':
+        model = model.to(device)
+    return model.eval(), time.perf_counter() - started
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Audio Analysis Benchmark Suite
+==============================
+
+Runs analyze-audio-languages.py over the bundled audio_samples fixtures (or a
+generated synthetic corpus) for every backend / model / worker combination and
+reports files/sec, real-time factor, per-stage latency percentiles, peak RSS and
+model load time. Results are written to JSON; pass a previous results file with
+--compare to fail on regressions beyond --regression-threshold.
+
+Each combination runs in its own process with the result cache disabled, so
+numbers are cold and comparable between runs. --feature-cache shares one
+log-mel feature cache across the sweep instead: the first combination decodes,
+every later one measures inference on memory-mapped features alone.
+
+Requirements:
+- the analyzer's own requirements (one Whisper backend, ffmpeg + ffprobe)
+
+Usage:
+python scripts/benchmark-audio-analysis.py --detect-only --models tiny,base --workers 1,4
+python scripts/benchmark-audio-analysis.py --synthetic 200 --synthetic-seconds 90 --detect-only
+python scripts/benchmark-audio-analysis.py --detect-only --compare benchmark_results.json --regression-threshold 0.1
+python scripts/benchmark-audio-analysis.py --detect-only --models tiny,base,small --feature-cache ./bench_features
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from audio_analysis.analysis_store import STORE_FILENAME, AnalysisStore
+from audio_analysis.backends import available_backends
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+ANALYZER_SCRIPT = SCRIPTS_DIR / 'analyze-audio-languages.py'
+DEFAULT_CORPUS = SCRIPTS_DIR.parent / 'audio_samples'
+
+# Cold model load, measured in a fresh interpreter so earlier runs cannot warm it
+MODEL_LOAD_PROBE = '''
+import sys, time
+from audio_analysis.backends import create_backend
+backend = create_backend(sys.argv[1])
+started = time.perf_counter()
+backend.load(sys.argv[2])
+print(time.perf_counter() - started)
+'''
+
+
+def generate_synthetic_corpus(output_dir: Path, count: int, seconds: float) -> Path:
+    """Write `count` MP3s named like real job audio ({job}_{lang}_full.mp3), cycling en/es/hi."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    languages = ('en', 'es', 'hi')
+    for i in range(count):
+        job_id = uuid.uuid5(uuid.NAMESPACE_URL, f"benchmark-{i}")
+        target = output_dir / f"{job_id}_{languages[i % 3]}_full.mp3"
+        if target.exists():
+            continue
+        tone = 180 + (i * 37) % 420
+        subprocess.run([
+            'ffmpeg', '-nostdin', '-loglevel', 'error', '-y',
+            '-f', 'lavfi', '-i', f"sine=frequency={tone}:duration={seconds}",
+            '-f', 'lavfi', '-i', f"anoisesrc=color=pink:amplitude=0.05:duration={seconds}:seed={i}",
+            '-filter_complex', 'amix=inputs=2:duration=shortest',
+            '-ac', '1', '-ar', '24000', '-b:a', '64k', str(target)
+        ], check=True)
+    print(f"Synthetic corpus: {count} files of {seconds}s in {output_dir}")
+    return output_dir
+
+
+def measure_model_load(backend: str, model: str) -> Optional[float]:
+    result = subprocess.run([sys.executable, '-c', MODEL_LOAD_PROBE, backend, model],
+                            cwd=SCRIPTS_DIR, capture_output=True, text=True)
+    if result.returncode != 0:
+        print(f"  model load probe failed: {result.stderr.strip().splitlines()[-1:]}")
+        return None
+    return round(float(result.stdout.strip().splitlines()[-1]), 3)
+
+
+def run_combination(corpus: Path, backend: str, model: str, workers: int, args) -> Dict:
+    """Run the analyzer once in a child process and collect its throughput, latencies and peak RSS."""
+    with tempfile.TemporaryDirectory(prefix='audio-bench-') as output_dir:
+        command = [
+            sys.executable, str(ANALYZER_SCRIPT),
+            '--input-dir', str(corpus), '--output-dir', output_dir,
+            '--whisper-model', model, '--backend', backend, '--workers', str(workers), '--no-cache', '--quiet'
+        ]
+        if args.detect_only:
+            command += ['--detect-only', '--detect-windows', str(args.detect_windows)]
+        command += ['--feature-cache', args.feature_cache] if args.feature_cache else ['--no-feature-cache']
+
+        started = time.perf_counter()
+        process = subprocess.Popen(command, cwd=output_dir, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        # wait4 gives this child's own rusage: ru_maxrss is the largest process in its tree (KiB on Linux)
+        _, status, usage = os.wait4(process.pid, 0)
+        wall_seconds = time.perf_counter() - started
+        stderr_tail = process.stderr.read().decode(errors='replace').strip().splitlines()[-3:]
+        process.stderr.close()
+
+        if os.waitstatus_to_exitcode(status) != 0:
+            return {'status': 'error', 'error': '\n'.join(stderr_tail)}
+
+        store = AnalysisStore(Path(output_dir) / STORE_FILENAME)
+        results = store.verdicts(columns=['duration', 'status'])
+        store.close()
+        with open(Path(output_dir) / 'pipeline_metrics.json') as f:
+            stages = json.load(f)['stages']
+
+    audio_seconds = float(results['duration'].fillna(0).sum())
+    peak_rss_kb = usage.ru_maxrss if platform.system() == 'Linux' else usage.ru_maxrss / 1024
+    return {
+        'status': 'success',
+        'files': len(results),
+        'failed_files': int((results['status'] != 'success').sum()),
+        'wall_seconds': round(wall_seconds, 3),
+        'files_per_second': round(len(results) / wall_seconds, 4),
+        'audio_seconds': round(audio_seconds, 2),
+        'real_time_factor': round(wall_seconds / audio_seconds, 5) if audio_seconds else None,
+        'peak_rss_mb': round(peak_rss_kb / 1024, 1),
+        'stages': stages
+    }
+
+
+def compare_with_baseline(current: Dict, baseline: Dict, threshold: float) -> List[str]:
+    """Regressions: throughput down, or peak RSS / model load up, by more than `threshold`."""
+    regressions = []
+    if baseline.get('corpus') != current['corpus']:
+        print(f"WARNING: baseline corpus {baseline.get('corpus')} differs from {current['corpus']}")
+    baseline_runs = {run['key']: run for run in baseline.get('runs', []) if run.get('status') == 'success'}
+    for run in current['runs']:
+        previous = baseline_runs.get(run['key'])
+        if run.get('status') != 'success' or previous is None:
+            continue
+        checks = [
+            ('files_per_second', -1),
+            ('peak_rss_mb', 1),
+            ('model_load_seconds', 1),
+        ]
+        for metric, worse_direction in checks:
+            before, after = previous.get(metric), run.get(metric)
+            if not before or after is None:
+                continue
+            change = (after - before) / before
+            if change * worse_direction > threshold:
+                regressions.append(f"{run['key']}: {metric} {before} -> {after} ({change:+.1%})")
+    return regressions
+
+
+def print_table(runs: List[Dict]):
+    print(f"\n{'combination':<42} {'files/s':>9} {'RTF':>9} {'infer p95':>10} {'peak RSS':>9} {'load s':>7}")
+    for run in runs:
+        if run.get('status') != 'success':
+            print(f"{run['key']:<42} ERROR: {run.get('error', '')}")
+            continue
+        inference = run['stages'].get('inference', {})
+        print(f"{run['key']:<42} {run['files_per_second']:>9.3f} {run['real_time_factor'] or 0:>9.4f} "
+              f"{inference.get('p95_ms', 0):>8.0f}ms {run['peak_rss_mb']:>7.0f}MB "
+              f"{run['model_load_seconds'] if run['model_load_seconds'] is not None else '-':>7}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark analyze-audio-languages.py across backends, models and workers')
+    parser.add_argument('--input-dir', default=str(DEFAULT_CORPUS), help='Corpus directory (default: website/audio_samples)')
+    parser.add_argument('--synthetic', type=int, default=0, help='Generate and use a synthetic corpus of this many files')
+    parser.add_argument('--synthetic-seconds', type=float, default=60.0, help='Length of each synthetic file')
+    parser.add_argument('--synthetic-dir', default=None, help='Where to keep the synthetic corpus (default: a temp dir)')
+    parser.add_argument('--backends', default='auto', help='Comma-separated backends (default: auto)')
+    parser.add_argument('--models', default='base', help='Comma-separated Whisper model sizes (default: base)')
+    parser.add_argument('--workers', default='1', help='Comma-separated worker counts (default: 1)')
+    parser.add_argument('--detect-only', action='store_true', help='Benchmark language detection instead of transcription')
+    parser.add_argument('--detect-windows', type=int, default=1, help='Windows per file in detect-only mode')
+    parser.add_argument('--feature-cache', default=None,
+                        help='Share this log-mel feature cache across combinations (default: every run decodes cold)')
+    parser.add_argument('--output', default='benchmark_results.json', help='Where to write results JSON')
+    parser.add_argument('--compare', default=None, help='Previous results JSON to compare against')
+    parser.add_argument('--regression-threshold', type=float, default=0.10,
+                        help='Relative change that counts as a regression (default: 0.10)')
+
+    args = parser.parse_args()
+
+    installed = available_backends()
+    if not installed:
+        print("ERROR: no Whisper backend installed")
+        sys.exit(1)
+    backends = [installed[0] if name == 'auto' else name for name in args.backends.split(',')]
+    models = args.models.split(',')
+    worker_counts = [int(count) for count in args.workers.split(',')]
+
+    corpus = Path(args.input_dir)
+    scratch = None
+    if args.synthetic:
+        if args.synthetic_dir:
+            corpus = Path(args.synthetic_dir)
+        else:
+            scratch = tempfile.TemporaryDirectory(prefix='audio-bench-corpus-')
+            corpus = Path(scratch.name)
+        generate_synthetic_corpus(corpus, args.synthetic, args.synthetic_seconds)
+
+    mode = 'detect' if args.detect_only else 'transcribe'
+    runs = []
+    load_times = {}
+    for backend in backends:
+        for model in models:
+            load_times[(backend, model)] = measure_model_load(backend, model)
+            for workers in worker_counts:
+                key = f"{backend}|{model}|workers={workers}|{mode}" + ('|features' if args.feature_cache else '')
+                print(f"Running {key} ...")
+                run = {'key': key, 'backend': backend, 'model': model, 'workers': workers, 'mode': mode,
+                       'model_load_seconds': load_times[(backend, model)]}
+                run.update(run_combination(corpus, backend, model, workers, args))
+                runs.append(run)
+
+    report = {
+        'generated_at': datetime.now().isoformat(),
+        'corpus': str(corpus) if not args.synthetic else f"synthetic:{args.synthetic}x{args.synthetic_seconds}s",
+        'host': {'platform': platform.platform(), 'python': platform.python_version(), 'cpus': os.cpu_count()},
+        'regression_threshold': args.regression_threshold,
+        'runs': runs
+    }
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print_table(runs)
+    print(f"\nResults written to {args.output}")
+
+    if scratch is not None:
+        scratch.cleanup()
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare_with_baseline(report, baseline, args.regression_threshold)
+        if regressions:
+            print(f"\nREGRESSIONS vs {args.compare}:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print(f"\nNo regressions vs {args.compare} (threshold {args.regression_threshold:.0%})")
+
+
+if __name__ == '__main__':
+    main()
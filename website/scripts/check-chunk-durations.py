@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Chunk Duration Consistency Check
+================================
+
+Compares, for every (job, language), the duration of the full narration with
+the summed durations of its TTS chunks - without decoding any audio. Durations
+come from MP3 headers only (audio_analysis/mp3.py): the Xing/VBRI frame count
+when the encoder wrote one, otherwise file size over the CBR bitrate. Remote
+files cost one small HTTP Range request each, so thousands of jobs are checked
+in seconds.
+
+A job is flagged when the totals differ by more than --tolerance seconds, when
+a chunk or the full file is empty or truncated, or when the full file is missing.
+
+Only an audio_jobs export lists every chunk (``chunk_audio_urls``). A local
+directory holds whatever was downloaded - download-audio-samples.py keeps just
+``chunk_0`` - so with --input-dir a full file that runs longer than its chunks
+is reported as ``chunks_incomplete`` rather than flagged as a mismatch. Chunks
+that add up to *more* than the full file are still a mismatch.
+
+Requirements:
+- requests (for --audio-jobs)
+- pandas
+
+Usage:
+python scripts/check-chunk-durations.py --audio-jobs ./backups/20250908_194218_api/audio_jobs.json --output chunk_durations.csv
+python scripts/check-chunk-durations.py --input-dir ./audio_samples --tolerance 1.0  # complete chunk sets only
+"""
+
+import argparse
+import json
+import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import pandas as pd
+import requests
+
+from audio_analysis.mp3 import probe_mp3_file
+from audio_analysis.planning import parse_sample_name
+from audio_analysis.remote import probe_remote_mp3, storage_headers
+
+DEFAULT_TOLERANCE = 0.5  # seconds; encoder delay and padding add a few frames per chunk
+
+
+def remote_groups(jobs_file: str) -> Dict[Tuple[str, str], Dict]:
+    """``{(job_id, lang): {'full': url, 'chunks': [url, ...], 'chunks_complete': True}}`` from an audio_jobs export."""
+    with open(jobs_file, 'r') as f:
+        jobs = json.load(f)
+
+    groups = {}
+    for job in jobs:
+        job_id = job.get('id', 'unknown')
+        statuses = job.get('language_statuses') or {}
+        languages = set(job.get('audio_urls') or {}) | set(statuses)
+        for lang in sorted(languages):
+            full_url = (job.get('audio_urls') or {}).get(lang)
+            chunk_urls = [url for url in ((statuses.get(lang) or {}).get('chunk_audio_urls') or []) if url]
+            if full_url or chunk_urls:
+                groups[(job_id, lang)] = {'full': full_url, 'chunks': chunk_urls, 'chunks_complete': True}
+    return groups
+
+
+def local_groups(input_dir: str) -> Dict[Tuple[str, str], Dict]:
+    """The same grouping for ``{job_id}_{lang}_{full|chunk_N}.mp3`` files on disk; nothing says the chunks are all there."""
+    groups = defaultdict(lambda: {'full': None, 'chunks': {}})
+    for path in sorted(Path(input_dir).rglob('*.mp3')):
+        sample = parse_sample_name(path.name)
+        if sample is None:
+            continue
+        group = groups[(sample['job_id'], sample['lang'])]
+        if sample['is_full']:
+            group['full'] = path
+        else:
+            group['chunks'][sample['chunk_index']] = path
+    return {key: {'full': group['full'], 'chunks': [group['chunks'][index] for index in sorted(group['chunks'])],
+                  'chunks_complete': False}
+            for key, group in groups.items()}
+
+
+def probe_all(sources: List, concurrency: int) -> Dict[str, Dict]:
+    """Probe every URL or path once, in parallel; failures become status 'error'."""
+    session = requests.Session()
+    session.mount('https://', requests.adapters.HTTPAdapter(pool_maxsize=concurrency))
+    headers = storage_headers()
+
+    def probe(source) -> Dict:
+        try:
+            if isinstance(source, Path):
+                return probe_mp3_file(source)
+            return probe_remote_mp3(source, session, headers)
+        except Exception as e:
+            return {'status': 'error', 'duration': None, 'error': str(e)}
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        return dict(zip(map(str, sources), pool.map(probe, sources)))
+
+
+def compare_group(job_id: str, lang: str, group: Dict, probes: Dict[str, Dict], tolerance: float) -> Dict:
+    full_probe = probes.get(str(group['full'])) if group['full'] else None
+    chunk_probes = [probes[str(chunk)] for chunk in group['chunks']]
+    full_duration = full_probe.get('duration') if full_probe else None
+    chunks_duration = sum(probe.get('duration') or 0.0 for probe in chunk_probes) if chunk_probes else None
+
+    if full_probe is None:
+        status = 'missing_full'
+    elif full_probe['status'] != 'ok':
+        status = 'broken_full'
+    elif any(probe['status'] != 'ok' for probe in chunk_probes):
+        status = 'broken_chunk'
+    elif chunks_duration is not None and abs(full_duration - chunks_duration) > tolerance:
+        # Short chunks only prove a mismatch when we know every chunk is here
+        missing_chunks_possible = not group.get('chunks_complete', True) and full_duration > chunks_duration
+        status = 'chunks_incomplete' if missing_chunks_possible else 'mismatch'
+    else:
+        status = 'ok'
+
+    difference = (round(full_duration - chunks_duration, 3)
+                  if full_duration is not None and chunks_duration is not None else None)
+    return {
+        'job_id': job_id,
+        'lang': lang,
+        'full_duration': full_duration,
+        'chunk_count': len(chunk_probes),
+        'chunks_duration': round(chunks_duration, 3) if chunks_duration is not None else None,
+        'difference_seconds': difference,
+        'broken_chunks': ','.join(str(index) for index, probe in enumerate(chunk_probes) if probe['status'] != 'ok'),
+        'status': status
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare full-narration and chunk durations from MP3 headers')
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--audio-jobs', help='audio_jobs.json export; files are probed with HTTP Range requests')
+    source.add_argument('--input-dir', help='Directory of {job_id}_{lang}_{full|chunk_N}.mp3 files')
+    parser.add_argument('--output', default='chunk_durations.csv', help='CSV report (default: chunk_durations.csv)')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help=f'Allowed full-vs-chunks difference in seconds (default: {DEFAULT_TOLERANCE})')
+    parser.add_argument('--concurrency', type=int, default=32, help='Parallel probes (default: 32)')
+    args = parser.parse_args()
+
+    groups = remote_groups(args.audio_jobs) if args.audio_jobs else local_groups(args.input_dir)
+    if not groups:
+        print("No (job, language) audio found")
+        sys.exit(1)
+
+    sources = [source for group in groups.values()
+               for source in ([group['full']] if group['full'] else []) + group['chunks']]
+    print(f"Probing {len(sources)} files for {len(groups)} (job, language) pairs...")
+    probes = probe_all(sources, max(1, args.concurrency))
+
+    report = pd.DataFrame([compare_group(job_id, lang, group, probes, args.tolerance)
+                           for (job_id, lang), group in sorted(groups.items())])
+    report.to_csv(args.output, index=False)
+
+    print(f"\nReport written to {args.output}")
+    for status, count in report['status'].value_counts().items():
+        print(f"  {status}: {count}")
+    flagged = report[~report['status'].isin(['ok', 'chunks_incomplete'])]
+    if not flagged.empty:
+        print("\nFlagged:")
+        for _, row in flagged.head(20).iterrows():
+            full = f"{row['full_duration']}s" if pd.notna(row['full_duration']) else 'none'
+            chunks = f"{row['chunks_duration']}s" if pd.notna(row['chunks_duration']) else 'none'
+            print(f"  {row['job_id']} [{row['lang']}] {row['status']}: full {full}, {row['chunk_count']} chunks {chunks}")
+        if len(flagged) > 20:
+            print(f"  ... and {len(flagged) - 20} more")
+    if (report['status'] == 'chunks_incomplete').any():
+        print("\nchunks_incomplete: the directory may not hold every chunk; use --audio-jobs for a full comparison")
+
+
+if __name__ == "__main__":
+    main()
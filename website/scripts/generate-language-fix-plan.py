@@ -6,11 +6,38 @@ Language Fix Plan Generator
 This script analyzes the audio language analysis results and generates
 a comprehensive plan for fixing incorrect translations.
 
+Verdicts are queried from the analysis store (analysis.sqlite) without reading
+any transcript; analyses from before the store fall back to detailed_analysis.csv.
+The plan is also recorded in the store, where apply-language-fixes.py --store
+picks it up.
+
+Issue types, priorities, actions and time estimates come from a declarative
+rule table (audio_analysis/fix_rules.json, or --rules) evaluated as vectorized
+masks, so a million-row analysis is classified in well under a second.
+
+With --incremental, each fix is keyed by (job_id, lang, issue_type) and compared
+with the previous plan in --output-dir and the fix_results.json of the last
+application. fix_plan_delta.csv/json then lists only new and changed items,
+unchanged items whose last application did not succeed (retry), and resolved
+items; apply-language-fixes.py --delta applies just those.
+
+Charts are drawn from a few aggregated counts. The default is a Vega-Lite spec
+(language_analysis_charts.vl.json), written without importing matplotlib;
+--charts svg/png render the 2x2 figure with matplotlib's Agg backend, imported
+only then. A format whose aggregates have not changed since the last run is not
+rendered again, and --no-charts skips charting altogether.
+
 Usage:
 python scripts/generate-language-fix-plan.py --analysis-dir ./analysis --output-dir ./fix-plan
+python scripts/generate-language-fix-plan.py --analysis-dir ./analysis --output-dir ./fix-plan --run 3
+python scripts/generate-language-fix-plan.py --analysis-dir ./analysis --output-dir ./fix-plan --rules ./my_fix_rules.json
+python scripts/generate-language-fix-plan.py --analysis-dir ./analysis --output-dir ./fix-plan --incremental
+python scripts/generate-language-fix-plan.py --analysis-dir ./analysis --output-dir ./fix-plan --charts vega png
+python scripts/generate-language-fix-plan.py --analysis-dir ./analysis --output-dir ./fix-plan --no-charts
 """
 
 import argparse
+import hashlib
 import json
 import logging
 import os
@@ -19,9 +46,12 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
 
-import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
-import seaborn as sns
+
+from audio_analysis.analysis_store import STORE_FILENAME, VERDICT_COLUMNS, AnalysisStore
+from audio_analysis.fix_rules import RULES_PATH, FixRuleTable
+from audio_analysis.planning import parse_sample_name
 
 # Configure logging
 logging.basicConfig(
@@ -30,173 +60,260 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+FIX_KEY = ['job_id', 'lang', 'issue_type']
+COMPARED_FIELDS = ['claimed_language', 'detected_language', 'priority', 'action']
+DELTA_CHANGES = ['new', 'changed', 'retry', 'resolved']
+CHART_FILES = {
+    'vega': 'language_analysis_charts.vl.json',
+    'svg': 'language_analysis_charts.svg',
+    'png': 'language_analysis_charts.png'
+}
+CHART_DIGEST_FILENAME = 'language_analysis_charts.digest.json'
+
+
+def vega_lite_spec(aggregates: Dict) -> Dict:
+    """The four charts as one Vega-Lite spec with the aggregated counts inline"""
+    return {
+        '$schema': 'https://vega.github.io/schema/vega-lite/v5.json',
+        'title': 'Audio Language Analysis Report',
+        'vconcat': [
+            {'hconcat': [
+                {
+                    'title': 'Language Distribution',
+                    'data': {'values': aggregates['language_distribution']},
+                    'mark': 'bar',
+                    'encoding': {
+                        'x': {'field': 'claimed_language', 'type': 'nominal', 'title': 'Claimed Language'},
+                        'xOffset': {'field': 'detected_language'},
+                        'y': {'field': 'count', 'type': 'quantitative', 'title': 'Count'},
+                        'color': {'field': 'detected_language', 'type': 'nominal', 'title': 'Detected Language'}
+                    }
+                },
+                {
+                    'title': 'Language Match Status',
+                    'data': {'values': aggregates['match_status']},
+                    'mark': 'arc',
+                    'encoding': {
+                        'theta': {'field': 'count', 'type': 'quantitative'},
+                        'color': {'field': 'languages_match', 'type': 'nominal', 'title': 'Languages Match'}
+                    }
+                }
+            ]},
+            {'hconcat': [
+                {
+                    'title': 'Transcription Confidence Distribution',
+                    'data': {'values': aggregates['confidence_histogram']},
+                    'mark': 'bar',
+                    'encoding': {
+                        'x': {'field': 'bin_start', 'type': 'quantitative', 'bin': {'binned': True},
+                              'title': 'Confidence Score'},
+                        'x2': {'field': 'bin_end'},
+                        'y': {'field': 'count', 'type': 'quantitative', 'title': 'Frequency'}
+                    }
+                },
+                {
+                    'title': 'Issue Types Distribution',
+                    'data': {'values': aggregates['issue_types']},
+                    'mark': 'bar',
+                    'encoding': {
+                        'x': {'field': 'issue_type', 'type': 'nominal', 'sort': None, 'title': None},
+                        'y': {'field': 'count', 'type': 'quantitative', 'title': 'Count'}
+                    }
+                }
+            ]}
+        ]
+    }
+
 class LanguageFixPlanner:
-    def __init__(self, analysis_dir: str, output_dir: str):
+    def __init__(self, analysis_dir: str, output_dir: str, run_id: Optional[int] = None,
+                 rules_path: Optional[str] = None):
         self.analysis_dir = Path(analysis_dir)
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
+        store_path = self.analysis_dir / STORE_FILENAME
+        self.store = AnalysisStore(store_path) if store_path.exists() else None
+        self.run_id = run_id
+        self.total_files = 0
+        self.rules = FixRuleTable.load(rules_path or RULES_PATH)
+
     def load_analysis_data(self) -> pd.DataFrame:
-        """Load analysis results from CSV"""
-        analysis_file = self.analysis_dir / 'detailed_analysis.csv'
-        if not analysis_file.exists():
-            raise FileNotFoundError(f"Analysis file not found: {analysis_file}")
+        """Load verdicts from the analysis store (no transcripts), or from the CSV of an older analysis"""
+        if self.store is not None:
+            self.run_id = self.store.run(self.run_id)['run_id']
+            df = self.store.verdicts(self.run_id)
+            logger.info(f"Loaded {len(df)} verdicts of run {self.run_id} from {STORE_FILENAME}")
+        else:
+            analysis_file = self.analysis_dir / 'detailed_analysis.csv'
+            if not analysis_file.exists():
+                raise FileNotFoundError(f"Neither {STORE_FILENAME} nor detailed_analysis.csv found in {self.analysis_dir}")
+            df = pd.read_csv(analysis_file)
+            logger.info(f"Loaded {len(df)} records from analysis")
+
+        self.total_files = len(df)
+        return df
 
-        df = pd.read_csv(analysis_file)
-        logger.info(f"Loaded {len(df)} records from analysis")
+    def load_mismatches(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Candidate rows for the rule table's scope (the rules themselves apply the full scope)"""
+        if self.store is not None:
+            # Boolean scope conditions (languages_match) become an indexed lookup in the store
+            pushed_down = {column: condition['equals'] for column, condition in self.rules.scope.items()
+                           if column in VERDICT_COLUMNS and isinstance(condition.get('equals'), bool)}
+            return self.store.verdicts(self.run_id, **pushed_down)
         return df
 
     def categorize_issues(self, df: pd.DataFrame) -> Dict:
-        """Categorize different types of language issues"""
-
-        # Files with mismatched languages
-        mismatches = df[~df['languages_match'] & (df['status'] == 'success')]
+        """Categorize language issues with the rule table (vectorized, first matching rule wins)"""
 
-        # English files that are actually other languages
-        english_misclassified = mismatches[
-            (mismatches['claimed_language'].str.lower() == 'english') &
-            (mismatches['detected_language'].str.lower() != 'en') &
-            (mismatches['detected_language'] != 'unknown')
-        ]
+        classified = self.rules.classify(self.load_mismatches(df))
+        issue_counts = classified['issue_type'].value_counts(sort=False)
 
-        # Non-English files that are actually English
-        non_english_as_english = mismatches[
-            (mismatches['claimed_language'].str.lower() != 'english') &
-            (mismatches['detected_language'].str.lower() == 'en')
-        ]
+        return {
+            'total_mismatches': len(classified),
+            'issue_counts': {issue_type: int(issue_counts[issue_type]) for issue_type in self.rules.issue_types},
+            'classified': classified
+        }
 
-        # Other mismatches
-        other_mismatches = mismatches[
-            ~mismatches.index.isin(english_misclassified.index) &
-            ~mismatches.index.isin(non_english_as_english.index)
-        ]
+    def generate_priority_matrix(self, issues: Dict) -> pd.DataFrame:
+        """Generate priority matrix for fixing issues, grouped by rule in table order"""
+
+        columns = ['file_path', 'job_id', 'lang', 'issue_type', 'claimed_language', 'detected_language',
+                   'confidence', 'priority', 'action', 'estimated_cost', 'business_impact']
+        classified = issues['classified']
+        for column in ('job_id', 'lang'):
+            if column not in classified:
+                classified[column] = None  # CSV analyses from before the store
+        return classified[columns]
+
+    def chart_aggregates(self, df: pd.DataFrame, issues: Dict) -> Dict:
+        """The counts every chart is drawn from"""
+        languages = df.groupby(['claimed_language', 'detected_language']).size()
+        confidence = pd.to_numeric(df['confidence'], errors='coerce').dropna()
+        histogram, edges = np.histogram(confidence, bins=20) if len(confidence) else ([], [])
 
         return {
-            'total_mismatches': len(mismatches),
-            'english_misclassified': len(english_misclassified),
-            'non_english_as_english': len(non_english_as_english),
-            'other_mismatches': len(other_mismatches),
-            'english_misclassified_files': english_misclassified,
-            'non_english_as_english_files': non_english_as_english,
-            'other_mismatch_files': other_mismatches
+            'language_distribution': [
+                {'claimed_language': str(claimed), 'detected_language': str(detected), 'count': int(count)}
+                for (claimed, detected), count in languages.items()
+            ],
+            'match_status': [{'languages_match': bool(match), 'count': int(count)}
+                             for match, count in df['languages_match'].value_counts().items()],
+            'confidence_histogram': [
+                {'bin_start': round(float(start), 6), 'bin_end': round(float(end), 6), 'count': int(count)}
+                for start, end, count in zip(edges[:-1], edges[1:], histogram)
+            ],
+            'issue_types': [{'issue_type': issue_type, 'count': count}
+                            for issue_type, count in issues['issue_counts'].items()]
         }
 
-    def generate_priority_matrix(self, issues: Dict) -> pd.DataFrame:
-        """Generate priority matrix for fixing issues"""
-
-        priority_data = []
-
-        # High priority: English files that are actually other languages
-        for _, row in issues['english_misclassified_files'].iterrows():
-            priority_data.append({
-                'file_path': row['file_path'],
-                'issue_type': 'English misclassified',
-                'claimed_language': row['claimed_language'],
-                'detected_language': row['detected_language'],
-                'confidence': row['confidence'],
-                'priority': 'HIGH',
-                'action': 'Regenerate audio in correct language',
-                'estimated_cost': 'High (full regeneration)',
-                'business_impact': 'High (wrong language for English content)'
-            })
-
-        # Medium priority: Non-English files that are actually English
-        for _, row in issues['non_english_as_english_files'].iterrows():
-            priority_data.append({
-                'file_path': row['file_path'],
-                'issue_type': 'Non-English as English',
-                'claimed_language': row['claimed_language'],
-                'detected_language': row['detected_language'],
-                'confidence': row['confidence'],
-                'priority': 'MEDIUM',
-                'action': 'Update metadata only (content is English)',
-                'estimated_cost': 'Low (metadata update)',
-                'business_impact': 'Medium (metadata inconsistency)'
-            })
-
-        # Low priority: Other mismatches
-        for _, row in issues['other_mismatch_files'].iterrows():
-            priority_data.append({
-                'file_path': row['file_path'],
-                'issue_type': 'Other mismatch',
-                'claimed_language': row['claimed_language'],
-                'detected_language': row['detected_language'],
-                'confidence': row['confidence'],
-                'priority': 'LOW',
-                'action': 'Review and decide',
-                'estimated_cost': 'Medium',
-                'business_impact': 'Low'
-            })
-
-        return pd.DataFrame(priority_data)
-
-    def create_visualizations(self, df: pd.DataFrame, issues: Dict):
-        """Create charts and visualizations"""
+    def create_visualizations(self, df: pd.DataFrame, issues: Dict, formats: Optional[List[str]] = None):
+        """Create charts, skipping every format whose aggregates are unchanged since the last run"""
+
+        formats = formats or ['vega']
+        aggregates = self.chart_aggregates(df, issues)
+        digest = hashlib.sha256(json.dumps(aggregates, sort_keys=True).encode()).hexdigest()
+
+        digest_file = self.output_dir / CHART_DIGEST_FILENAME
+        rendered = json.loads(digest_file.read_text()) if digest_file.exists() else {}
+        stale = [chart_format for chart_format in formats
+                 if rendered.get(chart_format) != digest or not (self.output_dir / CHART_FILES[chart_format]).exists()]
+        if not stale:
+            logger.info("Chart aggregates unchanged; keeping existing charts")
+            return
+
+        if 'vega' in stale:
+            with open(self.output_dir / CHART_FILES['vega'], 'w') as f:
+                json.dump(vega_lite_spec(aggregates), f, indent=2)
+        images = [chart_format for chart_format in stale if chart_format != 'vega']
+        if images:
+            self.render_images(aggregates, images)
+
+        rendered.update({chart_format: digest for chart_format in stale})
+        digest_file.write_text(json.dumps(rendered, indent=2))
+        logger.info(f"Visualizations saved to {', '.join(CHART_FILES[chart_format] for chart_format in stale)}")
+
+    def render_images(self, aggregates: Dict, formats: List[str]):
+        """Draw the 2x2 figure with matplotlib (Agg, imported only here) and save it once per format"""
+        import matplotlib
+        matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+        try:
+            import seaborn as sns
+            sns.set_palette("husl")
+        except ImportError:
+            pass
 
         # Set style
         plt.style.use('default')
-        sns.set_palette("husl")
 
         # Create figure with subplots
         fig, axes = plt.subplots(2, 2, figsize=(15, 12))
         fig.suptitle('Audio Language Analysis Report', fontsize=16, fontweight='bold')
 
         # 1. Language distribution
-        language_counts = df.groupby(['claimed_language', 'detected_language']).size().unstack(fill_value=0)
-        language_counts.plot(kind='bar', ax=axes[0,0])
+        language_counts = pd.DataFrame(aggregates['language_distribution'],
+                                       columns=['claimed_language', 'detected_language', 'count'])
+        if not language_counts.empty:
+            language_counts.pivot_table(index='claimed_language', columns='detected_language', values='count',
+                                        aggfunc='sum', fill_value=0).plot(kind='bar', ax=axes[0,0])
         axes[0,0].set_title('Language Distribution')
         axes[0,0].set_xlabel('Claimed Language')
         axes[0,0].set_ylabel('Count')
         axes[0,0].tick_params(axis='x', rotation=45)
 
         # 2. Match vs Mismatch
-        match_status = df['languages_match'].value_counts()
-        match_status.plot(kind='pie', ax=axes[0,1], autopct='%1.1f%%')
+        match_status = pd.Series({status['languages_match']: status['count'] for status in aggregates['match_status']},
+                                 name='count')
+        if not match_status.empty:
+            match_status.plot(kind='pie', ax=axes[0,1], autopct='%1.1f%%')
         axes[0,1].set_title('Language Match Status')
 
         # 3. Confidence distribution
-        df['confidence'].hist(ax=axes[1,0], bins=20)
+        bins = aggregates['confidence_histogram']  # bars over the pre-computed bins, as df.hist(bins=20) drew them
+        axes[1,0].bar([chart_bin['bin_start'] for chart_bin in bins], [chart_bin['count'] for chart_bin in bins],
+                      width=[chart_bin['bin_end'] - chart_bin['bin_start'] for chart_bin in bins], align='edge')
         axes[1,0].set_title('Transcription Confidence Distribution')
         axes[1,0].set_xlabel('Confidence Score')
         axes[1,0].set_ylabel('Frequency')
 
         # 4. Issue types
-        issue_types = [
-            issues['english_misclassified'],
-            issues['non_english_as_english'],
-            issues['other_mismatches']
-        ]
-        issue_labels = ['English Misclassified', 'Non-English as English', 'Other Mismatches']
-        axes[1,1].bar(issue_labels, issue_types)
+        axes[1,1].bar([issue['issue_type'] for issue in aggregates['issue_types']],
+                      [issue['count'] for issue in aggregates['issue_types']])
         axes[1,1].set_title('Issue Types Distribution')
         axes[1,1].set_ylabel('Count')
         axes[1,1].tick_params(axis='x', rotation=45)
 
         plt.tight_layout()
-        plt.savefig(self.output_dir / 'language_analysis_charts.png', dpi=300, bbox_inches='tight')
-        plt.close()
-
-        logger.info("Visualizations saved to language_analysis_charts.png")
+        for chart_format in formats:
+            plt.savefig(self.output_dir / CHART_FILES[chart_format], bbox_inches='tight',
+                        **({'dpi': 300} if chart_format == 'png' else {}))
+        plt.close(fig)
 
     def generate_fix_plan(self, priority_matrix: pd.DataFrame, issues: Dict) -> Dict:
         """Generate comprehensive fix plan"""
 
         # Calculate totals
         total_issues = issues['total_mismatches']
-        high_priority = len(priority_matrix[priority_matrix['priority'] == 'HIGH'])
-        medium_priority = len(priority_matrix[priority_matrix['priority'] == 'MEDIUM'])
-        low_priority = len(priority_matrix[priority_matrix['priority'] == 'LOW'])
-
-        # Estimate costs and time
-        high_cost_estimate = high_priority * 2  # 2 hours per high priority item
-        medium_cost_estimate = medium_priority * 0.5  # 30 minutes per medium priority item
-        low_cost_estimate = low_priority * 1  # 1 hour per low priority item
-
-        total_time_estimate = high_cost_estimate + medium_cost_estimate + low_cost_estimate
+        priority_counts = priority_matrix['priority'].value_counts()
+        high_priority = int(priority_counts.get('HIGH', 0))
+        medium_priority = int(priority_counts.get('MEDIUM', 0))
+        low_priority = int(priority_counts.get('LOW', 0))
+
+        # Estimate costs and time from each rule's hours per item
+        priority_hours = {'HIGH': 0, 'MEDIUM': 0, 'LOW': 0}
+        for rule in self.rules.rules:
+            priority_hours[rule['priority']] = (priority_hours.get(rule['priority'], 0) +
+                                                issues['issue_counts'][rule['issue_type']] * rule.get('hours', 0))
+        high_cost_estimate = priority_hours['HIGH']
+        medium_cost_estimate = priority_hours['MEDIUM']
+        low_cost_estimate = priority_hours['LOW']
+
+        total_time_estimate = sum(priority_hours.values())
 
         plan = {
             'summary': {
-                'total_files_analyzed': len(pd.read_csv(self.analysis_dir / 'detailed_analysis.csv')),
+                'total_files_analyzed': self.total_files,
+                'run_id': self.run_id,
                 'total_issues_found': total_issues,
                 'high_priority_issues': high_priority,
                 'medium_priority_issues': medium_priority,
@@ -257,13 +374,117 @@ class LanguageFixPlanner:
 
         return plan
 
-    def save_plan(self, priority_matrix: pd.DataFrame, plan: Dict):
-        """Save the complete fix plan"""
+    @staticmethod
+    def with_fix_keys(matrix: pd.DataFrame) -> pd.DataFrame:
+        """Fill in job_id/lang from the file name where a plan (from before the store) has none"""
+        matrix = matrix.copy()
+        names = [parse_sample_name(Path(str(file_path)).name) or {} for file_path in matrix['file_path']]
+        for column in ('job_id', 'lang'):
+            if column not in matrix:
+                matrix[column] = None
+            fallback = [name.get(column) or (str(file_path) if column == 'job_id' else '')
+                        for name, file_path in zip(names, matrix['file_path'])]
+            matrix[column] = matrix[column].astype(object).where(matrix[column].notna(), fallback)
+        matrix['is_full'] = [name.get('is_full', True) for name in names]
+        return matrix
+
+    def keyed_items(self, matrix: pd.DataFrame) -> pd.DataFrame:
+        """One item per (job_id, lang, issue_type), preferring the full narration over its chunks"""
+        matrix = self.with_fix_keys(matrix).sort_values('is_full', ascending=False, kind='stable')
+        matrix[FIX_KEY] = matrix[FIX_KEY].astype(object)
+        return matrix.drop_duplicates(FIX_KEY).drop(columns='is_full').set_index(FIX_KEY)
+
+    def load_previous_plan(self) -> Optional[pd.DataFrame]:
+        """The last plan in the output directory, keyed, with the outcome of the last application folded in"""
+        previous_file = self.output_dir / 'priority_fix_matrix.csv'
+        if not previous_file.exists():
+            return None
+
+        previous = pd.read_csv(previous_file, dtype={'job_id': object, 'lang': object, 'fix_status': object})
+        if 'fix_status' not in previous:
+            previous['fix_status'] = None
+        previous_items = self.keyed_items(previous)
+
+        results_file = self.output_dir / 'fix_results.json'
+        if results_file.exists():
+            with open(results_file) as f:
+                applied = json.load(f).get('fixes_applied', [])
+            # Results name their key; older ones only their file, which the previous plan maps to a key
+            file_keys = {str(row.file_path): (row.job_id, row.lang, row.issue_type)
+                         for row in self.with_fix_keys(previous).itertuples(index=False)}
+            for result in applied:
+                key = (tuple(result[column] for column in FIX_KEY) if all(result.get(column) for column in FIX_KEY)
+                       else file_keys.get(str(result.get('file_path'))))
+                if key in previous_items.index and previous_items.at[key, 'fix_status'] != 'success':
+                    previous_items.at[key, 'fix_status'] = result.get('status')
+        return previous_items
+
+    def diff_against_previous(self, priority_matrix: pd.DataFrame):
+        """
+        Compare the new plan with the previous one and the last application.
+
+        Returns the plan to save (with each item's carried-over ``fix_status``)
+        and the delta: ``new`` and ``changed`` items, ``retry`` for unchanged
+        items whose last application did not succeed, and ``resolved`` items
+        that are no longer mismatched.
+        """
+        current = self.with_fix_keys(priority_matrix).drop(columns='is_full')
+        current_items = self.keyed_items(priority_matrix)
+        previous_items = self.load_previous_plan()
+        if previous_items is None:
+            previous_items = current_items.iloc[0:0].assign(fix_status=None)
+
+        shared = current_items.index.intersection(previous_items.index)
+        differs = pd.Series(False, index=shared)
+        for field in COMPARED_FIELDS:
+            differs |= (current_items.loc[shared, field].astype(object).fillna('').astype(str) !=
+                        previous_items.loc[shared, field].astype(object).fillna('').astype(str))
+        settled = previous_items.loc[shared, 'fix_status'] == 'success'
+
+        change = pd.Series('new', index=current_items.index, dtype=object)
+        change.loc[shared] = 'unchanged'
+        change.loc[shared[(~differs & ~settled).to_numpy()]] = 'retry'
+        change.loc[shared[differs.to_numpy()]] = 'changed'
+
+        # Carry the outcome of unchanged, applied items forward; everything else awaits application
+        fix_status = pd.Series(None, index=current_items.index, dtype=object)
+        fix_status.loc[shared] = previous_items.loc[shared, 'fix_status'].where(~differs, None)
+        current['fix_status'] = [fix_status.get(key) for key in
+                                 zip(current['job_id'], current['lang'], current['issue_type'].astype(object))]
+
+        previous_view = previous_items.reindex(current_items.index)
+        pending = current_items.assign(change=change,
+                                       previous_detected_language=previous_view['detected_language'],
+                                       previous_priority=previous_view['priority'],
+                                       previous_fix_status=previous_view['fix_status'])[change != 'unchanged']
+        resolved = previous_items.loc[previous_items.index.difference(current_items.index)]
+        resolved = resolved.assign(change='resolved', previous_detected_language=resolved['detected_language'],
+                                   previous_priority=resolved['priority'], previous_fix_status=resolved['fix_status'])
+        delta = pd.concat([pending, resolved]).drop(columns='fix_status', errors='ignore').reset_index()
+        delta = delta[['change', *[column for column in delta.columns if column != 'change']]]
+        delta['change'] = pd.Categorical(delta['change'], categories=DELTA_CHANGES)
+        delta = delta.sort_values('change', kind='stable')
+
+        counts = {change_type: int((delta['change'] == change_type).sum()) for change_type in DELTA_CHANGES}
+        counts['unchanged'] = int((change == 'unchanged').sum())
+        return current, delta, counts
+
+    def save_plan(self, priority_matrix: pd.DataFrame, plan: Dict, delta: Optional[pd.DataFrame] = None):
+        """Save the complete fix plan (and, for incremental plans, what changed since the previous one)"""
 
         # Save priority matrix
         priority_matrix.to_csv(self.output_dir / 'priority_fix_matrix.csv', index=False)
         priority_matrix.to_json(self.output_dir / 'priority_fix_matrix.json', orient='records', indent=2)
 
+        # Save the delta for apply-language-fixes.py --delta
+        if delta is not None:
+            delta.to_csv(self.output_dir / 'fix_plan_delta.csv', index=False)
+            delta.to_json(self.output_dir / 'fix_plan_delta.json', orient='records', indent=2)
+
+        # Record the plan next to the run's verdicts, for apply-language-fixes.py --store
+        if self.store is not None:
+            self.store.record_fix_plan(self.run_id, priority_matrix)
+
         # Save fix plan
         with open(self.output_dir / 'language_fix_plan.json', 'w') as f:
             json.dump(plan, f, indent=2)
@@ -282,6 +503,12 @@ class LanguageFixPlanner:
             f.write(f"- **Low priority:** {summary['low_priority_issues']}\n")
             f.write(f"- **Estimated time:** {summary['estimated_fix_time_hours']} hours\n\n")
 
+            if 'changes' in summary:
+                f.write("## Changes Since the Previous Plan\n\n")
+                for change_type, count in summary['changes'].items():
+                    f.write(f"- **{change_type.capitalize()}:** {count}\n")
+                f.write("\n")
+
             f.write("## Fix Phases\n\n")
             for phase in plan['phases']:
                 f.write(f"### {phase['phase']}\n\n")
@@ -309,14 +536,27 @@ def main():
     parser = argparse.ArgumentParser(description='Generate language fix plan from analysis results')
     parser.add_argument('--analysis-dir', required=True, help='Directory containing analysis results')
     parser.add_argument('--output-dir', required=True, help='Directory to save fix plan')
+    parser.add_argument('--run', type=int, default=None, help=f'Run id in {STORE_FILENAME} (default: latest)')
+    parser.add_argument('--rules', default=None, help='Fix rule table JSON (default: audio_analysis/fix_rules.json)')
+    charts = parser.add_mutually_exclusive_group()
+    charts.add_argument('--charts', nargs='+', choices=list(CHART_FILES), default=['vega'], metavar='FORMAT',
+                        help='Chart formats: vega (Vega-Lite JSON, no matplotlib), svg, png (default: vega)')
+    charts.add_argument('--no-charts', action='store_true', help='Skip charts entirely (e.g. headless cron runs)')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Diff against the previous plan and fix_results.json in --output-dir; '
+                             'write only new/changed/retry/resolved items to fix_plan_delta.csv/json')
 
     args = parser.parse_args()
 
     # Create planner
-    planner = LanguageFixPlanner(args.analysis_dir, args.output_dir)
+    planner = LanguageFixPlanner(args.analysis_dir, args.output_dir, args.run, args.rules)
 
     # Load data
-    df = planner.load_analysis_data()
+    try:
+        df = planner.load_analysis_data()
+    except (FileNotFoundError, LookupError) as e:
+        logger.error(str(e))
+        sys.exit(1)
 
     # Categorize issues
     issues = planner.categorize_issues(df)
@@ -325,22 +565,35 @@ def main():
     priority_matrix = planner.generate_priority_matrix(issues)
 
     # Create visualizations
-    planner.create_visualizations(df, issues)
+    if not args.no_charts:
+        planner.create_visualizations(df, issues, args.charts)
 
     # Generate fix plan
     plan = planner.generate_fix_plan(priority_matrix, issues)
 
+    # Diff against the previous plan before it is overwritten
+    delta = None
+    if args.incremental:
+        priority_matrix, delta, changes = planner.diff_against_previous(priority_matrix)
+        plan['summary']['changes'] = changes
+
     # Save everything
-    planner.save_plan(priority_matrix, plan)
+    planner.save_plan(priority_matrix, plan, delta)
 
     print("\n" + "="*60)
     print("LANGUAGE FIX PLAN GENERATED")
     print("="*60)
     print(f"Total issues found: {issues['total_mismatches']}")
-    print(f"High priority: {issues['english_misclassified']}")
-    print(f"Medium priority: {issues['non_english_as_english']}")
-    print(f"Low priority: {issues['other_mismatches']}")
+    print(f"High priority: {plan['summary']['high_priority_issues']}")
+    print(f"Medium priority: {plan['summary']['medium_priority_issues']}")
+    print(f"Low priority: {plan['summary']['low_priority_issues']}")
+    for issue_type, count in issues['issue_counts'].items():
+        print(f"  {issue_type}: {count}")
     print(f"Estimated time: {plan['summary']['estimated_fix_time_hours']} hours")
+    if delta is not None:
+        changes = plan['summary']['changes']
+        print(f"Since the previous plan: {changes['new']} new, {changes['changed']} changed, "
+              f"{changes['retry']} to retry, {changes['resolved']} resolved, {changes['unchanged']} unchanged")
     print(f"Results saved to: {args.output_dir}")
     print("="*60)
 
@@ -10,9 +10,15 @@ Requirements:
 - requests
 - pandas
 - python-dotenv
+- numpy (text language check)
+
+Before any text is sent to TTS, its language is checked with the bundled
+character n-gram identifier (audio_analysis/text_language.py); a "translation"
+that is still mostly English is not turned into Spanish or Hindi audio.
 
 Usage:
 python scripts/regenerate-affected-audio.py --job-id 19587fa4-1fbf-4e4e-adbb-8bd9772aab9e
+python scripts/regenerate-affected-audio.py --job-id 19587fa4-1fbf-4e4e-adbb-8bd9772aab9e --min-text-share 0.9
 """
 
 import os
@@ -25,10 +31,12 @@ import pandas as pd
 from typing import Dict, List, Optional
 from dotenv import load_dotenv
 
+from audio_analysis.text_language import default_identifier
+
 load_dotenv()
 
 class AudioRegenerator:
-    def __init__(self):
+    def __init__(self, min_text_share: float = 0.8, check_text: bool = True):
         self.supabase_url = os.getenv('SUPABASE_URL')
         self.supabase_key = os.getenv('SUPABASE_SERVICE_ROLE_KEY')
         self.headers = {
@@ -36,6 +44,8 @@ class AudioRegenerator:
             'Authorization': f'Bearer {self.supabase_key}',
             'Content-Type': 'application/json'
         }
+        self.min_text_share = min_text_share
+        self.check_text = check_text
 
         print("Audio Regenerator initialized")
 
@@ -99,6 +109,26 @@ class AudioRegenerator:
             print(f"Translation error: {e}")
             return text
 
+    def verify_text_language(self, text: str, language: str) -> bool:
+        """Check that most of the text (by sentence characters) is written in the target language"""
+        identifier = default_identifier()
+        if language not in identifier.languages:
+            print(f"⚠️ No text profile for {language.upper()}, skipping the language check")
+            return True
+
+        verdict = identifier.dominant_language(text)
+        share = sum(len(sentence) for sentence, detected in zip(verdict['sentences'], verdict['sentence_languages'])
+                    if detected == language) / max(1, sum(len(sentence) for sentence in verdict['sentences']))
+        print(f"🔤 Text language check: {share:.0%} {language.upper()} "
+              f"(mostly {verdict['language'].upper()}, {len(verdict['sentences'])} sentences)")
+        if share < self.min_text_share:
+            stray = [sentence for sentence, detected in zip(verdict['sentences'], verdict['sentence_languages'])
+                     if detected not in (language, 'unknown')]
+            for sentence in stray[:3]:
+                print(f"   not {language.upper()}: {sentence[:80]}")
+            return False
+        return True
+
     def regenerate_audio(self, job_id: str, language: str) -> bool:
         """Regenerate audio for a specific language"""
         print(f"\n🔄 Regenerating {language.upper()} audio for job {job_id}")
@@ -141,6 +171,11 @@ class AudioRegenerator:
             translated_text = original_text
             print(f"🇺🇸 Using original English text")
 
+        # Refuse to voice text that is not in the target language
+        if self.check_text and not self.verify_text_language(translated_text, language):
+            print(f"❌ Text for {language.upper()} is not in {language.upper()}; not sending it to TTS")
+            return False
+
         # Generate audio using the existing Supabase Edge Function
         print(f"🎵 Generating {language.upper()} audio using existing edge function...")
 
@@ -210,6 +245,10 @@ def main():
     parser.add_argument('--job-id', required=True, help='Audio job ID to regenerate')
     parser.add_argument('--languages', nargs='+', default=['es', 'hi'],
                        help='Languages to regenerate (default: es hi)')
+    parser.add_argument('--min-text-share', type=float, default=0.8,
+                       help='Share of the text that must be in the target language before TTS (default: 0.8)')
+    parser.add_argument('--skip-text-check', action='store_true',
+                       help='Send text to TTS without checking its language')
 
     args = parser.parse_args()
 
@@ -226,7 +265,7 @@ def main():
     print("=" * 50)
 
     # Create regenerator
-    regenerator = AudioRegenerator()
+    regenerator = AudioRegenerator(min_text_share=args.min_text_share, check_text=not args.skip_text_check)
 
     # Regenerate audio
     results = regenerator.regenerate_job_languages(args.job_id, args.languages)